@@ -21,3 +21,9 @@ def test_disconnect(dummy_connector):
 def test_is_connected(dummy_connector):
     result = dummy_connector.is_connected()
     assert result is True
+
+
+def test_dummy_connector_is_shared(dummy_connector):
+    other = DummyConnector(host="localhost", port=0)
+    assert other is dummy_connector
+    assert other.connect() is dummy_connector.connect()
@@ -8,6 +8,24 @@ def redis_connector():
     return RedisConnector(host="localhost", port=6379, db=0)
 
 
+@patch("volnux.backends.connectors.redis.Redis")
+def test_init_does_not_create_client(mock_redis):
+    connector = RedisConnector(host="localhost", port=6379, db=0)
+
+    mock_redis.assert_not_called()
+    assert connector.cursor is None
+    assert connector.is_connected() is False
+
+
+@patch("volnux.backends.connectors.redis.Redis")
+def test_connect_is_idempotent(mock_redis, redis_connector):
+    first = redis_connector.connect()
+    second = redis_connector.connect()
+
+    mock_redis.assert_called_once()
+    assert first is second
+
+
 @patch("volnux.backends.connectors.redis.Redis")
 def test_connect(mock_redis, redis_connector):
     mock_instance = MagicMock()
@@ -17,10 +35,22 @@ def test_connect(mock_redis, redis_connector):
 
     connection = redis_connector.connect()
 
-    mock_redis.assert_called_once_with(host="localhost", port=6379, db=0)
+    mock_redis.assert_called_once_with(
+        connection_pool=redis_connector.connection_pool
+    )
     assert connection == mock_instance
 
 
+def test_connection_pool_config(redis_connector):
+    pool_kwargs = redis_connector.connection_pool.connection_kwargs
+    assert pool_kwargs["host"] == "localhost"
+    assert pool_kwargs["port"] == 6379
+    assert pool_kwargs["db"] == 0
+    assert pool_kwargs["socket_keepalive"] is True
+    assert pool_kwargs["health_check_interval"] == 30
+    assert redis_connector.connection_pool.max_connections == 32
+
+
 @patch("volnux.backends.connectors.redis.Redis")
 def test_disconnect(mock_redis, redis_connector):
     mock_instance = MagicMock()
@@ -43,3 +73,20 @@ def test_is_connected(mock_redis, redis_connector):
 
     redis_connector._cursor = None
     assert redis_connector.is_connected() is False
+
+
+def test_batched(redis_connector):
+    mock_instance = MagicMock()
+    pipe = mock_instance.pipeline.return_value.__enter__.return_value
+    pipe.execute.return_value = [b"1", 1]
+    redis_connector._cursor = mock_instance
+
+    result = redis_connector.batched(
+        [("hget", ("schema", "key")), ("hlen", ("schema",))]
+    )
+
+    mock_instance.pipeline.assert_called_once_with(transaction=False)
+    pipe.hget.assert_called_once_with("schema", "key")
+    pipe.hlen.assert_called_once_with("schema")
+    pipe.execute.assert_called_once()
+    assert result == [b"1", 1]
@@ -0,0 +1,105 @@
+import io
+import json
+import math
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic_mini import BaseModel
+
+from volnux.backends.stores.hdfs_store import HDFSStoreBackend
+from volnux.exceptions import ObjectExistError
+
+
+class MockRecord(BaseModel):
+    id: str
+    name: str
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __getstate__(self):
+        return self.__dict__
+
+
+@pytest.fixture
+def hdfs_store():
+    store = HDFSStoreBackend.__new__(HDFSStoreBackend)
+    store.base_path = "/volnux"
+    store.connector = MagicMock()
+    store.connector.cursor = MagicMock()
+    store.connector.cursor.write.side_effect = lambda path, bio, **kwargs: setattr(
+        store, "written", bio.getvalue()
+    )
+    return store
+
+
+def test_insert_record_round_trips(hdfs_store):
+    cursor = hdfs_store.connector.cursor
+    cursor.status.return_value = None
+    record = MockRecord(id="1", name="test")
+
+    hdfs_store.insert_record("schema", "1", record)
+
+    written = hdfs_store.written
+    cursor.status.return_value = {"type": "FILE"}
+    cursor.read.return_value = io.BytesIO(written)
+    loaded = hdfs_store.get_record("schema", MockRecord, "1")
+    assert loaded.id == "1"
+    assert loaded.name == "test"
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_update_record_encodes_json(hdfs_store, monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setattr("volnux.backends.stores.hdfs_store.orjson", None)
+    cursor = hdfs_store.connector.cursor
+    cursor.status.return_value = {"type": "FILE"}
+    record = MockRecord(id="1", name="test")
+    record.__dict__["big"] = 2**70 + 1
+    record.__dict__["ratio"] = float("nan")
+
+    hdfs_store.update_record("schema", "1", record)
+
+    cursor.read.return_value = io.BytesIO(hdfs_store.written)
+    hdfs_store.reload_record("schema", record)
+    assert type(record.big) is int
+    assert record.big == 2**70 + 1
+    assert math.isnan(record.ratio)
+    assert record.name == "test"
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_update_record_round_trips_non_finite_floats(
+    hdfs_store, monkeypatch, orjson_installed
+):
+    if not orjson_installed:
+        monkeypatch.setattr("volnux.backends.stores.hdfs_store.orjson", None)
+    cursor = hdfs_store.connector.cursor
+    cursor.status.return_value = {"type": "FILE"}
+    record = MockRecord(id="1", name="test")
+    record.__dict__["scores"] = [1.5, float("inf")]
+
+    hdfs_store.update_record("schema", "1", record)
+
+    cursor.read.return_value = io.BytesIO(hdfs_store.written)
+    hdfs_store.reload_record("schema", record)
+    assert record.scores == [1.5, float("inf")]
+
+
+def test_get_record_reads_stdlib_written_records(hdfs_store):
+    # Records written before orjson was used, by json.dumps
+    cursor = hdfs_store.connector.cursor
+    cursor.status.return_value = {"type": "FILE"}
+    data = {"id": "1", "name": "test", "ratio": float("nan"), "big": 2**70 + 1}
+    cursor.read.return_value = io.BytesIO(json.dumps(data).encode("utf-8"))
+
+    record = hdfs_store.get_record("schema", MockRecord, "1")
+    assert math.isnan(record.ratio)
+    assert type(record.big) is int
+    assert record.big == 2**70 + 1
+
+
+def test_insert_existing_record_raises(hdfs_store):
+    hdfs_store.connector.cursor.status.return_value = {"type": "FILE"}
+    with pytest.raises(ObjectExistError):
+        hdfs_store.insert_record("schema", "1", MockRecord(id="1", name="test"))
@@ -40,61 +40,81 @@ def test_count(redis_store):
 
 
 def test_insert_record(redis_store):
-    redis_store.connector.cursor.hexists.return_value = False
+    redis_store.connector.cursor.hsetnx.return_value = 1
     record = MockRecord(id="1", name="Test")
     redis_store.insert_record("test_schema", "test_key", record)
-    redis_store.connector.cursor.pipeline.assert_called_once()
+    redis_store.connector.cursor.hsetnx.assert_called_once()
+    redis_store.connector.cursor.hexists.assert_not_called()
 
 
 def test_insert_record_exists(redis_store):
-    redis_store.connector.cursor.hexists.return_value = True
+    redis_store.connector.cursor.hsetnx.return_value = 0
     record = MockRecord(id="1", name="Test")
     with pytest.raises(ObjectExistError):
         redis_store.insert_record("test_schema", "test_key", record)
 
 
 def test_update_record(redis_store):
-    redis_store.connector.cursor.hexists.return_value = True
+    script = redis_store.connector.cursor.register_script.return_value
+    script.return_value = 1
     record = MockRecord(id="1", name="Updated")
     redis_store.update_record("test_schema", "test_key", record)
-    redis_store.connector.cursor.pipeline.assert_called_once()
+    redis_store.update_record("test_schema", "test_key", record)
+
+    redis_store.connector.cursor.register_script.assert_called_once()
+    assert script.call_count == 2
+    kwargs = script.call_args.kwargs
+    assert kwargs["keys"] == ["test_schema"]
+    assert kwargs["args"][0] == "test_key"
+    assert pickle.loads(kwargs["args"][1]) == record.__getstate__()
+    redis_store.connector.cursor.hexists.assert_not_called()
 
 
 def test_update_record_not_exists(redis_store):
-    redis_store.connector.cursor.hexists.return_value = False
+    redis_store.connector.cursor.register_script.return_value.return_value = 0
     record = MockRecord(id="1", name="Updated")
     with pytest.raises(ObjectDoesNotExist):
         redis_store.update_record("test_schema", "test_key", record)
 
 
 def test_delete_record(redis_store):
-    redis_store.connector.cursor.hexists.return_value = True
+    redis_store.connector.cursor.hdel.return_value = 1
     redis_store.delete_record("test_schema", "test_key")
-    redis_store.connector.cursor.pipeline.assert_called_once()
+    redis_store.connector.cursor.hdel.assert_called_once_with("test_schema", "test_key")
 
 
 def test_delete_record_not_exists(redis_store):
-    redis_store.connector.cursor.hexists.return_value = False
+    redis_store.connector.cursor.hdel.return_value = 0
     with pytest.raises(ObjectDoesNotExist):
         redis_store.delete_record("test_schema", "test_key")
 
 
 def test_get_record(redis_store):
-    redis_store.connector.cursor.hexists.return_value = True
     redis_store.connector.cursor.hget.return_value = pickle.dumps(
         {"id": "1", "name": "Test"}
     )
     record = redis_store.get_record("test_schema", MockRecord, "test_key")
     assert record.id == "1"
     assert record.name == "Test"
+    redis_store.connector.cursor.hexists.assert_not_called()
 
 
 def test_get_record_not_exists(redis_store):
-    redis_store.connector.cursor.hexists.return_value = False
+    redis_store.connector.cursor.hget.return_value = None
     with pytest.raises(ObjectDoesNotExist):
         redis_store.get_record("test_schema", MockRecord, "test_key")
 
 
+def test_check_connection_pings_only_new_clients(redis_store):
+    redis_store._check_connection()
+    redis_store.connector.is_connected.assert_not_called()
+
+    redis_store.connector.cursor = None
+    redis_store._check_connection()
+    redis_store.connector.connect.assert_called_once()
+    redis_store.connector.is_connected.assert_called_once()
+
+
 def test_filter_record(redis_store):
     redis_store.connector.cursor.hscan.side_effect = [
         (1, {"key1": pickle.dumps({"id": "1", "name": "Test1"})}),
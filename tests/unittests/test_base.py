@@ -50,6 +50,15 @@ class TestExecutorInitializerConfig(TestCase):
         self.assertIs(config.max_tasks_per_child, ConfigState.UNSET)
         self.assertIs(config.thread_name_prefix, ConfigState.UNSET)
 
+    @patch("volnux.parser.executor_config.os.cpu_count", return_value=64)
+    def test_executor_config_default_max_workers(self, _):
+        self.assertEqual(ExecutorInitializerConfig().resolve_max_workers(), 32)
+        self.assertEqual(ExecutorInitializerConfig().to_dict()["max_workers"], 32)
+        self.assertEqual(
+            ExecutorInitializerConfig(max_workers=2).resolve_max_workers(), 2
+        )
+        self.assertEqual(ExecutorInitializerConfig().resolve_max_workers(4), 4)
+
 
 class TestRetryMixin(TestCase):
     def setUp(self):
@@ -366,3 +375,17 @@ class TestEventBaseCallMethod(TestCase):
         mock_retry.assert_called_once()
         mock_on_failure.assert_called_once()
         mock_on_success.assert_not_called()
+
+
+def test_executor_class_traits():
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    from volnux.base import _get_executor_class_traits
+    from volnux.executors.remote_executor import RemoteExecutor
+
+    class CustomRemoteExecutor(RemoteExecutor):
+        pass
+
+    assert _get_executor_class_traits(ThreadPoolExecutor)[0] is False
+    assert _get_executor_class_traits(ProcessPoolExecutor)[0] is True
+    assert _get_executor_class_traits(CustomRemoteExecutor)[0] is True
@@ -1,7 +1,11 @@
 import itertools
+import threading
 import time
 import multiprocessing as mp
+import pickle
 import unittest
+from concurrent.futures import Future
+from multiprocessing import shared_memory
 from typing import Iterator, List
 from unittest.mock import Mock, patch
 
@@ -10,7 +14,13 @@ import pytest
 from volnux import EventBase
 from volnux.exceptions import ImproperlyConfigured
 from volnux.fields import InputDataField
-from volnux.pipeline import BatchPipeline, BatchPipelineStatus, Pipeline, _BatchProcessingMonitor
+from volnux.pipeline import (
+    BatchPipeline,
+    BatchPipelineStatus,
+    Pipeline,
+    _BatchProcessingMonitor,
+    _SharedBufferChunk,
+)
 from volnux.conf import ConfigLoader
 
 
@@ -37,6 +47,26 @@ class DummyPipeline(Pipeline):
         pointy = "Start -> Process -> End"
 
 
+def _completed_chunk_future(*args, **kwargs):
+    future = Future()
+    future.set_result([])
+    return future
+
+
+class _ZeroCopyBytes(bytearray):
+    """bytearray that pickles out-of-band under protocol 5, like NumPy arrays"""
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self),)
+        return type(self)._reconstruct, (bytearray(self),)
+
+    @classmethod
+    def _reconstruct(cls, buffer):
+        with memoryview(buffer) as view:
+            return cls(view)
+
+
 class TestBatchPipeline(unittest.TestCase):
     def setUp(self):
         class TestBatch(BatchPipeline):
@@ -79,17 +109,129 @@ class TestBatchPipeline(unittest.TestCase):
         # Should only create one pipeline
         self.assertEqual(batch._configured_pipelines_count, 1)
 
-    @patch("volnux.pipeline.ProcessPoolExecutor")
+    @patch.object(BatchPipeline, "_get_batch_executor")
     def test_parallel_execution(self, mock_executor):
         """Test parallel execution of multiple pipelines"""
-        mock_executor.return_value.__enter__.return_value = Mock()
+        mock_executor.return_value.__enter__.return_value = Mock(
+            submit=Mock(side_effect=_completed_chunk_future)
+        )
 
         batch = self.batch_cls(data=[1, 2, 3, 4, 5, 6])
         batch.execute()
 
-        # Verify ProcessPoolExecutor was used
+        # Verify the batch worker pool was used
         mock_executor.assert_called_once()
 
+    @patch.object(BatchPipeline, "_get_batch_executor")
+    def test_pipelines_are_submitted_in_chunks(self, mock_executor):
+        executor = Mock(submit=Mock(side_effect=_completed_chunk_future))
+        mock_executor.return_value.__enter__.return_value = executor
+
+        class ChunkedPipeline(Pipeline):
+            data = InputDataField(data_type=list, batch_size=2)
+
+            class Meta:
+                pointy = "Start -> End"
+
+        class ChunkedBatch(BatchPipeline):
+            pipeline_template = ChunkedPipeline
+            chunksize = 2
+
+        batch = ChunkedBatch(data=[1, 2, 3, 4, 5, 6])
+        batch.execute()
+
+        self.assertEqual(batch._configured_pipelines_count, 3)
+        chunk_lengths = [
+            len(call.kwargs["pipelines"]) for call in executor.submit.call_args_list
+        ]
+        self.assertEqual(chunk_lengths, [2, 1])
+
+    @patch.object(BatchPipeline, "_get_batch_executor")
+    def test_in_flight_chunks_are_bounded(self, mock_executor):
+        pending: List[Future] = []
+        in_flight_at_submit = []
+
+        def _submit(*args, **kwargs):
+            in_flight_at_submit.append(sum(not f.done() for f in pending))
+            future = Future()
+            pending.append(future)
+            return future
+
+        def _drain():
+            # Play the worker: finish one queued chunk at a time
+            while not stop.is_set():
+                for future in pending:
+                    if not future.done():
+                        future.set_result([])
+                        break
+                time.sleep(0.01)
+
+        mock_executor.return_value.__enter__.return_value = Mock(
+            submit=Mock(side_effect=_submit)
+        )
+
+        class SingleItemPipeline(Pipeline):
+            data = InputDataField(data_type=list, batch_size=1)
+
+            class Meta:
+                pointy = "Start -> End"
+
+        class BoundedBatch(BatchPipeline):
+            pipeline_template = SingleItemPipeline
+            max_workers = 1
+
+        stop = threading.Event()
+        worker = threading.Thread(target=_drain, daemon=True)
+        worker.start()
+        try:
+            BoundedBatch(data=[1, 2, 3, 4, 5, 6]).execute()
+        finally:
+            stop.set()
+            worker.join()
+
+        self.assertEqual(len(in_flight_at_submit), 6)
+        # At most two chunks per worker are queued at once
+        self.assertLessEqual(max(in_flight_at_submit), 1)
+
+    @patch("volnux.flows.base.get_pooled_executor")
+    def test_batch_workers_are_recycled(self, mock_pooled_executor):
+        class RecyclingBatch(BatchPipeline):
+            pipeline_template = DummyPipeline
+            max_tasks_per_child = 8
+
+        batch = RecyclingBatch(data=[1, 2])
+        batch._get_batch_executor(mp.get_context("spawn"))
+
+        executor_class, config = mock_pooled_executor.call_args.args
+        self.assertEqual(config["max_tasks_per_child"], 8)
+
+    def test_pipeline_chunk_executor_runs_each_pipeline(self):
+        with patch.object(
+            BatchPipeline, "_pipeline_executor", side_effect=lambda **kw: (kw["pipeline"], None)
+        ):
+            results = BatchPipeline._pipeline_chunk_executor(
+                pipelines=["a", "b"], focus_on_signals=[], signals_queue=None
+            )
+        self.assertEqual(results, [("a", None), ("b", None)])
+
+    def test_shared_buffer_chunk_moves_large_buffers_through_shared_memory(self):
+        payload = _ZeroCopyBytes(b"x" * 64)
+        chunk = _SharedBufferChunk([payload, {"key": "value"}])
+
+        with patch("volnux.pipeline.conf.BATCH_PIPELINE_SHARED_MEMORY_THRESHOLD", 32):
+            data = pickle.dumps(chunk)
+        shm_name = chunk._shm.name
+        self.assertEqual(pickle.loads(data), [payload, {"key": "value"}])
+
+        chunk.release()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=shm_name)
+
+        # Small buffers stay inline
+        small = _SharedBufferChunk([_ZeroCopyBytes(b"abc")])
+        self.assertEqual(pickle.loads(pickle.dumps(small)), [bytearray(b"abc")])
+        self.assertIsNone(small._shm)
+
     def test_custom_batch_processor_with_wrong_call_signature(self):
         """Test custom batch processor method"""
 
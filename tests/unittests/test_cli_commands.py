@@ -0,0 +1,256 @@
+import io
+import os
+import string
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from volnux.cli.command import base
+from volnux.cli.command.base import BaseCommand, CommandError
+from volnux.cli.command.builtins.start_workflow import StartWorkflowCommand
+
+
+@pytest.fixture
+def start_workflow_command():
+    command = StartWorkflowCommand()
+    command.stdout = io.StringIO()
+    return command
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    (tmp_path / "config.py").write_text(
+        f"PROJECT_DIR = {str(tmp_path)!r}\nWORKFLOWS = []\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    StartWorkflowCommand.invalidate_project_config()
+
+
+@pytest.mark.parametrize("name", ["orders", "data_processing", "_private", "v2"])
+def test_validate_workflow_name_accepts_identifiers(start_workflow_command, name):
+    start_workflow_command._validate_workflow_name(name)
+
+
+@pytest.mark.parametrize(
+    "name,message",
+    [
+        ("", "cannot be empty"),
+        ("_", "Use only letters, numbers, and underscores"),
+        ("__", "Use only letters, numbers, and underscores"),
+        ("data-processing", "Use only letters, numbers, and underscores"),
+        ("1_", "cannot start with a digit"),
+        ("2fast", "cannot start with a digit"),
+        ("class", "reserved Python keyword"),
+    ],
+)
+def test_validate_workflow_name_rejects_invalid_names(
+    start_workflow_command, name, message
+):
+    with pytest.raises(CommandError, match=message):
+        start_workflow_command._validate_workflow_name(name)
+
+
+def test_load_project_config_reuses_module_while_unchanged(
+    start_workflow_command, project_dir
+):
+    config = start_workflow_command.load_project_config()
+    assert config.WORKFLOWS == []
+    assert start_workflow_command.load_project_config() is config
+
+
+def test_load_project_config_reloads_after_change(start_workflow_command, project_dir):
+    config_file = project_dir / "config.py"
+    config = start_workflow_command.load_project_config()
+
+    config_file.write_text(f"PROJECT_DIR = {str(project_dir)!r}\nWORKFLOWS = ['a']\n")
+    reloaded = start_workflow_command.load_project_config()
+    assert reloaded is not config
+    assert reloaded.WORKFLOWS == ["a"]
+
+
+def test_load_project_config_reloads_after_same_size_rewrite(
+    start_workflow_command, project_dir
+):
+    config_file = project_dir / "config.py"
+    config = start_workflow_command.load_project_config()
+    stat_result = os.stat(config_file)
+
+    config_file.write_text(config_file.read_text().replace("[]", "()"))
+    os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+
+    reloaded = start_workflow_command.load_project_config()
+    assert reloaded is not config
+    assert reloaded.WORKFLOWS == ()
+
+
+def test_load_project_config_reports_cached_load(start_workflow_command, project_dir):
+    start_workflow_command.load_project_config()
+    start_workflow_command.stdout = io.StringIO()
+
+    start_workflow_command.load_project_config()
+    assert "Loaded project configuration" in start_workflow_command.stdout.getvalue()
+
+
+def test_register_workflow_in_config_invalidates_cached_config(
+    start_workflow_command, project_dir
+):
+    assert start_workflow_command.load_project_config().WORKFLOWS == []
+
+    start_workflow_command._register_workflow_in_config(
+        project_dir, "workflows.orders"
+    )
+
+    config = start_workflow_command.load_project_config()
+    assert config.WORKFLOWS == ["workflows.orders"]
+
+
+def test_register_workflow_in_config_keeps_crlf_line_endings(
+    start_workflow_command, tmp_path
+):
+    config_file = tmp_path / "config.py"
+    config_file.write_bytes(b'WORKFLOWS = [\r\n    "a.b",\r\n]\r\n')
+
+    start_workflow_command._register_workflow_in_config(tmp_path, "workflows.x")
+
+    assert config_file.read_bytes() == (
+        b'WORKFLOWS = ["a.b",\r\n    "workflows.x",\r\n]\r\n'
+    )
+
+
+def test_builtin_commands_are_loaded_on_demand():
+    code = (
+        "import sys\n"
+        "from volnux.cli.command.base import get_command_registry\n"
+        "from volnux.cli.command.builtins import load_builtin_command\n"
+        "load_builtin_command('version')\n"
+        "assert get_command_registry().get_by_name('version') is not None\n"
+        "loaded = {m for m in sys.modules if m.startswith('volnux.cli.command.builtins.')}\n"
+        "assert loaded == {'volnux.cli.command.builtins.version'}, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_builtin_command_classes_are_reexported():
+    from volnux.cli import command
+    from volnux.cli.command.builtins.help import HelpCommand
+
+    assert command.HelpCommand is HelpCommand
+    assert command.StartWorkflowCommand is StartWorkflowCommand
+    with pytest.raises(AttributeError):
+        command.MissingCommand
+
+
+def test_get_commands_by_category_loads_builtin_commands():
+    from volnux.cli.command.base import CommandCategory, get_commands_by_category
+
+    commands = get_commands_by_category(CommandCategory.WORKFLOW_MANAGEMENT)
+    assert StartWorkflowCommand in commands
+
+
+def test_main_help_lists_commands_sorted_by_name(capsys):
+    from volnux.cli.main import VolnuxCLI
+
+    VolnuxCLI().print_help()
+
+    listed = [
+        line.split()[0]
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith("  ")
+    ]
+    assert "startworkflow" in listed
+    assert "version" in listed
+    assert listed == sorted(listed)
+
+
+def test_remove_scaffold_tree_removes_nested_directories(tmp_path):
+    root = tmp_path / "scaffold"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.py").write_text("")
+    (root / "a" / "middle.py").write_text("")
+    (root / "a" / "b" / "leaf.py").write_text("")
+
+    StartWorkflowCommand._remove_scaffold_tree(root)
+
+    assert not root.exists()
+
+
+def test_remove_scaffold_tree_unlinks_symlinks_without_following(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    target = outside / "keep.txt"
+    target.write_text("keep")
+    root = tmp_path / "scaffold"
+    root.mkdir()
+    (root / "file_link").symlink_to(target)
+    (root / "dir_link").symlink_to(outside, target_is_directory=True)
+
+    StartWorkflowCommand._remove_scaffold_tree(root)
+
+    assert not root.exists()
+    assert target.read_text() == "keep"
+
+
+def test_remove_scaffold_tree_refuses_symlinked_root(tmp_path):
+    real = tmp_path / "real"
+    real.mkdir()
+    (real / "keep.txt").write_text("keep")
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+
+    with pytest.raises(OSError, match="Refusing to remove symbolic link"):
+        StartWorkflowCommand._remove_scaffold_tree(link)
+
+    assert (real / "keep.txt").exists()
+
+
+TEMPLATES_DIR = Path(base.__file__).parent / "builtins" / "templates"
+
+
+@pytest.mark.parametrize(
+    "template_name", sorted(path.name for path in TEMPLATES_DIR.glob("*.txt"))
+)
+def test_rendered_templates_match_str_format(template_name):
+    content = (TEMPLATES_DIR / template_name).read_text(encoding="utf-8")
+    params = {
+        field: f"<{field}>"
+        for _, field, _, _ in string.Formatter().parse(content)
+        if field
+    }
+
+    rendered = BaseCommand._get_rendered_template(template_name, params)
+    assert rendered == content.format(**params)
+
+
+@pytest.fixture
+def fake_template(monkeypatch):
+    templates = {}
+    monkeypatch.setattr(base, "_load_template", templates.__getitem__)
+    base._compile_template.cache_clear()
+    yield templates
+    base._compile_template.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "content,params,expected",
+    [
+        ("value={value!r}", {"value": "x"}, "value='x'"),
+        ("count={count:>3}", {"count": 7}, "count=  7"),
+        ("path={item.name}", {"item": Path("a/b.txt")}, "path=b.txt"),
+    ],
+)
+def test_compile_template_falls_back_for_non_plain_fields(
+    fake_template, content, params, expected
+):
+    fake_template["fake.txt"] = content
+
+    assert base._compile_template("fake.txt") is None
+    assert BaseCommand._get_rendered_template("fake.txt", params) == expected
+
+
+def test_compile_template_falls_back_for_positional_fields(fake_template):
+    fake_template["fake.txt"] = "first={0}"
+
+    assert base._compile_template("fake.txt") is None
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+from volnux.execution.coordinator import _run_on_thread_loop
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_thread_loop_is_reused_across_runs():
+    assert _run_on_thread_loop(_current_loop()) is _run_on_thread_loop(
+        _current_loop()
+    )
+
+
+def test_thread_loop_is_per_thread():
+    loops = []
+    thread = threading.Thread(
+        target=lambda: loops.append(_run_on_thread_loop(_current_loop()))
+    )
+    thread.start()
+    thread.join()
+
+    assert loops[0] is not _run_on_thread_loop(_current_loop())
+
+
+def test_pending_tasks_are_cancelled_after_run():
+    async def main():
+        return asyncio.ensure_future(asyncio.sleep(60))
+
+    leftover = _run_on_thread_loop(main())
+    assert leftover.cancelled()
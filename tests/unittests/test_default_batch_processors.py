@@ -1,6 +1,9 @@
 import pytest
 from io import StringIO
+from unittest.mock import patch
 
+from volnux.data_field.file_proxy import FileProxy as DataFieldFileProxy
+from volnux.fields import FileProxy
 from volnux.default_batch_processors import (
     list_batch_processor,
     file_stream_batch_processor,
@@ -46,3 +49,28 @@ def test_file_stream_batch_processor():
     # Test with invalid input
     with pytest.raises(ValueError, match="is not a file stream"):
         list(file_stream_batch_processor("not a stream"))
+
+
+def test_file_stream_batch_processor_reads_ahead(tmp_path):
+    data = b"x" * 25
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    proxy = FileProxy(str(path), mode="rb")
+    with patch.object(proxy, "read", wraps=proxy.read) as read:
+        result = list(file_stream_batch_processor(proxy, 5))
+    proxy.close()
+
+    assert result == [b"xxxxx"] * 5
+    assert read.call_count == 2
+
+
+def test_file_stream_batch_processor_accepts_data_field_proxy(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 12)
+
+    proxy = DataFieldFileProxy(str(path), mode="rb")
+    result = list(file_stream_batch_processor(proxy, 5))
+    proxy.close()
+
+    assert result == [b"xxxxx", b"xxxxx", b"xx"]
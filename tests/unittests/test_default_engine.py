@@ -0,0 +1,18 @@
+from collections import deque
+from unittest import mock
+
+from volnux.engine.default_engine import DefaultWorkflowEngine
+
+
+def test_drain_sink_nodes_executes_shared_sink_once():
+    engine = DefaultWorkflowEngine()
+    sink_a, sink_b = object(), object()
+
+    with mock.patch("volnux.engine.default_engine.ExecutionContext") as context:
+        engine._drain_sink_nodes(deque([sink_a, sink_b, sink_a]), mock.Mock())
+
+    assert [c.kwargs["task_profiles"] for c in context.call_args_list] == [
+        sink_a,
+        sink_b,
+    ]
+    assert context.return_value.dispatch.call_count == 2
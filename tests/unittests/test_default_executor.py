@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from concurrent.futures import Future
 
 import pytest
@@ -21,3 +23,14 @@ def test_default_executor():
         executor = default_executor.DefaultExecutor()
         future = executor.submit(exception_func)
         raise future.exception()
+
+
+def test_importing_volnux_defers_remote_executors():
+    code = (
+        "import sys, volnux\n"
+        "assert 'volnux.executors.grpc_executor' not in sys.modules\n"
+        "assert 'volnux.executors.remote_executor' not in sys.modules\n"
+        "from volnux.executors import GRPCExecutor, RemoteExecutor, XMLRPCExecutor\n"
+        "assert RemoteExecutor.__module__ == 'volnux.executors.remote_executor'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
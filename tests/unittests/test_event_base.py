@@ -56,6 +56,18 @@ class TestEventBase(unittest.TestCase):
 
         self.assertTrue(len(klasses) > 0)
 
+    def test_get_klasses_is_cached_until_new_registration(self):
+        klasses = EventBase.get_all_event_classes()
+        self.assertIs(klasses, EventBase.get_all_event_classes())
+
+        class LateRegisteredEvent(EventBase):
+            def process(self, *args, **kwargs):
+                return True, None
+
+        updated = EventBase.get_all_event_classes()
+        self.assertIsNot(klasses, updated)
+        self.assertIn(LateRegisteredEvent, updated)
+
     def test_function_base_events_create_class(self):
         task1 = PipelineTask(event=self.func_with_no_args.__name__)
         task2 = PipelineTask(event=self.func_with_args.__name__)
@@ -78,6 +90,20 @@ class TestEventBase(unittest.TestCase):
         self.assertFalse(event1.is_multiprocessing_executor())
         self.assertTrue(event2.is_multiprocessing_executor())
 
+    def test_is_multiprocessing_with_process_pool_subclass(self):
+        class CustomProcessPoolExecutor(ProcessPoolExecutor):
+            pass
+
+        class CustomPoolEvent(EventBase):
+            executor = CustomProcessPoolExecutor
+
+            def process(self, *args, **kwargs):
+                return True, None
+
+        event = CustomPoolEvent(None, "1")
+        self.assertTrue(event.is_multiprocessing_executor())
+        self.assertIn("mp_context", event.get_executor_context())
+
     def test_multiprocess_executor_set_context(self):
         event1 = self.WithoutParamEvent(None, "1")
         event2 = self.WithParamEvent(None, "1")
@@ -1,3 +1,6 @@
+import json
+from collections import OrderedDict, defaultdict, namedtuple
+from dataclasses import dataclass
 from datetime import datetime
 
 import pytest
@@ -38,6 +41,23 @@ def test_event_result_get_state():
     assert state["init_params"]["execution_context"] == "test_context"
 
 
+def test_event_result_get_state_keeps_execution_context():
+    class Context:
+        id = "context-id"
+
+    context = Context()
+    event_result = EventResult(
+        error=False,
+        event_name="test_event",
+        content=None,
+        init_params={"execution_context": context},
+    )
+    state = event_result.get_state()
+    assert state["init_params"]["execution_context"] == "context-id"
+    assert state["_id"] == event_result.id
+    assert event_result.init_params["execution_context"] is context
+
+
 def test_event_result_set_state():
     event_result = EventResult(
         error=False,
@@ -76,6 +96,119 @@ def test_event_result_as_dict():
     assert result_dict["content"] == {"key": "value"}
 
 
+def test_event_result_as_dict_with_exception_content():
+    error = ValueError("boom")
+    event_result = EventResult(
+        error=True,
+        event_name="test_event",
+        content=error,
+        call_params={"items": [1, 2]},
+    )
+    result_dict = event_result.as_dict()
+    assert result_dict["content"] is error
+    assert result_dict["call_params"] == {"items": [1, 2]}
+    assert result_dict["call_params"] is not event_result.call_params
+    assert event_result.content is error
+
+
+def test_event_result_as_dict_copies_nested_containers():
+    content = {"scalars": [1, 2], "nested": [{"key": "value"}]}
+    event_result = EventResult(error=False, event_name="test_event", content=content)
+    result_dict = event_result.as_dict()
+    assert result_dict["content"] == content
+    assert result_dict["content"]["scalars"] is not content["scalars"]
+    assert result_dict["content"]["nested"][0] is not content["nested"][0]
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+_Pair = namedtuple("_Pair", ["first", "second"])
+
+
+def test_event_result_as_dict_converts_dataclasses_in_dict_subclasses():
+    ordered = OrderedDict(a=_Point(1, 2))
+    grouped = defaultdict(list, b=[_Point(3, 4)])
+    event_result = EventResult(
+        error=False,
+        event_name="test_event",
+        content={"ordered": ordered, "grouped": grouped},
+    )
+    content = event_result.as_dict()["content"]
+    assert type(content["ordered"]) is OrderedDict
+    assert content["ordered"] == {"a": {"x": 1, "y": 2}}
+    assert type(content["grouped"]) is defaultdict
+    assert content["grouped"].default_factory is list
+    assert content["grouped"] == {"b": [{"x": 3, "y": 4}]}
+
+
+def test_event_result_as_dict_converts_dataclasses_in_namedtuples():
+    event_result = EventResult(
+        error=False,
+        event_name="test_event",
+        content=_Pair(_Point(1, 2), "plain"),
+    )
+    content = event_result.as_dict()["content"]
+    assert type(content) is _Pair
+    assert content.first == {"x": 1, "y": 2}
+    assert content.second == "plain"
+
+
+def test_event_result_as_json():
+    event_result = EventResult(
+        error=True,
+        event_name="test_event",
+        content=ValueError("boom"),
+    )
+    data = json.loads(event_result.as_json())
+    assert data["event_name"] == "test_event"
+    assert data["content"] == "boom"
+
+
+def test_event_result_as_json_without_orjson(monkeypatch):
+    monkeypatch.setattr("volnux.result.orjson", None)
+    event_result = EventResult(
+        error=True,
+        event_name="test_event",
+        content=ValueError("boom"),
+    )
+    data = json.loads(event_result.as_json())
+    assert data["event_name"] == "test_event"
+    assert data["content"] == "boom"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_event_result_as_json_non_str_keys(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("volnux.result.orjson", None)
+    event_result = EventResult(
+        error=False,
+        event_name="test_event",
+        content={"big": 2**70},
+        call_params={1: "a"},
+    )
+    data = json.loads(event_result.as_json())
+    assert data["call_params"] == {"1": "a"}
+    assert data["content"] == {"big": 2**70}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_event_result_as_json_output_matches_across_backends(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("volnux.result.orjson", None)
+    event_result = EventResult(
+        error=False,
+        event_name="test_event",
+        content={"ratio": float("nan"), "scores": (1.5, float("inf"))},
+    )
+    encoded = event_result.as_json()
+    assert '"content":{"ratio":null,"scores":[1.5,null]}' in encoded
+    assert json.loads(encoded)["event_name"] == "test_event"
+
+
 def test_entity_content_type_initialization():
     entity_content_type = EntityContentType(
         backend_import_str="backend.module",
@@ -121,6 +121,31 @@ class TestFileInputDataField:
         mock_open.assert_called()
         assert result == mock_file
 
+    def test_file_proxy_is_reused(self, tmp_path):
+        first_path = tmp_path / "first.txt"
+        second_path = tmp_path / "second.txt"
+        first_path.write_text("first")
+        second_path.write_text("second")
+
+        class Instance:
+            input_file = FileInputDataField()
+
+            def get_pipeline_state(self):
+                return MagicMock()
+
+        instance = Instance()
+        instance.input_file = str(first_path)
+        proxy = instance.input_file
+        assert instance.input_file is proxy
+
+        proxy.close()
+        reopened = instance.input_file
+        assert reopened is not proxy
+
+        instance.input_file = str(second_path)
+        assert reopened.closed is True
+        assert instance.input_file.read() == "second"
+
     def test_required_file(self):
         field = FileInputDataField(required=True)
         mock_instance = MagicMock()
@@ -137,6 +162,14 @@ class TestFileProxy:
         assert proxy.encoding == "utf-8"
         assert proxy.closed is False
 
+    def test_mode_flags(self):
+        proxy = FileProxy("test.txt", mode="rb")
+        assert proxy.readable() is True
+        assert proxy.writable() is False
+        proxy.mode = "a+"
+        assert proxy.readable() is True
+        assert proxy.writable() is True
+
     def test_repr(self):
         proxy = FileProxy("test.txt")
         assert repr(proxy) == "<FileProxy test.txt (unopened)>"
@@ -148,7 +181,7 @@ class TestFileProxy:
         mock_file.assert_called_once_with(
             "test.txt",
             mode="r",
-            buffering=-1,
+            buffering=128 * 1024,
             encoding=None,
             errors=None,
             newline=None,
@@ -163,6 +196,12 @@ class TestFileProxy:
         proxy.read()
         mock_file.assert_called_once()
 
+    @patch("builtins.open", new_callable=mock_open, read_data="data")
+    def test_read_with_size(self, mock_file):
+        proxy = FileProxy("test.txt", mode="r")
+        assert proxy.read(2) == "da"
+        assert proxy.read() == "ta"
+
     @patch("builtins.open", new_callable=mock_open)
     def test_write(self, mock_file):
         proxy = FileProxy("test.txt", mode="w")
@@ -180,6 +219,14 @@ class TestFileProxy:
         mock_file().close.assert_called_once()
         assert proxy.closed is True
 
+    @patch("builtins.open", new_callable=mock_open)
+    def test_file_closed_when_proxy_collected(self, mock_file):
+        mock_file().closed = False
+        proxy = FileProxy("test.txt", mode="r")
+        proxy._ensure_open()
+        del proxy
+        mock_file().close.assert_called_once()
+
     @patch("builtins.open", new_callable=mock_open)
     def test_context_manager(self, mock_file):
         mock_file().closed = False
@@ -231,3 +278,13 @@ class TestFileProxy:
         result = proxy.open_for_operation(lambda f: f.read())
         mock_file.assert_called_once()
         assert result == mock_file().read()
+
+    def test_seekable_and_isatty_do_not_open_file(self, tmp_path):
+        path = tmp_path / "data.txt"
+        path.write_text("content")
+        proxy = FileProxy(str(path), mode="r")
+        with patch("builtins.open") as mock_file:
+            assert proxy.seekable() is True
+            assert proxy.isatty() is False
+        mock_file.assert_not_called()
+        assert proxy._file is None
@@ -0,0 +1,60 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from volnux.exceptions import StopProcessingError
+from volnux.flows.base import _EXECUTOR_CACHE, BaseFlow, get_pooled_executor
+
+
+def test_get_pooled_executor_reuses_process_pool():
+    config = {"max_workers": 1}
+    with get_pooled_executor(ProcessPoolExecutor, config) as first:
+        pass
+    with get_pooled_executor(ProcessPoolExecutor, config) as second:
+        pass
+
+    assert first is second
+    assert first.submit(abs, -1).result() == 1
+
+    first.shutdown(wait=True)
+    with get_pooled_executor(ProcessPoolExecutor, config) as third:
+        assert third is not first
+    third.shutdown(wait=True)
+    _EXECUTOR_CACHE.clear()
+
+
+def test_get_pooled_executor_does_not_cache_thread_pool():
+    with get_pooled_executor(ThreadPoolExecutor, {"max_workers": 1}) as executor:
+        pass
+    assert executor._shutdown
+    assert executor not in _EXECUTOR_CACHE.values()
+
+
+def test_gather_until_stop_requested_cancels_pending_siblings():
+    async def run():
+        loop = asyncio.get_running_loop()
+        stopped = loop.create_future()
+        sibling = loop.create_future()
+        finished = loop.create_future()
+        finished.set_result("done")
+        stopped.set_exception(StopProcessingError("stop"))
+        return await BaseFlow._gather_until_stop_requested(
+            [finished, stopped, sibling]
+        ), sibling
+
+    results, sibling = asyncio.run(run())
+
+    assert sibling.cancelled()
+    assert results[0] == "done"
+    assert isinstance(results[1], StopProcessingError)
+    assert isinstance(results[2], asyncio.CancelledError)
+
+
+def test_gather_until_stop_requested_keeps_submission_order():
+    async def run():
+        loop = asyncio.get_running_loop()
+        slow, fast = loop.create_future(), loop.create_future()
+        loop.call_soon(fast.set_result, "fast")
+        loop.call_later(0.01, slow.set_result, "slow")
+        return await BaseFlow._gather_until_stop_requested([slow, fast])
+
+    assert asyncio.run(run()) == ["slow", "fast"]
@@ -0,0 +1,33 @@
+import time
+from concurrent.futures._base import FINISHED
+from unittest.mock import Mock, patch
+
+import pytest
+
+from volnux.base import EventBase
+from volnux.executors.hadoop_executer import HadoopExecutor
+
+
+@pytest.fixture
+def connector():
+    with patch("volnux.executors.hadoop_executer.HadoopConnector") as klass:
+        yield klass.return_value
+
+
+def test_idle_poller_wakes_up_on_submit(connector):
+    connector.submit_job.return_value = "job-1"
+    connector.get_job_status.return_value = FINISHED
+    connector.get_job_result.return_value = 42
+
+    executor = HadoopExecutor(host="localhost", port=8020, poll_interval=30)
+    try:
+        # Let the poller go idle; it must not hold the lock or sleep an interval
+        time.sleep(0.05)
+        future = executor.submit(Mock(spec=EventBase))
+        assert future.result(timeout=5) == 42
+    finally:
+        executor.shutdown(wait=False)
+
+    executor._polling_thread.join(timeout=5)
+    assert not executor._polling_thread.is_alive()
+    connector.get_job_status.assert_called_once_with("job-1")
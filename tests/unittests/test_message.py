@@ -50,3 +50,20 @@ def test_deserialize_static_method_with_invalid_data():
     invalid_data = b"not a valid serialized object"
     with pytest.raises(zlib.error):
         TaskMessage.deserialize(invalid_data)
+
+
+def test_task_class_changes_reach_the_receiver():
+    class Task:
+        factor = 1
+
+        def __call__(self, x):
+            return x * self.factor
+
+    first = TaskMessage(task_id="1", fn=Task, args=(), kwargs={}).serialize()
+    Task.factor = 2
+    second = TaskMessage(task_id="1", fn=Task, args=(), kwargs={}).serialize()
+
+    # Dynamic classes are pickled by value, so the payload carries the change
+    assert first != second
+    message, _ = TaskMessage.deserialize(second)
+    assert message.fn()(3) == 6
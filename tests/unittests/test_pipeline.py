@@ -198,6 +198,22 @@ class PipelineTest(unittest.TestCase):
         self.assertIn("name", cache)
         self.assertIsInstance(cache["name"], str)
 
+    def test_pipeline_init_caches_all_fields(self):
+        pipe = self.pipeline_klass(name="first", school="ucc")
+        other = self.pipeline_klass(name="second")
+
+        self.assertEqual(
+            dict(pipe._state.pipeline_cache[pipe.get_cache_key()]),
+            {"name": "first", "school": "ucc"},
+        )
+        self.assertEqual(
+            pipe._state.pipeline_cache[other.get_cache_key()]["name"], "second"
+        )
+        self.assertNotIn("_pending_field_writes", pipe.__dict__)
+
+        pipe.name = "renamed"
+        self.assertEqual(pipe._state.cache(pipe)["name"], "renamed")
+
     def test_pipeline_invalid_field_initialization(self):
         with pytest.raises(TypeError):
             self.pipeline_klass(name=123)  # Invalid type for 'name'
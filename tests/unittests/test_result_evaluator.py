@@ -686,6 +686,36 @@ class TestEventEvaluator(unittest.TestCase):
         self.assertEqual(result.successful_tasks, 0)
         self.assertEqual(result.failed_tasks, 0)
 
+    def test_evaluate_counts_matches_evaluate(self):
+        """Test count-based evaluation agrees with full result evaluation."""
+        strategies = [
+            AllTasksMustSucceedStrategy(),
+            AnyTaskMustSucceedStrategy(),
+            MajorityTasksMustSucceedStrategy(tie_breaker=False),
+            MinimumSuccessThresholdStrategy(2),
+            PercentageSuccessThresholdStrategy(50),
+            NoFailuresAllowedStrategy(),
+        ]
+        for strategy in strategies:
+            for results in ([], self.task_results, self.task_results[:2]):
+                successful = sum(1 for result in results if result.success)
+                self.assertEqual(
+                    strategy.evaluate_counts(successful, len(results)),
+                    strategy.evaluate(results),
+                )
+
+    def test_evaluate_falls_back_to_results(self):
+        """Test strategies without a count path are given the full results."""
+        strategy = Mock(spec=ExecutionResultEvaluationStrategyBase)
+        strategy.evaluate_counts.return_value = None
+        strategy.evaluate.return_value = True
+        strategy.get_strategy_name.return_value = "Mock"
+
+        result = EventEvaluator(strategy).evaluate(self.task_results)
+
+        self.assertTrue(result.success)
+        strategy.evaluate.assert_called_once_with(self.task_results)
+
     def test_change_strategy(self):
         """Test changing evaluation strategy."""
         original_strategy = self.evaluator.strategy
@@ -56,6 +56,33 @@ def test_result_set_discard(result_set):
     assert result_to_remove not in result_set
 
 
+def test_result_set_indexing_tracks_mutations(result_set, mock_results):
+    assert result_set[0] is mock_results[0]
+    assert result_set[-1] is mock_results[-1]
+
+    new_result = MockResult(id="4")
+    result_set.add(new_result)
+    assert result_set[-1] is new_result
+
+    result_set.discard(mock_results[0])
+    assert result_set[0] is mock_results[1]
+
+
+def test_result_set_pickles_with_slots(result_set):
+    import pickle
+
+    assert not hasattr(result_set, "__dict__")
+    restored = pickle.loads(pickle.dumps(ResultSet([])))
+    assert len(restored) == 0
+
+
+def test_result_set_context_types_are_per_instance(result_set):
+    other = ResultSet([])
+    assert result_set._context_types
+    assert not other._context_types
+    assert result_set._context_types is not other._context_types
+
+
 def test_result_set_clear(result_set):
     result_set.clear()
     assert len(result_set) == 0
@@ -84,6 +111,19 @@ def test_result_set_filter(result_set):
     assert len(filtered) == 1
 
 
+def test_result_set_filter_indexed_field(result_set):
+    assert len(result_set.filter(event_name="A")) == 0
+
+    first = MockResult(id="4", event_name="A")
+    result_set.add(first)
+    result_set.add(MockResult(id="5", event_name="B"))
+    assert list(result_set.filter(event_name="A")) == [first]
+
+    result_set.discard(first)
+    assert len(result_set.filter(event_name="A")) == 0
+    assert len(result_set.filter(event_name="B", id="5")) == 1
+
+
 def test_result_set_filter_nested(result_set):
     filtered = result_set.filter(content__tags__contains="urgent")
     assert len(filtered) == 2
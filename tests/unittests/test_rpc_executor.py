@@ -95,6 +95,15 @@ class TestRPCExecutor(unittest.TestCase):
         self.assertTrue(future.exception())
         self.assertIsInstance(future.exception(), ConnectionError)
 
+    def test_proxies_are_pooled_per_concurrent_call(self):
+        """Concurrent calls get separate proxies and released ones are reused"""
+        with self.executor._checkout_proxy() as first:
+            with self.executor._checkout_proxy() as second:
+                self.assertIsNot(first, second)
+
+        with self.executor._checkout_proxy() as reused:
+            self.assertIn(reused, (first, second))
+
     def test_shutdown(self):
         """Test executor shutdown"""
         self.executor.shutdown()
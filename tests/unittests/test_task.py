@@ -32,6 +32,26 @@ class TestTask(unittest.TestCase):
         cls.C = C
         cls.S = S
 
+    def test_resolve_event_name_picks_up_new_events(self):
+        self.assertIs(PipelineTask.resolve_event_name("a"), self.A)
+
+        class LateRegisteredEvent(EventBase):
+            def process(self, *args, **kwargs):
+                return True, None
+
+        self.assertIs(
+            PipelineTask.resolve_event_name("lateregisteredevent"),
+            LateRegisteredEvent,
+        )
+
+    def test_get_dot_node_data(self):
+        p = build_pipeline_flow_from_pointy_code("A->B")
+
+        self.assertEqual(
+            p.get_dot_node_data(),
+            f'\t"{p.id}" [label="A", shape=circle, style="filled,rounded", fillcolor=yellow]\n',
+        )
+
     def test_build_event_pipeline_for_line_execution(self):
         p = build_pipeline_flow_from_pointy_code("A->B->C")
 
@@ -122,6 +142,23 @@ class TestTask(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             build_pipeline_flow_from_pointy_code("-1 * A")
 
+    def test_linear_chain_matches_lr_parser(self):
+        from volnux.parser import grammar
+
+        for code in (
+            "A",
+            "A -> B |-> C || D",
+            "  LoadData |->ProcessData\n|-> GraphData ",
+        ):
+            self.assertIsNotNone(grammar._LINEAR_CHAIN_RE.fullmatch(code))
+            self.assertEqual(
+                repr(grammar.pointy_parser(code)),
+                repr(grammar.parser.parse(code, lexer=grammar.pointy_lexer.lexer)),
+            )
+
+        for code in ("2 * A -> B", "A(0->B, 1->C)", "{A -> B} -> C", "trueA -> B"):
+            self.assertIsNone(grammar._LINEAR_CHAIN_RE.fullmatch(code))
+
     def test_multi_condition_conditional_branching(self):
         # No implemented yet
         self.assertTrue(True)
@@ -1,4 +1,5 @@
 import inspect
+import socket
 from unittest import mock
 
 from volnux.parser.options import StopCondition
@@ -6,7 +7,8 @@ from volnux.utils import (_extend_recursion_depth,
                           build_event_arguments_from_pipeline,
                           generate_unique_id, get_expected_args,
                           get_function_call_args, get_obj_klass_import_str,
-                          get_obj_state)
+                          get_obj_state, receive_data_from_socket,
+                          send_data_over_socket)
 
 
 def test_generate_unique_id():
@@ -59,6 +61,20 @@ def test_get_function_call_args():
     }
 
 
+def test_get_function_call_args_caches_signature():
+    def func(is_config, event="event"):
+        pass
+
+    with mock.patch("volnux.utils.signature", wraps=inspect.signature) as sig:
+        get_function_call_args(func, {"is_config": True})
+        assert get_function_call_args(func, {"event": "process"}) == {
+            "is_config": None,
+            "event": "process",
+        }
+
+    assert sig.call_count == 1
+
+
 def test_build_event_arguments_from_pipeline():
     from volnux import EventBase, Pipeline
     from volnux.fields import InputDataField
@@ -166,3 +182,32 @@ def test_get_obj_klass_import_str():
 
     obj = Klass()
     assert get_obj_klass_import_str(obj) == f"{obj.__module__}.{Klass.__qualname__}"
+
+
+class _RecordingSocket:
+    def __init__(self, sock):
+        self.sock = sock
+        self.sends = []
+
+    def sendall(self, data):
+        self.sends.append(bytes(data))
+        self.sock.sendall(data)
+
+    def getpeername(self):
+        return ("127.0.0.1", 0)
+
+
+def test_send_and_receive_data_over_socket():
+    payload = bytes(range(256)) * 40
+    client, server = socket.socketpair()
+    with client, server:
+        recorder = _RecordingSocket(client)
+        assert send_data_over_socket(recorder, payload, chunk_size=4096) == len(
+            payload
+        )
+
+        # The length header travels with the first chunk
+        assert recorder.sends[0][:8] == len(payload).to_bytes(8, "big")
+        assert len(recorder.sends[0]) == 8 + 4096
+
+        assert receive_data_from_socket(server, chunk_size=1024) == payload
@@ -1,11 +1,22 @@
-from typing import Any
+from typing import Any, Optional
 
 from volnux.backends.connection import BackendConnectorBase
 
 
 class DummyConnector(BackendConnectorBase):
+    # The connector holds no state, so every instantiation shares one instance
+    _instance: Optional["DummyConnector"] = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "DummyConnector":
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._cursor = object()  # type: ignore
+            cls._instance = instance
+        return instance
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self._cursor = object()  # type: ignore
+        pass
 
     def connect(self) -> Any:
         # Simulate a connection establishment
@@ -1,24 +1,71 @@
-from redis import Redis
+import typing
+
+from redis import ConnectionPool, Redis
 from volnux.backends.connection import BackendConnectorBase
 
 
 class RedisConnector(BackendConnectorBase):
 
-    def __init__(self, host: str, port: int, db: int = 0):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int = 0,
+        max_connections: int = 32,
+        health_check_interval: int = 30,
+    ):
         super().__init__(host=host, port=port, db=db, username=None, password=None)
-        self._cursor = Redis(host=host, port=port, db=db)
+        self._pool = ConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            max_connections=max_connections,
+            socket_keepalive=True,
+            health_check_interval=health_check_interval,
+        )
+        # The client is created on first connect()
+        self._cursor = None
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        return self._pool
 
     def connect(self):
         if self._cursor is None:
-            self._cursor = Redis(host=self.host, port=self.port, db=self.database)
+            self._cursor = Redis(connection_pool=self._pool)
         return self._cursor
 
     def disconnect(self):
         if self._cursor:
             self._cursor.close()
             self._cursor = None
+        self._pool.disconnect()
 
     def is_connected(self):
-        if self.cursor is not None:
-            return self.cursor.ping()
+        if self._cursor is not None:
+            return self._cursor.ping()
         return False
+
+    def pipeline(self, transaction: bool = False):
+        """
+        Return a pipeline that buffers commands and sends them in one round-trip.
+        Args:
+            transaction: Wrap the buffered commands in MULTI/EXEC.
+        """
+        return self.connect().pipeline(transaction=transaction)
+
+    def batched(
+        self,
+        commands: typing.Iterable[typing.Tuple[str, typing.Sequence[typing.Any]]],
+    ) -> typing.List[typing.Any]:
+        """
+        Execute several commands in a single round-trip.
+        Args:
+            commands: (command_name, args) pairs e.g. [("hget", ("schema", "key"))]
+        Returns:
+            The replies of the commands, in the order they were given.
+        """
+        with self.pipeline() as pipe:
+            for name, args in commands:
+                getattr(pipe, name)(*args)
+            return pipe.execute()
@@ -1,5 +1,6 @@
 import typing
 import json
+import math
 import os
 from io import BytesIO
 from pydantic_mini import BaseModel
@@ -8,6 +9,53 @@ from volnux.exceptions import ObjectDoesNotExist, ObjectExistError
 from volnux.backends.store import KeyValueStoreBackendBase
 from volnux.backends.connectors.hdfs_connector import HDFSConnector
 
+orjson = None
+
+try:
+    import orjson
+except ImportError:
+    pass
+
+
+def _has_non_finite_float(value: typing.Any) -> bool:
+    """Whether the value holds a NaN or infinity anywhere inside it."""
+    if type(value) is float:
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _dump_record_state(data: typing.Dict[str, typing.Any]) -> bytes:
+    """
+    Encode record state as UTF-8 JSON, using orjson when it is installed.
+
+    orjson output carries a trailing newline, which marks it as safe to read
+    back with orjson. Everything else is written by the stdlib encoder,
+    exactly as before orjson was introduced.
+    """
+    # orjson writes NaN and infinity as null; the stdlib keeps them
+    if orjson is not None and not _has_non_finite_float(data):
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(data).encode("utf-8")
+
+
+def _load_record_state(reader) -> typing.Dict[str, typing.Any]:
+    content = reader.read()
+    # Only orjson-produced payloads are decoded with orjson: it reads
+    # integers beyond 64 bits as floats and rejects NaN and infinity
+    if orjson is not None and content.endswith(b"\n"):
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class HDFSStoreBackend(KeyValueStoreBackendBase):
     """HDFS implementation of the key-value store backend."""
@@ -60,7 +108,7 @@ class HDFSStoreBackend(KeyValueStoreBackendBase):
 
         # Write record data
         data = record.__getstate__()
-        with BytesIO(json.dumps(data).encode("utf-8")) as bio:
+        with BytesIO(_dump_record_state(data)) as bio:
             self.connector.cursor.write(record_path, bio)
 
     def update_record(self, schema_name: str, record_key: str, record: BaseModel):
@@ -70,7 +118,7 @@ class HDFSStoreBackend(KeyValueStoreBackendBase):
 
         record_path = self._get_record_path(schema_name, record_key)
         data = record.__getstate__()
-        with BytesIO(json.dumps(data).encode("utf-8")) as bio:
+        with BytesIO(_dump_record_state(data)) as bio:
             self.connector.cursor.write(record_path, bio, overwrite=True)
 
     def delete_record(self, schema_name: str, record_key: str):
@@ -92,7 +140,7 @@ class HDFSStoreBackend(KeyValueStoreBackendBase):
 
         record_path = self._get_record_path(schema_name, record_key)
         with self.connector.cursor.read(record_path) as reader:
-            data = json.load(reader)
+            data = _load_record_state(reader)
             return self.load_record(data, klass)
 
     def reload_record(self, schema_name: str, record: BaseModel):
@@ -102,7 +150,7 @@ class HDFSStoreBackend(KeyValueStoreBackendBase):
 
         record_path = self._get_record_path(schema_name, record.id)
         with self.connector.cursor.read(record_path) as reader:
-            data = json.load(reader)
+            data = _load_record_state(reader)
             record.__setstate__(data)
 
     def filter_record(
@@ -124,7 +172,7 @@ class HDFSStoreBackend(KeyValueStoreBackendBase):
 
                 file_path = os.path.join(schema_path, file)
                 with self.connector.cursor.read(file_path) as reader:
-                    data = json.load(reader)
+                    data = _load_record_state(reader)
                     record = self.load_record(data, record_klass)
                     if match_func(record):
                         matching_records.append(record)
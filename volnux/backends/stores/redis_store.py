@@ -5,11 +5,27 @@ from volnux.backends.connectors.redis import RedisConnector
 from volnux.backends.store import KeyValueStoreBackendBase
 from volnux.exceptions import ObjectDoesNotExist, ObjectExistError
 
+# Overwrite a hash field only if it is already present, returning 1 if it was
+_UPDATE_IF_EXISTS_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
 
 class RedisStoreBackend(KeyValueStoreBackendBase):
     connector_klass = RedisConnector
 
+    # Registered on first use; runs via EVALSHA, reloading the script if needed
+    _update_script = None
+
     def _check_connection(self):
+        # The pool health-checks its connections, so only a fresh client is pinged
+        if self.connector.cursor is not None:
+            return
+        self.connector.connect()
         if not self.connector.is_connected():
             raise ConnectionError("Redis is not connected.")
 
@@ -22,46 +38,45 @@ class RedisStoreBackend(KeyValueStoreBackendBase):
         return self.connector.cursor.hlen(schema_name)
 
     def insert_record(self, schema_name: str, record_key: str, record: BaseModel):
-        if self.exists(schema_name, record_key):
+        self._check_connection()
+        # HSETNX checks and writes in a single round-trip
+        created = self.connector.cursor.hsetnx(
+            schema_name,
+            record_key,
+            pickle.dumps(record.__getstate__(), protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        if not created:
             raise ObjectExistError(
                 "Record already exists in schema '{}'".format(schema_name)
             )
 
-        with self.connector.cursor.pipeline() as pipe:
-            pipe.multi()
-            pipe.hset(
-                schema_name,
+    def update_record(self, schema_name: str, record_key: str, record: BaseModel):
+        self._check_connection()
+        cursor = self.connector.cursor
+        if self._update_script is None:
+            self._update_script = cursor.register_script(_UPDATE_IF_EXISTS_SCRIPT)
+
+        # The existence check and the write happen atomically in one round-trip
+        updated = self._update_script(
+            keys=[schema_name],
+            args=[
                 record_key,
                 pickle.dumps(record.__getstate__(), protocol=pickle.HIGHEST_PROTOCOL),
-            )
-
-            pipe.execute()
-
-    def update_record(self, schema_name: str, record_key: str, record: BaseModel):
-        if not self.exists(schema_name, record_key):
+            ],
+            client=cursor,
+        )
+        if not updated:
             raise ObjectDoesNotExist(
                 "Record does not exist in schema '{}'".format(schema_name)
             )
 
-        with self.connector.cursor.pipeline() as pipe:
-            pipe.hset(
-                schema_name,
-                record_key,
-                pickle.dumps(record.__getstate__(), protocol=pickle.HIGHEST_PROTOCOL),
-            )
-
-            pipe.execute()
-
     def delete_record(self, schema_name, record_key):
-        if not self.exists(schema_name, record_key):
+        self._check_connection()
+        if not self.connector.cursor.hdel(schema_name, record_key):
             raise ObjectDoesNotExist(
                 "Record does not exist in schema '{}'".format(schema_name)
             )
 
-        with self.connector.cursor.pipeline() as pipe:
-            pipe.hdel(schema_name, record_key)
-            pipe.execute()
-
     @staticmethod
     def load_record(record_state, record_klass: typing.Type[BaseModel]):
         record_state = pickle.loads(record_state)
@@ -69,13 +84,19 @@ class RedisStoreBackend(KeyValueStoreBackendBase):
         record.__setstate__(record_state)
         return record
 
-    def reload_record(self, schema_name: str, record: BaseModel):
-        if not self.exists(schema_name, record.id):
+    def _get_record_state(
+        self, schema_name: str, record_key: typing.Union[str, int]
+    ) -> bytes:
+        self._check_connection()
+        state = self.connector.cursor.hget(schema_name, record_key)
+        if state is None:
             raise ObjectDoesNotExist(
                 "Record does not exist in schema '{}'".format(schema_name)
             )
+        return state
 
-        state = self.connector.cursor.hget(schema_name, record.id)
+    def reload_record(self, schema_name: str, record: BaseModel):
+        state = self._get_record_state(schema_name, record.id)
         record_state = pickle.loads(state)
         record.__setstate__(record_state)
 
@@ -85,12 +106,7 @@ class RedisStoreBackend(KeyValueStoreBackendBase):
         klass: typing.Type[BaseModel],
         record_key: typing.Union[str, int],
     ) -> BaseModel:
-        if not self.exists(schema_name, record_key):
-            raise ObjectDoesNotExist(
-                "Record does not exist in schema '{}'".format(schema_name)
-            )
-
-        state = self.connector.cursor.hget(schema_name, record_key)
+        state = self._get_record_state(schema_name, record_key)
         record = self.load_record(state, klass)
         return record
 
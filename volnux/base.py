@@ -1,11 +1,13 @@
 import abc
 import logging
 import multiprocessing as mp
+import sys
 import time
 import typing
 from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 from volnux.parser.executor_config import ExecutorInitializerConfig
 from volnux.parser.options import Options, StopCondition
@@ -30,7 +32,6 @@ from .exceptions import (
     SwitchTask,
 )
 from .executors.default_executor import DefaultExecutor
-from .executors.remote_executor import RemoteExecutor
 from .registry import Registry
 from .result import EventResult, ResultSet
 from .utils import get_function_call_args
@@ -50,6 +51,8 @@ conf = ConfigLoader.get_lazily_loaded_config()
 
 _event_registry = Registry()
 
+_spawn_mp_context = mp.get_context("spawn")
+
 
 if typing.TYPE_CHECKING:
     from volnux.execution.context import ExecutionContext
@@ -114,6 +117,8 @@ class RetryPolicy:
 
 
 class _RetryMixin:
+    __slots__ = ("_retry_count",)
+
     retry_policy: typing.Union[
         typing.Optional[RetryPolicy], typing.Dict[str, typing.Any], None
     ] = None
@@ -185,12 +190,9 @@ class _RetryMixin:
         if self.retry_policy is None:
             return False
         exception_evaluation = not self.retry_policy.retry_on_exceptions or any(
-            [
-                isinstance(exception, exc)
-                and exception.__class__.__name__ == exc.__name__
-                for exc in self.retry_policy.retry_on_exceptions
-                if exc
-            ]
+            isinstance(exception, exc) and exception.__class__.__name__ == exc.__name__
+            for exc in self.retry_policy.retry_on_exceptions
+            if exc
         )
         return isinstance(exception, Exception) and exception_evaluation
 
@@ -263,7 +265,29 @@ class _RetryMixin:
         return False, None
 
 
+@lru_cache(maxsize=None)
+def _get_executor_class_traits(
+    executor: typing.Type[Executor],
+) -> typing.Tuple[bool, bool]:
+    """
+    Classify an executor class once.
+    Returns:
+        (uses multiprocessing or remote execution, exposes get_context)
+    """
+    uses_processes = issubclass(executor, ProcessPoolExecutor)
+    if not uses_processes:
+        # A RemoteExecutor subclass cannot exist unless its module is loaded,
+        # so there is no need to import it here
+        remote_executor = sys.modules.get("volnux.executors.remote_executor")
+        if remote_executor is not None:
+            uses_processes = issubclass(executor, remote_executor.RemoteExecutor)
+
+    return uses_processes, hasattr(executor, "get_context")
+
+
 class _ExecutorInitializerMixin:
+    __slots__ = ()
+
     executor: typing.Type[Executor] = DefaultExecutor
 
     executor_config: typing.Optional[ExecutorInitializerConfig] = None
@@ -291,10 +315,7 @@ class _ExecutorInitializerMixin:
 
     def is_multiprocessing_executor(self) -> bool:
         """Check if using multiprocessing or remote executor"""
-        return (
-            self.get_executor_class() == ProcessPoolExecutor
-            or self.get_executor_class() == RemoteExecutor
-        )
+        return _get_executor_class_traits(self.get_executor_class())[0]
 
     def get_executor_context(
         self, ctx: typing.Optional[typing.Dict[str, typing.Any]] = None
@@ -315,15 +336,14 @@ class _ExecutorInitializerMixin:
 
         """
         executor = self.get_executor_class()
-        context = dict()
-        if self.is_multiprocessing_executor():
-            context["mp_context"] = mp.get_context("spawn")
-        elif hasattr(executor, "get_context"):
-            context["mp_context"] = executor.get_context("spawn")  # type: ignore
-        params = get_function_call_args(
-            executor.__init__, self.get_executor_initializer_config()
+        is_multiprocessing, has_get_context = _get_executor_class_traits(executor)
+        context = get_function_call_args(
+            executor.__init__, self.get_executor_initializer_config().to_dict()
         )
-        context.update(params)
+        if is_multiprocessing:
+            context["mp_context"] = _spawn_mp_context
+        elif has_get_context:
+            context["mp_context"] = executor.get_context("spawn")  # type: ignore
         if ctx and isinstance(ctx, dict):
             context.update(ctx)
         return context
@@ -486,6 +506,21 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
     processing pipeline data.
     """
 
+    # Per-instance state lives in slots. Concrete events still get a __dict__
+    # (retry_policy and executor_config are assigned on the instance)
+    __slots__ = (
+        "_execution_context",
+        "_task_id",
+        "options",
+        "previous_result",
+        "stop_condition",
+        "run_bypass_event_checks",
+        "_init_args",
+        "_call_args",
+        "_execution_status",
+        "__dict__",
+    )
+
     # how we want the execution results of this event to be evaluated by the pipeline
     result_evaluation_strategy: ExecutionResultEvaluationStrategyBase = (
         ResultEvaluationStrategies.ALL_MUST_SUCCEED
@@ -493,8 +528,13 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
 
     event_type: EventType = EventType.OTHER
 
+    # Name reported on results, resolved once per class
+    _event_name: typing.ClassVar[str] = "EventBase"
+
     def __init_subclass__(cls, **kwargs: typing.Dict[str, typing.Any]) -> None:
         """Automatically register subclasses when they're defined"""
+        cls._event_name = cls.__name__
+
         # prevent the overriding of __init__
         if cls.__name__ != "EventBase":
             for attr_name in ["__init__"]:
@@ -603,7 +643,7 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
                 error=not result_success,
                 content=result,
                 task_id=self._task_id,
-                event_name=self.__class__.__name__,
+                event_name=self._event_name,
                 call_params=self._call_args,
                 init_params=self._init_args,
             )  # type: ignore
@@ -700,7 +740,7 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
         return EventResult(
             error=error,
             task_id=self._task_id,
-            event_name=self.__class__.__name__,
+            event_name=self._event_name,
             content=content,
             call_params=self.get_call_args(),
             init_params=self.get_init_args(),
@@ -726,7 +766,7 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
                 params={
                     "init_args": self._init_args,
                     "call_args": self._call_args,
-                    "event_name": self.__class__.__name__,
+                    "event_name": self._event_name,
                     "task_id": self._task_id,
                 },
             )
@@ -769,7 +809,7 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
                 params={
                     "init_args": self._init_args,
                     "call_args": self._call_args,
-                    "event_name": self.__class__.__name__,
+                    "event_name": self._event_name,
                     "task_id": self._task_id,
                 },
             )
@@ -802,9 +842,7 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
             try:
                 should_skip, data = self.can_bypass_current_event()
             except Exception as e:
-                logger.error(
-                    "Error in event setup status checks: %s", str(e), exc_info=e
-                )
+                logger.error("Error in event setup status checks: %s", e, exc_info=e)
                 raise
 
             if should_skip:
@@ -820,11 +858,13 @@ class EventBase(_RetryMixin, _ExecutorInitializerMixin, metaclass=EventMeta):
                 self.process, *args, **kwargs
             )
         except MaxRetryError as e:
-            logger.error(str(e), exc_info=e.exception)
+            logger.error(
+                "Event %s failed: %s", self._event_name, e, exc_info=e.exception
+            )
             return self.on_failure(e)
         except Exception as e:
             if not isinstance(e, SwitchTask):
-                logger.error(str(e), exc_info=e)
+                logger.error("Event %s failed: %s", self._event_name, e, exc_info=e)
             return self.on_failure(e)
         if self._execution_status:
             return self.on_success(execution_result)
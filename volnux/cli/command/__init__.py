@@ -1 +1,11 @@
-from .builtins import *
+from . import builtins
+
+
+def __getattr__(name: str):
+    # Forward the builtin command classes without importing every command
+    if name not in builtins.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(builtins, name)
+    globals()[name] = value
+    return value
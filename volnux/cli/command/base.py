@@ -1,22 +1,42 @@
 import argparse
 import logging
+import os
+import stat
+import string
 import sys
 import types
 import typing
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Any, Dict
 from pathlib import Path
 
 from volnux.registry import Registry
-from volnux.setup import initialise_workflows
 from volnux.import_utils import load_module_from_path
-from volnux.engine.workflows import WorkflowRegistry
+
+if typing.TYPE_CHECKING:
+    # The workflow engine is only needed by commands that load workflows
+    from volnux.engine.workflows import WorkflowRegistry
 
 from .style import Style
 
 _command_registry = Registry()
 
+# Registered commands per category, keyed by "<module>.<class name>" so that a
+# re-registered command replaces its earlier definition
+_commands_by_category: typing.Dict[
+    "CommandCategory", typing.Dict[str, typing.Type["BaseCommand"]]
+] = defaultdict(dict)
+
+# Loaded project config modules, keyed by config path, together with the
+# (inode, size, mtime, ctime) of the file they were loaded from. A module is
+# shared by every command in the process and must be treated as read-only.
+_project_configs: typing.Dict[
+    Path, typing.Tuple[typing.Tuple[int, int, int, int], types.ModuleType]
+] = {}
+
 
 logger = logging.getLogger(__name__)
 
@@ -61,10 +81,87 @@ class CommandMeta(ABCMeta):
                 _command_registry.register(cls, getattr(cls, "name", None))
             except RuntimeError as e:
                 logger.warning(str(e))
+            else:
+                _commands_by_category[cls.category][
+                    f"{cls.__module__}.{cls.__name__}"
+                ] = cls
 
         return cls
 
 
+@lru_cache(maxsize=None)
+def _load_template(template_name: str) -> str:
+    """
+    Locate, validate and read a builtin command template. The templates ship
+    with the package, so each one is read from disk once per process.
+    """
+    # Validate template name
+    if not template_name or not template_name.strip():
+        raise ValueError("Template name cannot be empty")
+
+    # Prevent directory traversal attacks
+    if ".." in template_name or template_name.startswith("/"):
+        raise ValueError(f"Invalid template name: {template_name}")
+
+    # Construct template path
+    current_dir = Path(__file__).parent
+    templates_dir = current_dir / "builtins" / "templates"
+    template_file_path = templates_dir / template_name
+
+    # Ensure the resolved path is still within templates_dir
+    try:
+        template_file_path = template_file_path.resolve()
+        templates_dir = templates_dir.resolve()
+        if not str(template_file_path).startswith(str(templates_dir)):
+            raise ValueError(
+                f"Template path outside allowed directory: {template_name}"
+            )
+    except (OSError, RuntimeError) as e:
+        raise ValueError(f"Invalid template path: {template_name}") from e
+
+    if not template_file_path.exists():
+        raise FileNotFoundError(
+            f"Template file not found: {template_name} "
+            f"(expected at: {template_file_path})"
+        )
+
+    if not template_file_path.is_file():
+        raise ValueError(f"Template path is not a file: {template_name}")
+
+    try:
+        content = template_file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise IOError(f"Failed to read template file {template_name}: {e}") from e
+
+    return content
+
+
+@lru_cache(maxsize=None)
+def _compile_template(
+    template_name: str,
+) -> typing.Optional[typing.Tuple[typing.Tuple[str, typing.Optional[str]], ...]]:
+    """
+    Split a template into (literal, field name) pairs once, so rendering does
+    not re-parse the format string. Returns None for templates using anything
+    beyond plain {name} fields; those are rendered with str.format_map.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(
+        _load_template(template_name)
+    ):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=None)
+def _render_static_template(
+    template_name: str, params: typing.Tuple[typing.Tuple[str, str], ...]
+) -> str:
+    return BaseCommand._get_rendered_template(template_name, dict(params))
+
+
 def get_commands_by_category(category: CommandCategory) -> typing.List["BaseCommand"]:
     """
     Return commands registered for the given category.
@@ -73,14 +170,10 @@ def get_commands_by_category(category: CommandCategory) -> typing.List["BaseComm
     Returns:
          List["BaseCommand"]: Commands registered for the given category.
     """
-    commands = []
-    for command in _command_registry.list_all_classes():
-        command = typing.cast(BaseCommand, command)
-        if command.category == category:
-            if command not in commands:
-                commands.append(command)
+    from .builtins import load_builtin_commands
 
-    return commands
+    load_builtin_commands()
+    return list(_commands_by_category[category].values())
 
 
 class BaseCommand(metaclass=CommandMeta):
@@ -167,47 +260,19 @@ class BaseCommand(metaclass=CommandMeta):
             KeyError: If required template parameters are missing
             Exception: For other rendering errors
         """
-        # Validate template name
-        if not template_name or not template_name.strip():
-            raise ValueError("Template name cannot be empty")
-
-        # Prevent directory traversal attacks
-        if ".." in template_name or template_name.startswith("/"):
-            raise ValueError(f"Invalid template name: {template_name}")
-
-        # Construct template path
-        current_dir = Path(__file__).parent
-        templates_dir = current_dir / "builtins" / "templates"
-        template_file_path = templates_dir / template_name
-
-        # Ensure the resolved path is still within templates_dir
-        try:
-            template_file_path = template_file_path.resolve()
-            templates_dir = templates_dir.resolve()
-            if not str(template_file_path).startswith(str(templates_dir)):
-                raise ValueError(
-                    f"Template path outside allowed directory: {template_name}"
-                )
-        except (OSError, RuntimeError) as e:
-            raise ValueError(f"Invalid template path: {template_name}") from e
-
-        if not template_file_path.exists():
-            raise FileNotFoundError(
-                f"Template file not found: {template_name} "
-                f"(expected at: {template_file_path})"
-            )
-
-        if not template_file_path.is_file():
-            raise ValueError(f"Template path is not a file: {template_name}")
-
-        try:
-            content = template_file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as e:
-            raise IOError(f"Failed to read template file {template_name}: {e}") from e
+        content = _load_template(template_name)
 
         # Render template with parameters
         try:
-            return content.format(**params)
+            parts = _compile_template(template_name)
+            if parts is None:
+                return content.format_map(params)
+            return "".join(
+                [
+                    literal if field is None else literal + format(params[field])
+                    for literal, field in parts
+                ]
+            )
         except KeyError as e:
             raise KeyError(
                 f"Missing required parameter in template {template_name}: {e}"
@@ -215,9 +280,72 @@ class BaseCommand(metaclass=CommandMeta):
         except (ValueError, IndexError) as e:
             raise Exception(f"Error rendering template {template_name}: {e}") from e
 
+    @classmethod
+    def _get_static_template(cls, template_name: str, **params: str) -> str:
+        """Render a template whose parameters come from a small, closed set.
+
+        The output only depends on the arguments, so each rendering is
+        computed once per process.
+
+        Args:
+            template_name: Name of the template file
+            **params: Hashable parameters to substitute in the template
+
+        Returns:
+            Rendered template content as a string
+        """
+        return _render_static_template(template_name, tuple(sorted(params.items())))
+
+    @staticmethod
+    def _write_files(files: typing.Sequence[typing.Tuple[Path, str]]) -> None:
+        """Write scaffold files as UTF-8.
+
+        Content is encoded up front and written in binary mode, skipping the
+        text I/O layer. The files are small, so they are written one after
+        another; a thread pool measured slower than the writes themselves.
+
+        Args:
+            files: (path, content) pairs to write as UTF-8
+        """
+        for path, content in files:
+            path.write_bytes(content.encode("utf-8"))
+
+    @staticmethod
+    def _remove_scaffold_tree(path: Path) -> None:
+        """Remove a directory tree this command has just scaffolded.
+
+        The tree holds a handful of files, so it is walked with os.scandir,
+        whose cached d_type avoids a stat per entry, and torn down with plain
+        unlink/rmdir. Pre-existing trees should go through shutil.rmtree.
+
+        Args:
+            path: Root of the scaffolded tree
+        """
+        if os.path.islink(path):
+            raise OSError(f"Refusing to remove symbolic link: {path}")
+
+        files: typing.List[str] = []
+        dirs: typing.List[str] = []
+        stack = [os.fspath(path)]
+        while stack:
+            directory = stack.pop()
+            dirs.append(directory)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+
+        for file in files:
+            os.unlink(file)
+        # Children were appended after their parents
+        for directory in reversed(dirs):
+            os.rmdir(directory)
+
     def _initialise_workflows(
         self, project_dir: Path, workflow_name: typing.Optional[str] = None
-    ) -> WorkflowRegistry:
+    ) -> "WorkflowRegistry":
         """
         Initialise workflow registry.
         :param project_dir: Project directory
@@ -234,9 +362,11 @@ class BaseCommand(metaclass=CommandMeta):
                 )
 
             workflows_registry = typing.cast(
-                WorkflowRegistry, workflows_initialiser.workflows
+                "WorkflowRegistry", workflows_initialiser.workflows
             )
         else:
+            from volnux.setup import initialise_workflows
+
             workflows_registry = initialise_workflows(project_dir, workflow_name)
 
         if not workflows_registry.is_ready():
@@ -255,15 +385,33 @@ class BaseCommand(metaclass=CommandMeta):
         """
         config_path = Path.cwd() / "config.py"
 
-        if not config_path.exists():
+        try:
+            config_stat = os.stat(config_path)
+        except FileNotFoundError:
             self.warning("No config.py found in current directory")
             return None
 
-        if not config_path.is_file():
+        if not stat.S_ISREG(config_stat.st_mode):
             raise CommandError(f"config.py exists but is not a file: {config_path}")
 
+        # Reuse the module while the file is unchanged, e.g. when several
+        # commands run in one process or a command asks for it twice. The
+        # inode and ctime catch replacements and rewrites that keep the size
+        # and mtime; commands that rewrite config.py invalidate it as well.
+        config_version = (
+            config_stat.st_ino,
+            config_stat.st_size,
+            config_stat.st_mtime_ns,
+            config_stat.st_ctime_ns,
+        )
+        cached = _project_configs.get(config_path)
+        if cached is not None and cached[0] == config_version:
+            self.success(f"Loaded project configuration from {config_path}\n")
+            return cached[1]
+
         try:
             config = load_module_from_path("project_config", config_path)
+            _project_configs[config_path] = (config_version, config)
 
             self.success(f"Loaded project configuration from {config_path}\n")
             return config
@@ -273,6 +421,11 @@ class BaseCommand(metaclass=CommandMeta):
         except Exception as e:
             raise CommandError(f"Failed to load config.py: {str(e)}")
 
+    @classmethod
+    def invalidate_project_config(cls) -> None:
+        """Forget loaded project configs so the next load re-executes config.py."""
+        _project_configs.clear()
+
     def get_project_root_and_config_module(
         self,
     ) -> typing.Tuple[Path, types.ModuleType]:
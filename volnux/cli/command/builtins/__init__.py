@@ -1,19 +1,58 @@
-from .help import HelpCommand
-from .list_workflows import ListWorkflowsCommand
-from .run_workflow import RunWorkflowCommand
-from .shell import ShellCommand
-from .start_project import StartProjectCommand
-from .start_workflow import StartWorkflowCommand
-from .validate_workflow import ValidateWorkflowCommand
-from .version import VersionCommand
+import importlib
 
 __all__ = [
-    "ListWorkflowsCommand",
-    "VersionCommand",
-    "StartProjectCommand",
     "HelpCommand",
+    "ListWorkflowsCommand",
+    "RunWorkflowCommand",
     "ShellCommand",
+    "StartProjectCommand",
     "StartWorkflowCommand",
-    "RunWorkflowCommand",
     "ValidateWorkflowCommand",
+    "VersionCommand",
+    "load_builtin_command",
+    "load_builtin_commands",
 ]
+
+# Command name -> (module, class). Commands register themselves when their
+# module is imported, so a CLI invocation only pays for the command it runs.
+_BUILTIN_COMMANDS = {
+    "help": (".help", "HelpCommand"),
+    "list": (".list_workflows", "ListWorkflowsCommand"),
+    "run": (".run_workflow", "RunWorkflowCommand"),
+    "shell": (".shell", "ShellCommand"),
+    "startproject": (".start_project", "StartProjectCommand"),
+    "startworkflow": (".start_workflow", "StartWorkflowCommand"),
+    "validate": (".validate_workflow", "ValidateWorkflowCommand"),
+    "version": (".version", "VersionCommand"),
+}
+
+_LAZY_COMMANDS = {
+    klass_name: module_name for module_name, klass_name in _BUILTIN_COMMANDS.values()
+}
+
+
+def load_builtin_command(name: str) -> None:
+    """
+    Import the builtin command registered under the given CLI name, if any.
+    Args:
+        name (str): The command name e.g. "startproject"
+    """
+    entry = _BUILTIN_COMMANDS.get(name)
+    if entry is not None:
+        importlib.import_module(entry[0], __name__)
+
+
+def load_builtin_commands() -> None:
+    """Import every builtin command, e.g. to list them all."""
+    for module_name, _ in _BUILTIN_COMMANDS.values():
+        importlib.import_module(module_name, __name__)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_COMMANDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -8,6 +8,7 @@ from ..base import (
     get_command_registry,
     get_commands_by_category,
 )
+from . import load_builtin_command
 
 
 class HelpCommand(BaseCommand):
@@ -25,6 +26,7 @@ class HelpCommand(BaseCommand):
 
         if command_name:
             # Show help for specific command
+            load_builtin_command(command_name)
             loader = get_command_registry()
             command_class = loader.get_by_name(command_name)
 
@@ -17,20 +17,21 @@ class ListWorkflowsCommand(BaseCommand):
                 "You are not in any active project. Run 'volnux startproject' first."
             )
 
-        self.stdout.write(self.style.BOLD("\nAvailable Workflows:\n"))
-
         project_dir, _ = self.get_project_root_and_config_module()
 
         workflows_registry = self._initialise_workflows(project_dir)
 
+        # Collect the listing and emit it with a single write
+        lines = [self.style.BOLD("\nAvailable Workflows:\n")]
         num_of_workflows = 0
         for workflow in workflows_registry.get_workflow_configs():
             num_of_workflows += 1
             if workflow.is_executable:
-                self.stdout.write(f"  ✓ {workflow.name}\n")
+                lines.append(f"  ✓ {workflow.name}\n")
             else:
-                self.stdout.write(f"  ✗ {workflow.name}\n")
+                lines.append(f"  ✗ {workflow.name}\n")
 
-        self.stdout.write(f"\nTotal: {num_of_workflows} workflow(s)\n")
+        lines.append(f"\nTotal: {num_of_workflows} workflow(s)\n")
+        self.stdout.write("".join(lines))
 
         return None
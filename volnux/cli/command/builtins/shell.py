@@ -1,5 +1,5 @@
+import importlib.util
 import sys
-import code
 from typing import Optional
 
 from ..base import BaseCommand, CommandCategory
@@ -26,9 +26,25 @@ class ShellCommand(BaseCommand):
             local_vars[workflow.name] = workflow
 
         shell_version = f"Python {sys.version} on {sys.platform}"
-
-        code.interact(
-            local=local_vars, banner=f"Volnux Shell {version} ({shell_version})"
-        )
+        banner = f"Volnux Shell {version} ({shell_version})"
+
+        # Prefer a prompt_toolkit based shell when one is installed. The specs
+        # are probed first so a missing shell costs no failed import.
+        if importlib.util.find_spec("IPython") is not None:
+            from IPython import start_ipython
+
+            self.stdout.write(f"{banner}\n")
+            start_ipython(argv=[], user_ns=local_vars)
+        elif importlib.util.find_spec("ptpython") is not None:
+            from ptpython.repl import embed
+
+            self.stdout.write(f"{banner}\n")
+            # One namespace for both, so completion indexes it once
+            embed(globals=local_vars, locals=local_vars)
+        else:
+            # code (and codeop) is only needed once the shell actually starts
+            import code
+
+            code.interact(local=local_vars, banner=banner)
 
         return None
@@ -1,14 +1,19 @@
 import re
 import argparse
-import json
+import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from volnux import __version__ as version
 
 from ..base import BaseCommand, CommandCategory, CommandError
 
+_PROJECT_NAME_RE = re.compile(r"[a-zA-Z0-9_-]+")
+
+_PROJECT_SUBDIRS = ("workflows", "commands", "logs", "tests")
+_PROJECT_PACKAGES = frozenset({"workflows", "commands", "tests"})
+
 
 class StartProjectCommand(BaseCommand):
     help = "Create a new Volnux project structure"
@@ -48,16 +53,17 @@ class StartProjectCommand(BaseCommand):
         try:
             self._create_directory_structure(project_path)
 
-            workflow_initializer_file = project_path / "init.py"
-            workflow_initializer_file.touch(exist_ok=True)
-            initialiser_content = self._get_rendered_template(
-                "workflow_initialiser_template.txt", params={}
+            initialiser_content = self._get_static_template(
+                "workflow_initialiser_template.txt"
+            )
+            self._write_files(
+                [
+                    (project_path / "init.py", initialiser_content),
+                    self._render_config_file(project_path, project_name),
+                    self._render_readme(project_path, project_name),
+                    self._render_gitignore(project_path),
+                ]
             )
-            workflow_initializer_file.write_text(initialiser_content, encoding="utf-8")
-
-            self._create_config_file(project_path, project_name)
-            self._create_readme(project_path, project_name)
-            self._create_gitignore(project_path)
 
             self._display_success_message(project_name, project_path)
 
@@ -74,7 +80,7 @@ class StartProjectCommand(BaseCommand):
             raise CommandError("Project name cannot be empty")
 
         # Check for valid characters (alphanumeric, hyphens, underscores)
-        if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+        if _PROJECT_NAME_RE.fullmatch(name) is None:
             raise CommandError(
                 f"Invalid project name '{name}'. "
                 "Use only letters, numbers, hyphens, and underscores."
@@ -92,7 +98,7 @@ class StartProjectCommand(BaseCommand):
         self, project_path: Path, project_name: str, force: bool
     ) -> None:
         """Check if project already exists and handle accordingly."""
-        if project_path.exists():
+        if os.path.lexists(project_path):
             if not force:
                 raise CommandError(
                     f"Project '{project_name}' already exists at {project_path}. "
@@ -104,59 +110,67 @@ class StartProjectCommand(BaseCommand):
 
     def _create_directory_structure(self, project_path: Path) -> None:
         """Create the project directory structure."""
-        dirs = [
-            project_path,
-            project_path / "workflows",
-            project_path / "commands",
-            project_path / "logs",
-            project_path / "tests",
-        ]
-
-        for dir_path in dirs:
-            dir_path.mkdir(parents=True, exist_ok=True)
-            if dir_path.name in ["workflows", "commands", "tests"]:
-                (dir_path / "__init__.py").touch()
-
-    def _create_config_file(self, project_path: Path, project_name: str) -> None:
-        """Create the project configuration file."""
+        root = os.fspath(project_path)
+
+        # Only the leaves are created; makedirs brings project_path along
+        for name in _PROJECT_SUBDIRS:
+            directory = os.path.join(root, name)
+            os.makedirs(directory, exist_ok=True)
+            if name in _PROJECT_PACKAGES:
+                # An empty __init__.py needs only open(O_CREAT), not touch()'s utime
+                fd = os.open(
+                    os.path.join(directory, "__init__.py"),
+                    os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0),
+                    0o644,
+                )
+                os.close(fd)
+
+    def _render_config_file(
+        self, project_path: Path, project_name: str
+    ) -> Tuple[Path, str]:
+        """Render the project configuration file."""
         config_content = self._get_rendered_template(
             "project_config.txt",
             params={"version": version, "project_name": project_name},
         )
 
-        config_file = project_path / "config.py"
-        config_file.write_text(config_content, encoding="utf-8")
+        return project_path / "config.py", config_content
 
-    def _create_readme(self, project_path: Path, project_name: str) -> None:
-        """Create the project README file."""
+    def _render_readme(
+        self, project_path: Path, project_name: str
+    ) -> Tuple[Path, str]:
+        """Render the project README file."""
         readme_content = self._get_rendered_template(
             "readme_template.txt", params={"project_name": project_name}
         )
 
-        readme_file = project_path / "README.md"
-        readme_file.write_text(readme_content, encoding="utf-8")
+        return project_path / "README.md", readme_content
 
-    def _create_gitignore(self, project_path: Path) -> None:
-        """Create a .gitignore file for the project."""
-        gitignore_content = self._get_rendered_template("gitignore_template.txt", {})
-        gitignore_file = project_path / ".gitignore"
-        gitignore_file.write_text(gitignore_content, encoding="utf-8")
+    def _render_gitignore(self, project_path: Path) -> Tuple[Path, str]:
+        """Render a .gitignore file for the project."""
+        gitignore_content = self._get_static_template("gitignore_template.txt")
+        return project_path / ".gitignore", gitignore_content
 
     def _cleanup_on_failure(self, project_path: Path) -> None:
         """Remove partially created project directory on failure."""
-        if project_path.exists():
-            try:
-                shutil.rmtree(project_path)
-                self.warning(f"Cleaned up partially created project at {project_path}")
-            except Exception as cleanup_error:
-                self.error(f"Failed to cleanup: {cleanup_error}")
+        # No existence probe: a missing directory simply means nothing to undo
+        try:
+            self._remove_scaffold_tree(project_path)
+        except FileNotFoundError:
+            pass
+        except Exception as cleanup_error:
+            self.error(f"Failed to cleanup: {cleanup_error}")
+        else:
+            self.warning(f"Cleaned up partially created project at {project_path}")
 
     def _display_success_message(self, project_name: str, project_path: Path) -> None:
         """Display success message and next steps."""
-        self.success(
-            f"\n✓ Project '{project_name}' created successfully at {project_path}!"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n✓ Project '{project_name}' created successfully at {project_path}!"
+            )
+            + "\nNext steps:\n"
+            + f"  1. cd {project_name}\n"
+            + "  2. volnux list\n"
+            + "  3. volnux run sample_workflow\n"
         )
-        self.stdout.write("\nNext steps:\n")
-        self.stdout.write(f"  1. cd {project_name}\n")
-        self.stdout.write(f"  2. volnux list\n")
-        self.stdout.write(f"  3. volnux run sample_workflow\n")
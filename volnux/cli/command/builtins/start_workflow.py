@@ -1,9 +1,9 @@
 import re
 import keyword
 import argparse
-import shutil
+import contextlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..base import BaseCommand, CommandCategory, CommandError
 from volnux import __version__ as version
@@ -12,6 +12,24 @@ from volnux.engine.workflows.loaders.utils import (
     get_workflow_class_name,
 )
 
+# A leading digit is captured rather than rejected, so one scan tells the
+# two failure modes apart. The lookahead rejects underscore-only names.
+_WORKFLOW_NAME_RE = re.compile(
+    r"(?=_*[a-zA-Z0-9])(?P<leading_digit>[0-9])?[a-zA-Z0-9_]*"
+)
+
+# Matches WORKFLOWS = [...] in a project config, with various formatting
+_WORKFLOWS_RE = re.compile(r"(WORKFLOWS\s*=\s*\[)(.*?)(\])", re.DOTALL)
+
+_INIT_TEMPLATE = (
+    '"""Workflow package initialization."""\n'
+    "# This was autogenerated by volnux {version}\n"
+    "\n"
+    "from .pipeline import {pipeline_class_name}\n"
+    "\n"
+    '__all__ = ["{pipeline_class_name}"]\n'
+)
+
 
 class StartWorkflowCommand(BaseCommand):
     """Command to scaffold a new workflow with configuration, pipeline, and event files."""
@@ -60,83 +78,104 @@ class StartWorkflowCommand(BaseCommand):
 
         # Validate workflow name
         self._validate_workflow_name(workflow_name)
+        class_name = get_workflow_class_name(workflow_name)
+        config_name = get_workflow_config_name(workflow_name)
+        workflow_path = f"workflows.{workflow_name}.workflow.{config_name}"
+        pointy_script_name = f"{class_name.lower()}.pty"
 
         # Load and validate project configuration
         project_dir = self._get_project_directory()
         workflows_dir = project_dir / "workflows"
 
         workflow_dir = workflows_dir / workflow_name
-        if workflow_dir.exists():
+
+        # Create workflow directory; mkdir itself reports what is in the way
+        try:
+            workflow_dir.mkdir()
+            created_dir = True
+        except FileExistsError:
             if not force:
                 raise CommandError(
                     f"Workflow '{workflow_name}' already exists. "
                     f"Use --force to overwrite."
                 )
+            created_dir = False
             self.stdout.write(
                 self.style.WARNING(f"Overwriting existing workflow '{workflow_name}'")
             )
-
-        # Create workflow directory
-        workflow_dir.mkdir(parents=True, exist_ok=True)
+        except (FileNotFoundError, NotADirectoryError):
+            raise CommandError(
+                f"Workflows directory not found at {workflows_dir}. "
+                f"Not in a Volnux project. Run 'volnux startproject' first."
+            )
 
         try:
-            self._create_workflow_config(workflow_dir, workflow_name, mode)
-            self._create_pipeline_file(workflow_dir, workflow_name)
+            files = [
+                self._render_workflow_config(
+                    workflow_dir, workflow_name, config_name, mode
+                ),
+                self._render_pipeline_file(workflow_dir, class_name),
+            ]
 
             if should_create_batch_pipeline:
-                self._create_batch_pipeline_file(workflow_dir, workflow_name)
+                files.append(
+                    self._render_batch_pipeline_file(workflow_dir, class_name)
+                )
+
+            files.append(self._render_events_file(workflow_dir, event_template))
+            files.append(
+                self._render_pointy_script(workflow_dir, pointy_script_name, mode)
+            )
+            files.append(self._render_init_file(workflow_dir, class_name))
 
-            self._create_events_file(workflow_dir, event_template)
-            self._create_pointy_script(workflow_dir, workflow_name, mode)
-            self._create_init_file(workflow_dir, workflow_name)
+            # Everything is rendered first, so a template error leaves no files
+            self._write_files(files)
+
+            created = ["workflow.py", "pipeline.py"]
+            if should_create_batch_pipeline:
+                created.append("batch_pipeline.py")
+            created += [f"events.py ({event_template}-based)", pointy_script_name]
+            self.stdout.write("".join(f"  Created: {name}\n" for name in created))
 
         except Exception as e:
-            # Clean up on failure
-            if workflow_dir.exists() and not force:
-                shutil.rmtree(workflow_dir)
+            # Clean up on failure, but only a directory this run created
+            if created_dir:
+                with contextlib.suppress(FileNotFoundError):
+                    self._remove_scaffold_tree(workflow_dir)
             raise CommandError(f"Failed to create workflow: {str(e)}")
 
         try:
-            self._register_workflow_in_config(project_dir, workflow_name)
+            self._register_workflow_in_config(project_dir, workflow_path)
         except Exception as e:
             self.stdout.write(
                 self.style.WARNING(
-                    f"Warning: Could not automatically register workflow in config.py: {str(e)}"
-                )
-            )
-            self.stdout.write(
-                self.style.WARNING(
-                    f"Please manually add 'workflows.{workflow_name}.workflow.{get_workflow_config_name(workflow_name)}' "
-                    f"to WORKFLOWS list in config.py"
+                    f"Warning: Could not automatically register workflow in config.py: {str(e)}\n"
+                    f"Please manually add '{workflow_path}' to WORKFLOWS list in config.py\n"
                 )
             )
 
-        # Success message
-        self.success(f"Workflow '{workflow_name}' created successfully!")
-        self.stdout.write(f"\nWorkflow structure:\n")
-        self.stdout.write(f"  workflows/{workflow_name}/\n")
-        self.stdout.write(f"    ├── __init__.py\n")
-        self.stdout.write(f"    ├── workflow.py\n")
-        self.stdout.write(f"    ├── pipeline.py\n")
+        # Success message, emitted with a single write
+        workflow_rel = f"workflows/{workflow_name}"
+        lines = [
+            self.style.SUCCESS(f"Workflow '{workflow_name}' created successfully!"),
+            f"\nWorkflow structure:\n",
+            f"  {workflow_rel}/\n",
+            f"    ├── __init__.py\n",
+            f"    ├── workflow.py\n",
+            f"    ├── pipeline.py\n",
+        ]
         if should_create_batch_pipeline:
-            self.stdout.write(f"    ├── batch_pipeline.py\n")
-        self.stdout.write(f"    ├── events.py\n")
-        self.stdout.write(
-            f"    └── {get_workflow_class_name(workflow_name).lower()}.pty\n"
-        )
-        self.stdout.write(f"\nNext steps:\n")
-        self.stdout.write(
-            f"  1. Edit workflow configuration: workflows/{workflow_name}/workflow.py\n"
-        )
-        self.stdout.write(
-            f"  2. Define pipeline logic: workflows/{workflow_name}/pipeline.py\n"
-        )
-        self.stdout.write(
-            f"  3. Configure events: workflows/{workflow_name}/events.py\n"
-        )
-        self.stdout.write(
-            f"  4. Define structure of your workflow: workflows/{workflow_name}/{get_workflow_class_name(workflow_name).lower()}.pty\n"
-        )
+            lines.append(f"    ├── batch_pipeline.py\n")
+        lines += [
+            f"    ├── events.py\n",
+            f"    └── {pointy_script_name}\n",
+            f"\nNext steps:\n",
+            f"  1. Edit workflow configuration: {workflow_rel}/workflow.py\n",
+            f"  2. Define pipeline logic: {workflow_rel}/pipeline.py\n",
+            f"  3. Configure events: {workflow_rel}/events.py\n",
+            f"  4. Define structure of your workflow: {workflow_rel}/{pointy_script_name}\n",
+        ]
+        self.stdout.write("".join(lines))
 
         return None
 
@@ -145,13 +184,14 @@ class StartWorkflowCommand(BaseCommand):
         if not name:
             raise CommandError("Workflow name cannot be empty")
 
-        if not name.replace("_", "").isalnum():
+        match = _WORKFLOW_NAME_RE.fullmatch(name)
+        if match is None:
             raise CommandError(
                 f"Invalid workflow name '{name}'. "
                 f"Use only letters, numbers, and underscores."
             )
 
-        if name[0].isdigit():
+        if match["leading_digit"]:
             raise CommandError(f"Workflow name '{name}' cannot start with a digit")
 
         # Check for reserved Python keywords
@@ -173,64 +213,56 @@ class StartWorkflowCommand(BaseCommand):
                 "Run 'volnux startproject' first."
             )
 
-        workflows_dir = project_dir / "workflows"
-        if not workflows_dir.exists():
-            raise CommandError(
-                f"Workflows directory not found at {workflows_dir}. "
-                f"Not in a Volnux project. Run 'volnux startproject' first."
-            )
-
         return project_dir
 
-    def _create_workflow_config(
-        self, workflow_dir: Path, workflow_name: str, mode: str
-    ) -> None:
-        """Create workflow configuration file."""
+    def _render_workflow_config(
+        self, workflow_dir: Path, workflow_name: str, config_name: str, mode: str
+    ) -> Tuple[Path, str]:
+        """Render the workflow configuration file."""
         workflow_config_file = workflow_dir / "workflow.py"
 
         workflow_script_content = self._get_rendered_template(
             "workflow_config_template.txt",
             params={
-                "workflow_config_class_name": get_workflow_config_name(workflow_name),
+                "workflow_config_class_name": config_name,
                 "workflow_name": workflow_name,
                 "workflow_version": version,
                 "mode": mode,
             },
         )
-        workflow_config_file.write_text(workflow_script_content, encoding="utf-8")
-        self.stdout.write(f"  Created: workflow.py")
+        return workflow_config_file, workflow_script_content
 
-    def _create_pipeline_file(self, workflow_dir: Path, workflow_name: str) -> None:
-        """Create pipeline file."""
+    def _render_pipeline_file(
+        self, workflow_dir: Path, class_name: str
+    ) -> Tuple[Path, str]:
+        """Render the pipeline file."""
         pipeline_file = workflow_dir / "pipeline.py"
 
         pipeline_script_content = self._get_rendered_template(
             "pipeline_template.txt",
-            params={"template_pipeline_name": get_workflow_class_name(workflow_name)},
+            params={"template_pipeline_name": class_name},
         )
-        pipeline_file.write_text(pipeline_script_content, encoding="utf-8")
-        self.stdout.write(f"  Created: pipeline.py")
+        return pipeline_file, pipeline_script_content
 
-    def _create_batch_pipeline_file(
-        self, workflow_dir: Path, workflow_name: str
-    ) -> None:
-        """Create batch pipeline file."""
+    def _render_batch_pipeline_file(
+        self, workflow_dir: Path, class_name: str
+    ) -> Tuple[Path, str]:
+        """Render the batch pipeline file."""
         batch_pipeline_file = workflow_dir / "batch_pipeline.py"
 
         batch_pipeline_script_content = self._get_rendered_template(
             "batch_pipeline_template.txt",
             params={
-                "template_pipeline_name": get_workflow_class_name(workflow_name),
-                "template_batch_pipeline": (
-                    get_workflow_class_name(workflow_name) + "Batch"
-                ),
+                "template_pipeline_name": class_name,
+                "template_batch_pipeline": class_name + "Batch",
             },
         )
-        batch_pipeline_file.write_text(batch_pipeline_script_content, encoding="utf-8")
-        self.stdout.write(f"  Created: batch_pipeline.py")
+        return batch_pipeline_file, batch_pipeline_script_content
 
-    def _create_events_file(self, workflow_dir: Path, event_template: str) -> None:
-        """Create an events file based on a template type."""
+    def _render_events_file(
+        self, workflow_dir: Path, event_template: str
+    ) -> Tuple[Path, str]:
+        """Render an events file based on a template type."""
         events_file = workflow_dir / "events.py"
 
         template_name = (
@@ -239,58 +271,56 @@ class StartWorkflowCommand(BaseCommand):
             else "class_based_events_template.txt"
         )
 
-        events_script_content = self._get_rendered_template(template_name, params={})
-        events_file.write_text(events_script_content, encoding="utf-8")
-        self.stdout.write(f"  Created: events.py ({event_template}-based)")
+        events_script_content = self._get_static_template(template_name)
+        return events_file, events_script_content
 
-    def _create_pointy_script(
-        self, workflow_dir: Path, workflow_name: str, mode: str
-    ) -> None:
-        """Create a pointy script file."""
-        pointy_script_file = (
-            workflow_dir / f"{get_workflow_class_name(workflow_name).lower()}.pty"
-        )
+    def _render_pointy_script(
+        self, workflow_dir: Path, script_name: str, mode: str
+    ) -> Tuple[Path, str]:
+        """Render a pointy script file."""
+        pointy_script_file = workflow_dir / script_name
 
-        pointy_script_content = self._get_rendered_template(
-            "pointy_template.txt", params={"mode": mode}
+        pointy_script_content = self._get_static_template(
+            "pointy_template.txt", mode=mode
         )
-        pointy_script_file.write_text(pointy_script_content, encoding="utf-8")
-        self.stdout.write(
-            f"  Created: {get_workflow_class_name(workflow_name).lower()}.py"
+        return pointy_script_file, pointy_script_content
+
+    def _render_init_file(
+        self, workflow_dir: Path, pipeline_class_name: str
+    ) -> Tuple[Path, str]:
+        """Render __init__.py to make the workflow directory a Python package."""
+        init_content = _INIT_TEMPLATE.format(
+            version=version, pipeline_class_name=pipeline_class_name
         )
-
-    def _create_init_file(self, workflow_dir: Path, workflow_name: str) -> None:
-        """Create __init__.py to make the workflow directory a Python package."""
-        init_file = workflow_dir / "__init__.py"
-        pipeline_class_name = get_workflow_class_name(workflow_name)
-
-        init_content = f'''"""Workflow package initialization."""
-# This was autogenerated by volnux {version}
-
-from .pipeline import {pipeline_class_name}
-
-__all__ = ["{pipeline_class_name}"]
-        '''
-        init_file.write_text(init_content, encoding="utf-8")
+        return workflow_dir / "__init__.py", init_content
 
     def _register_workflow_in_config(
-        self, project_dir: Path, workflow_name: str
+        self, project_dir: Path, workflow_path: str
     ) -> None:
-        """Register the workflow in config.py WORKFLOWS list."""
+        """Register the workflow's dotted config path in config.py WORKFLOWS list."""
         config_file = project_dir / "config.py"
 
         if not config_file.exists():
             raise FileNotFoundError(f"config.py not found at {config_file}")
 
-        # Read the config file
-        config_content = config_file.read_text(encoding="utf-8")
+        # Read the config file. Bytes in and out: no text layer, and the
+        # file's own line endings are preserved rather than translated
+        config_content = config_file.read_bytes().decode("utf-8")
+        newline = "\r\n" if "\r\n" in config_content else "\n"
 
-        # Generate the dotted path notation
-        workflow_config_class = get_workflow_config_name(workflow_name)
-        workflow_path = f"workflows.{workflow_name}.workflow.{workflow_config_class}"
+        match = _WORKFLOWS_RE.search(config_content)
 
-        # Check if the workflow is already registered
-        if workflow_path in config_content:
+        if not match:
+            raise ValueError("WORKFLOWS list not found in config.py")
+
+        before, workflows_content, after = match.groups()
+
+        # Check if the workflow is already registered; only an entry of the
+        # list counts, not a mention elsewhere in the file
+        if (
+            f'"{workflow_path}"' in workflows_content
+            or f"'{workflow_path}'" in workflows_content
+        ):
             self.stdout.write(
                 self.style.WARNING(
                     f"Workflow '{workflow_path}' already registered in config.py"
@@ -298,16 +328,6 @@ __all__ = ["{pipeline_class_name}"]
             )
             return
 
-        # Pattern to match WORKFLOWS = [...] with various formatting
-        workflows_pattern = r"(WORKFLOWS\s*=\s*\[)(.*?)(\])"
-
-        match = re.search(workflows_pattern, config_content, re.DOTALL)
-
-        if not match:
-            raise ValueError("WORKFLOWS list not found in config.py")
-
-        before, workflows_content, after = match.groups()
-
         # Check if the list is empty or has items
         workflows_content = workflows_content.strip()
 
@@ -315,18 +335,31 @@ __all__ = ["{pipeline_class_name}"]
             # List has items, add comma and new workflow
             # Remove trailing comma if it exists
             workflows_content = workflows_content.rstrip(",").strip()
-            new_workflows_content = f'{workflows_content},\n    "{workflow_path}",\n'
+            new_workflows_content = (
+                f'{workflows_content},{newline}    "{workflow_path}",{newline}'
+            )
         else:
             # Empty list, just add the workflow
-            new_workflows_content = f'\n    "{workflow_path}",\n'
-
-        # Reconstruct the file content
-        new_config_content = config_content.replace(
-            match.group(0), f"{before}{new_workflows_content}{after}"
+            new_workflows_content = f'{newline}    "{workflow_path}",{newline}'
+
+        # Splice the new list in at the matched span, so no second scan is
+        # needed and an identical list elsewhere in the file is left alone
+        start, end = match.span()
+        new_config_content = "".join(
+            (
+                config_content[:start],
+                before,
+                new_workflows_content,
+                after,
+                config_content[end:],
+            )
         )
 
         # Write back to config.py
-        config_file.write_text(new_config_content, encoding="utf-8")
+        config_file.write_bytes(new_config_content.encode("utf-8"))
+        # A same-size rewrite within the mtime granularity would otherwise
+        # still hit the cached module
+        self.invalidate_project_config()
 
         self.stdout.write(
             self.style.SUCCESS(f"✓ Registered '{workflow_path}' in config.py")
@@ -1,7 +1,7 @@
 class Style:
     """Terminal styling helper."""
 
-    # ANSI color codes
+    # ANSI color codes, inlined as literals in the methods below
     COLORS = {
         "SUCCESS": "\033[92m",
         "WARNING": "\033[93m",
@@ -12,16 +12,16 @@ class Style:
     }
 
     def SUCCESS(self, text: str) -> str:
-        return f"{self.COLORS['SUCCESS']}{text}{self.COLORS['RESET']}"
+        return f"\033[92m{text}\033[0m"
 
     def WARNING(self, text: str) -> str:
-        return f"{self.COLORS['WARNING']}{text}{self.COLORS['RESET']}"
+        return f"\033[93m{text}\033[0m"
 
     def ERROR(self, text: str) -> str:
-        return f"{self.COLORS['ERROR']}{text}{self.COLORS['RESET']}"
+        return f"\033[91m{text}\033[0m"
 
     def NOTICE(self, text: str) -> str:
-        return f"{self.COLORS['NOTICE']}{text}{self.COLORS['RESET']}"
+        return f"\033[94m{text}\033[0m"
 
     def BOLD(self, text: str) -> str:
-        return f"{self.COLORS['BOLD']}{text}{self.COLORS['RESET']}"
+        return f"\033[1m{text}\033[0m"
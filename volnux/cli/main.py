@@ -5,6 +5,7 @@ from typing import List, Optional
 from volnux import __version__ as version
 
 from .command.base import get_command_registry
+from .command.builtins import load_builtin_command, load_builtin_commands
 from .command.style import Style
 
 
@@ -41,6 +42,7 @@ class VolnuxCLI:
             return
 
         command_name = args.command
+        load_builtin_command(command_name)
         command_class = self.loader.get_by_name(command_name)
 
         if not command_class:
@@ -63,11 +65,10 @@ class VolnuxCLI:
         print("Usage: volnux <command> [options]\n")
         print(f"{self.style.BOLD('Available commands:')}\n")
 
-        commands = self.loader.list_all_classes()
-        for cmd_name in commands:
-            cmd = self.loader.get_by_name(cmd_name)
-            help_text = cmd.help if cmd else ""
-            print(f"  {cmd_name:<20} {help_text}")
+        load_builtin_commands()
+        commands = sorted(self.loader.list_all_classes(), key=lambda cmd: cmd.name)
+        for cmd in commands:
+            print(f"  {cmd.name:<20} {cmd.help}")
 
         print(
             f"\nUse 'volnux <command> --help' for more information on a specific command.\n"
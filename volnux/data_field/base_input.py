@@ -21,6 +21,11 @@ class CacheInstanceFieldMixin:
         raise NotImplementedError
 
     def set_field_cache_value(self, instance: "Pipeline", value: typing.Any) -> None:
+        pending_writes = instance.__dict__.get("_pending_field_writes")
+        if pending_writes is not None:
+            # The pipeline is initialising and will flush these in one batch
+            pending_writes[self.get_cache_key()] = value
+            return
         instance.get_pipeline_state().set_cache_for_pipeline_field(
             instance, self.get_cache_key(), value
         )
@@ -359,7 +364,7 @@ class InputDataField(CacheInstanceFieldMixin):
         Returns:
             Field name as cache key
         """
-        return typing.cast(str, self.name)
+        return self.name  # type: ignore
 
     @property
     def has_batch_operation(self) -> bool:
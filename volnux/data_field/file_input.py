@@ -34,6 +34,10 @@ class FileInputDataField(InputDataField):
             batch_processor=batch_defaults.file_stream_batch_processor,
         )
 
+    @property
+    def _proxy_cache_key(self) -> str:
+        return f"__fileproxy__{self.name}"
+
     def __set__(self, instance: object, value: typing.Any) -> None:
         """
         Set the file path, validating that it exists and is a file.
@@ -48,6 +52,10 @@ class FileInputDataField(InputDataField):
         if value is not None and not os.path.isfile(value):
             raise ValueError(f"Path '{value}' is not a file or does not exist")
 
+        proxy = instance.__dict__.pop(self._proxy_cache_key, None)  # type: ignore
+        if proxy is not None and proxy.file_path != value:
+            proxy.close()
+
         super().__set__(instance, value)
 
     def __get__(
@@ -64,7 +72,8 @@ class FileInputDataField(InputDataField):
             An open file object or None if no path is set
 
         Note:
-            The caller is responsible for closing the file when done
+            The caller is responsible for closing the file when done. The proxy is
+            cached on the instance and reused until it is closed or the path changes.
         """
         if instance is None:
             return self  # type: ignore
@@ -72,10 +81,16 @@ class FileInputDataField(InputDataField):
         value: typing.Union[str, os.PathLike[str]] = super().__get__(instance, owner)
 
         if value:
+            proxy = instance.__dict__.get(self._proxy_cache_key)
+            if proxy is not None and proxy.file_path == value and not proxy.closed:
+                return proxy
+
             kwargs: typing.Dict[str, typing.Any] = {}
             if "b" not in self.mode and self.encoding is not None:
                 kwargs["encoding"] = self.encoding
 
-            return FileProxy(file_path=value, mode=self.mode, **kwargs)
+            proxy = FileProxy(file_path=value, mode=self.mode, **kwargs)
+            instance.__dict__[self._proxy_cache_key] = proxy
+            return proxy
 
         return None
@@ -1,7 +1,11 @@
 import os
+import stat
 import typing
+import weakref
 from types import TracebackType
 
+from volnux.default_batch_processors import DEFAULT_FILE_BUFFER_SIZE
+
 T = typing.TypeVar("T")
 
 if typing.TYPE_CHECKING:
@@ -53,11 +57,21 @@ class FileProxy:
         self._file: typing.Optional[typing.Any] = None
         self._closed = False
 
+        # Closes the file if the proxy is collected while it is still open
+        self._finalizer: typing.Optional[weakref.finalize] = None
+
     def __repr__(self) -> str:
         """Return string representation of the FileProxy."""
         status = "closed" if self.closed else "open" if self._file else "unopened"
         return f"<FileProxy {self.file_path} ({status})>"
 
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # Open handles cannot be pickled, the copy reopens the file lazily
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_finalizer"] = None
+        return state
+
     def _ensure_open(self) -> typing.Any:
         """
         Ensure the file is open, opening it if necessary.
@@ -74,26 +88,43 @@ class FileProxy:
         if self._file is None:
             kwargs = {
                 "mode": self.mode,
-                "buffering": self.buffering,
+                "buffering": self._get_buffer_size(),
                 "closefd": self.closefd,
                 "opener": self.opener,
             }
 
-            if "b" not in self.mode:
+            if not self._is_binary:
                 # Only add the text-specific arguments if they are supported by the mode
                 kwargs["encoding"] = self.encoding
                 kwargs["errors"] = self.errors
                 kwargs["newline"] = self.newline
 
             self._file = open(self.file_path, **kwargs)  # type: ignore
+            self._finalizer = weakref.finalize(self, self._file.close)
 
         return self._file
 
+    def _get_buffer_size(self) -> int:
+        """
+        Resolve the buffering policy. The default policy (-1) uses a buffer of at least
+        DEFAULT_FILE_BUFFER_SIZE, aligned to the file's block size when it is larger.
+        """
+        if self.buffering != -1:
+            return self.buffering
+        try:
+            block_size = os.stat(self.file_path).st_blksize
+        except (OSError, ValueError):
+            block_size = 0
+        return max(DEFAULT_FILE_BUFFER_SIZE, block_size)
+
     @property
     def closed(self) -> bool:
         return self._closed or (self._file is not None and self._file.closed)
 
     def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
         if self._file is not None and not self._file.closed:
             self._file.close()
         self._closed = True
@@ -112,10 +143,6 @@ class FileProxy:
         """Context manager exit - ensures file is closed."""
         self.close()
 
-    def __del__(self) -> None:
-        """Destructor - ensures file is closed when object is garbage collected."""
-        self.close()
-
     # File object methods
     def read(self, size: typing.Optional[int] = None) -> typing.Union[str, bytes]:
         """
@@ -127,9 +154,10 @@ class FileProxy:
         Returns:
             The read content
         """
-        if size is not None and isinstance(size, int) and size > 0:
-            self._ensure_open().read(size)
-        return self._ensure_open().read()  # type: ignore
+        file = self._ensure_open()
+        if size is not None and size > 0:
+            return file.read(size)  # type: ignore
+        return file.read()  # type: ignore
 
     def readline(self, size: int = -1) -> typing.Union[str, bytes]:
         return self._ensure_open().readline(size)  # type: ignore
@@ -169,7 +197,20 @@ class FileProxy:
     def fileno(self) -> int:
         return self._ensure_open().fileno()  # type: ignore
 
+    def _stat_mode(self) -> typing.Optional[int]:
+        """Return the st_mode of the unopened file, or None if it can't be stat'ed."""
+        if self._file is not None:
+            return None
+        try:
+            return os.stat(self.file_path).st_mode
+        except (OSError, ValueError):
+            return None
+
     def isatty(self) -> bool:
+        mode = self._stat_mode()
+        if mode is not None and not stat.S_ISCHR(mode):
+            # Only character devices can be terminals
+            return False
         return self._ensure_open().isatty()  # type: ignore
 
     @property
@@ -183,23 +224,30 @@ class FileProxy:
     @mode.setter
     def mode(self, value: str) -> None:
         self._mode = value
+        # The mode flags are derived once here rather than on every I/O call
+        self._is_binary = "b" in value
+        self._readable = "r" in value or "+" in value
+        self._writable = "w" in value or "a" in value or "+" in value
 
     def readable(self) -> bool:
-        return "r" in self.mode or "+" in self.mode
+        return self._readable
 
     def writable(self) -> bool:
-        return "w" in self.mode or "a" in self.mode or "+" in self.mode
+        return self._writable
 
     def seekable(self) -> bool:
         if self._file is not None:
             return self._file.seekable()  # type: ignore
+        mode = self._stat_mode()
+        if mode is not None:
+            return stat.S_ISREG(mode) or stat.S_ISBLK(mode)
         # Most files are seekable, but we can't know for sure until opened
         return True
 
     # Iterator protocol
     def __iter__(self) -> typing.Iterator[typing.AnyStr]:
         """Return self as an iterator."""
-        return typing.cast(typing.Iterator[typing.AnyStr], self)
+        return self  # type: ignore
 
     def __next__(self) -> typing.AnyStr:  # type: ignore
         """Return the next line or raise StopIteration."""
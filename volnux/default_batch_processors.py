@@ -27,6 +27,12 @@ DEFAULT_BATCH_SIZE: typing.Final[int] = 100
 
 DEFAULT_CHUNK_SIZE: typing.Final[int] = 10240  # 10K
 
+# Buffer size used when opening files for streaming
+DEFAULT_FILE_BUFFER_SIZE: typing.Final[int] = 128 * 1024  # 128K
+
+# Number of chunks fetched from the stream by a single read call
+DEFAULT_READ_AHEAD_CHUNKS: typing.Final[int] = 16
+
 
 def list_batch_processor(
     values: typing.Collection[typing.Any], batch_size: int = DEFAULT_BATCH_SIZE
@@ -53,9 +59,11 @@ def file_stream_batch_processor(
     Reads a file-like stream in fixed-size chunks and yields each chunk as a generator.
 
     This is useful for processing large files or data streams in memory-efficient batches.
+    DEFAULT_READ_AHEAD_CHUNKS chunks are fetched per read call so that the number of
+    reads issued to the stream drops by that factor.
 
     Args:
-        values (IOBase): A readable file-like object (e.g., open file, BytesIO, etc.).
+        values (IOBase): A readable file-like object (e.g., open file, BytesIO, FileProxy).
         chunk_size (int): The number of bytes to read at a time. Defaults to DEFAULT_CHUNK_SIZE.
 
     Yields:
@@ -64,14 +72,24 @@ def file_stream_batch_processor(
     Raises:
         ValueError: If the provided object is not a readable stream.
     """
-    if isinstance(values, IOBase):
+    # Duck-typed so that every file proxy (volnux.fields, volnux.data_field)
+    # is accepted alongside real streams
+    if isinstance(values, IOBase) or all(
+        callable(getattr(values, name, None)) for name in ("read", "readable", "seek")
+    ):
         if not values.readable():
             raise ValueError(f"'{values}' is not a readable stream")
         values.seek(0, 0)
+        block_size = chunk_size * DEFAULT_READ_AHEAD_CHUNKS
+        read = values.read
         while True:
-            chunk = values.read(chunk_size)
-            if not chunk:
+            block = read(block_size)
+            if not block:
                 break
-            yield chunk
+            if len(block) <= chunk_size:
+                yield block
+                continue
+            for start in range(0, len(block), chunk_size):
+                yield block[start : start + chunk_size]
     else:
         raise ValueError(f"'{values}' is not a file stream")
@@ -40,6 +40,8 @@ class WorkflowEngine(ABC):
     Engines delegate actual task execution, metrics, and hooks to ExecutionContext and Coordinator.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(
         self,
@@ -14,16 +14,19 @@ from .base import EngineExecutionResult, EngineResult, TaskNode, WorkflowEngine
 
 logger = logging.getLogger(__name__)
 
+# Execution statuses that stop the workflow early
+_TERMINAL_STATUSES = frozenset({ExecutionStatus.CANCELLED, ExecutionStatus.ABORTED})
+
 
 class DefaultWorkflowEngine(WorkflowEngine):
     """
     Default iterative workflow execution engine.
 
-    This engine uses a queue-based breadth-first traversal strategy to execute
-    workflows without recursion, preventing stack overflow issues.
+    This engine drives the workflow from an explicit work stack instead of
+    recursing on every task transition, preventing stack overflow issues.
 
     Orchestration Strategy:
-    - Queue-based task scheduling (LIFO for depth-first behavior)
+    - Work-stack task scheduling (LIFO for depth-first behavior)
     - Parallel task detection and grouping
     - Conditional branching evaluation
     - Dynamic task switching support
@@ -35,8 +38,13 @@ class DefaultWorkflowEngine(WorkflowEngine):
     - Metrics collection → ExecutionContext
     - Hook invocation → ExecutionContext
     - Error handling → ExecutionContext
+
+    The engine only holds its configuration; all per-run state lives in
+    ``execute`` locals, so one instance can be shared across threads.
     """
 
+    __slots__ = ("enable_debug_logging", "strict_mode")
+
     def __init__(
         self,
         enable_debug_logging: bool = False,
@@ -61,18 +69,18 @@ class DefaultWorkflowEngine(WorkflowEngine):
         pipeline: Pipeline,
     ) -> EngineResult:
         """
-        Execute workflow using iterative queue-based traversal.
+        Execute workflow using iterative work-stack traversal.
 
         Flow:
-        1. Initialize work queue with root task
-        2. Process tasks from queue (LIFO for depth-first)
+        1. Initialize work stack with root task
+        2. Pop tasks from the stack (LIFO for depth-first)
         3. Detect parallelism and group parallel tasks
         4. Create execution context and chain to previous
         5. Delegate execution to context (context handles hooks/metrics)
         6. Evaluate execution state for early termination
         7. Handle dynamic task switching
         8. Evaluate conditionals and determine next task
-        9. Schedule next task in queue
+        9. Push next task onto the stack
         10. Process deferred sink nodes
 
         Args:
@@ -89,9 +97,9 @@ class DefaultWorkflowEngine(WorkflowEngine):
                 status=EngineExecutionResult.COMPLETED, tasks_processed=0
             )
 
-        # Work queue: (task, previous_context)
-        queue: typing.Deque[TaskNode] = deque()
-        queue.append(TaskNode(root_task, None))
+        # Work stack: (task, previous_context)
+        work_stack: typing.Deque[TaskNode] = deque()
+        work_stack.append(TaskNode(root_task, None))
 
         # Deferred sink nodes
         sink_queue: typing.Deque[TaskType] = deque()
@@ -101,21 +109,23 @@ class DefaultWorkflowEngine(WorkflowEngine):
         execution_error: typing.Optional[Exception] = None
 
         try:
-            while queue:
-                executable_node = queue.popleft()
+            while work_stack:
+                executable_node = work_stack.pop()
+                task = executable_node.task
+                previous_context = executable_node.previous_context
                 tasks_processed += 1
 
                 if self.enable_debug_logging:
-                    logger.debug(f"[Engine] Processing task: {executable_node.task}")
+                    logger.debug(f"[Engine] Processing task: {task}")
 
                 try:
                     # Detect parallelism
-                    parallel_tasks = self._detect_parallel_tasks(executable_node.task)
+                    parallel_tasks = self._detect_parallel_tasks(task)
 
                     execution_context = self._build_context(
-                        task=executable_node.task,
+                        task=task,
                         pipeline=pipeline,
-                        previous_context=executable_node.previous_context,
+                        previous_context=previous_context,
                         parallel_tasks=parallel_tasks,
                         sink_queue=sink_queue,
                     )
@@ -136,26 +146,24 @@ class DefaultWorkflowEngine(WorkflowEngine):
 
                     # Handle task switching
                     switched = self._handle_task_switch(
-                        task=executable_node.task,
+                        task=task,
                         execution_state=execution_state,
-                        previous_context=executable_node.previous_context,
-                        queue=queue,
+                        previous_context=previous_context,
+                        work_stack=work_stack,
                     )
                     if switched:
                         continue
 
                     # Determine next task
-                    next_task = self._resolve_next_task(
-                        executable_node.task, execution_context
-                    )
+                    next_task = self._resolve_next_task(task, execution_context)
 
                     # Schedule next task
                     if next_task:
-                        queue.appendleft(TaskNode(next_task, execution_context))
+                        work_stack.append(TaskNode(next_task, execution_context))
 
                 except Exception as e:
                     logger.error(
-                        f"[Engine] Error processing task {executable_node.task}: {e}",
+                        f"[Engine] Error processing task {task}: {e}",
                         exc_info=True,
                     )
                     execution_error = e
@@ -210,12 +218,14 @@ class DefaultWorkflowEngine(WorkflowEngine):
 
         parallel_tasks = set()
         current = task
+        parallelism = PipeType.PARALLELISM
 
-        while (
-            current and current.condition_node.on_success_pipe == PipeType.PARALLELISM
-        ):
+        while current:
+            condition_node = current.condition_node
+            if condition_node.on_success_pipe is not parallelism:
+                break
             parallel_tasks.add(current)
-            current = current.condition_node.on_success_event
+            current = condition_node.on_success_event
 
         # Include final task in parallel chain
         if parallel_tasks and current:
@@ -260,8 +270,9 @@ class DefaultWorkflowEngine(WorkflowEngine):
             pipeline.execution_context = context
         else:
             # Collect sink nodes for deferred execution
-            if task.sink_node:
-                sink_queue.append(task.sink_node)
+            sink_node = task.sink_node
+            if sink_node:
+                sink_queue.append(sink_node)
 
             # Link context chain
             context.previous_context = previous_context
@@ -279,10 +290,7 @@ class DefaultWorkflowEngine(WorkflowEngine):
         Returns:
             True if execution should terminate early
         """
-        should_stop = execution_state.status in {
-            ExecutionStatus.CANCELLED,
-            ExecutionStatus.ABORTED,
-        }
+        should_stop = execution_state.status in _TERMINAL_STATUSES
 
         if should_stop and self.enable_debug_logging:
             logger.debug(f"[Engine] Early termination: {execution_state.status}")
@@ -299,7 +307,7 @@ class DefaultWorkflowEngine(WorkflowEngine):
         self,
         task: TaskType,
         execution_state: ExecutionState,
-        queue: typing.Deque[TaskNode],
+        work_stack: typing.Deque[TaskNode],
         previous_context: typing.Optional[ExecutionContext] = None,
     ) -> bool:
         """
@@ -312,7 +320,7 @@ class DefaultWorkflowEngine(WorkflowEngine):
             task: Current task
             execution_state: State with potential switch request
             previous_context: Context to reuse for switched task
-            queue: Work queue to prepend switched task
+            work_stack: Work stack to push switched task onto
 
         Returns:
             True if switch occurred, False otherwise
@@ -322,10 +330,10 @@ class DefaultWorkflowEngine(WorkflowEngine):
         """
         switch_request = execution_state.get_switch_request()
 
-        if not switch_request or not switch_request.descriptor_configured:  # type: ignore
+        if not switch_request or not switch_request.descriptor_configured:
             return False
 
-        next_task = task.get_descriptor(switch_request.next_task_descriptor)  # type: ignore
+        next_task = task.get_descriptor(switch_request.next_task_descriptor)
 
         if next_task is None:
             raise TaskSwitchingError(
@@ -335,10 +343,12 @@ class DefaultWorkflowEngine(WorkflowEngine):
             )
 
         # Schedule switched task
-        queue.appendleft(TaskNode(next_task, previous_context))
+        work_stack.append(TaskNode(next_task, previous_context))
 
         if self.enable_debug_logging:
-            logger.debug(f"[Engine] Switched to descriptor: {switch_request.next_task_descriptor}")  # type: ignore
+            logger.debug(
+                f"[Engine] Switched to descriptor: {switch_request.next_task_descriptor}"
+            )
 
         return True
 
@@ -382,10 +392,11 @@ class DefaultWorkflowEngine(WorkflowEngine):
             logger.error(f"[Engine] Conditional task has no result: {task}")
             return None
 
+        condition_node = task.condition_node
         next_task = (
-            task.condition_node.on_failure_event
-            if not result.success
-            else task.condition_node.on_success_event
+            condition_node.on_success_event
+            if result.success
+            else condition_node.on_failure_event
         )
 
         if self.enable_debug_logging:
@@ -425,7 +436,8 @@ class DefaultWorkflowEngine(WorkflowEngine):
         Execute deferred sink nodes.
 
         Sink nodes are executed after main workflow completes,
-        typically for cleanup or finalization tasks.
+        typically for cleanup or finalization tasks. A sink shared by
+        several tasks (e.g. a join) is executed only once.
 
         Args:
             sink_queue: Queue of accumulated sink nodes
@@ -437,8 +449,13 @@ class DefaultWorkflowEngine(WorkflowEngine):
         if self.enable_debug_logging:
             logger.debug(f"[Engine] Processing {len(sink_queue)} sink nodes")
 
+        executed_sinks: typing.Set[int] = set()
+
         while sink_queue:
             sink_task = sink_queue.popleft()
+            if id(sink_task) in executed_sinks:
+                continue
+            executed_sinks.add(id(sink_task))
 
             try:
                 # Create standalone context for sink node
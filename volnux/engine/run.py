@@ -1,18 +1,22 @@
 from volnux.parser.protocols import TaskType
 from volnux.pipeline import Pipeline
 
-from .base import EngineExecutionResult
+from .base import EngineExecutionResult, EngineResult
 from .default_engine import DefaultWorkflowEngine
 
-# Global default engine instance
+# Global default engine instance, shared by all threads (it holds no run state)
 _default_engine = DefaultWorkflowEngine(strict_mode=True)
 
 
 def run_workflow(
     root_task: TaskType,
     pipeline: Pipeline,
-) -> None:
+) -> EngineResult:
     result = _default_engine.execute(root_task, pipeline)
 
-    if result.status == EngineExecutionResult.FAILED and result.error:
-        raise result.error
+    if result.status is EngineExecutionResult.FAILED:
+        error = result.error
+        if error is not None:
+            raise error
+
+    return result
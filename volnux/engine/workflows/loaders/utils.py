@@ -1,8 +1,13 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
 def get_workflow_class_name(workflow_name: str) -> str:
     """Convert workflow name to workflow class name"""
-    return "".join(word.capitalize() for word in workflow_name.split("_"))
+    return "".join(map(str.capitalize, workflow_name.split("_")))
 
 
+@lru_cache(maxsize=256)
 def get_workflow_config_name(workflow_name: str) -> str:
     """Convert a workflow name to its corresponding WorkflowConfig class name."""
     return get_workflow_class_name(workflow_name) + "Config"
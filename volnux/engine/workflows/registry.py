@@ -228,20 +228,23 @@ class WorkflowRegistry:
         """
         workflows_dir = project_dir / "workflows"
 
-        for workflows_dir in workflows_dir.iterdir():
-            if workflows_dir.is_dir():
-                dirname = workflows_dir.name
-
-                local = WorkflowSource(
-                    name=dirname,
-                    location=workflows_dir,  # type: ignore
-                    source_type=RegistrySource.LOCAL,
-                    version=version,
-                )
-                self._workflow_local_sources[dirname] = local
-
-                if workflow_name is not None and workflow_name == dirname:
-                    break
+        # scandir reports entry types from the directory listing itself, so
+        # there is no stat call per entry
+        with os.scandir(workflows_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirname = entry.name
+
+                    local = WorkflowSource(
+                        name=dirname,
+                        location=Path(entry.path),  # type: ignore
+                        source_type=RegistrySource.LOCAL,
+                        version=version,
+                    )
+                    self._workflow_local_sources[dirname] = local
+
+                    if workflow_name is not None and workflow_name == dirname:
+                        break
 
     def load_workflow_configs(self) -> None:
         """
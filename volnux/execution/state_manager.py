@@ -56,7 +56,7 @@ class ExecutionState:
                 return err
         return None
 
-    def get_switch_request(self) -> typing.Optional[Exception]:
+    def get_switch_request(self) -> typing.Optional[SwitchTask]:
         """Check for SwitchTask in errors"""
         for err in self.errors:
             if isinstance(err, Exception) and err.__class__ == SwitchTask:
@@ -293,8 +293,7 @@ class StateManager:
 
     def get_ref_count(self, state_id: str) -> int:
         """Get the number of active references to a state"""
-        ref_count = self._ref_counts.get(state_id, 0)
-        return typing.cast(int, ref_count)
+        return self._ref_counts.get(state_id, 0)
 
     async def get_ref_count_async(self, state_id: str) -> int:
         """Get the number of active references to a state asynchronously."""
@@ -1,10 +1,8 @@
+import importlib
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from concurrent.futures._base import Executor as BaseExecutor
 
 from .default_executor import DefaultExecutor
-from .grpc_executor import GRPCExecutor
-from .remote_executor import RemoteExecutor
-from .rpc_executor import XMLRPCExecutor
 
 __all__ = [
     "BaseExecutor",
@@ -15,3 +13,21 @@ __all__ = [
     "RemoteExecutor",
     "GRPCExecutor",
 ]
+
+# The remote executors pull in grpc, ssl and the telemetry stack; load them on
+# first access so importing volnux (e.g. in a fresh pool worker) stays cheap.
+_LAZY_EXECUTORS = {
+    "GRPCExecutor": ".grpc_executor",
+    "RemoteExecutor": ".remote_executor",
+    "XMLRPCExecutor": ".rpc_executor",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXECUTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -472,6 +472,8 @@ class HadoopExecutor(Executor):
         self._poll_interval = poll_interval
         self._polling_thread = None
         self._lock = threading.RLock()
+        # Signalled when jobs are submitted or the executor shuts down
+        self._jobs_changed = threading.Condition(self._lock)
 
         # Connect to Hadoop
         self.connector.connect()
@@ -492,9 +494,16 @@ class HadoopExecutor(Executor):
         while not self._shutdown:
             try:
                 with self._lock:
-                    if not self._jobs:
-                        time.sleep(self._poll_interval)
-                        continue
+                    # Settled jobs need no further polling
+                    for future in [f for f in self._jobs if f.done()]:
+                        del self._jobs[future]
+
+                    # Block until there is work instead of waking up to find none
+                    self._jobs_changed.wait_for(
+                        lambda: self._jobs or self._shutdown
+                    )
+                    if self._shutdown:
+                        break
 
                     # Make a copy to avoid modification during iteration
                     jobs_to_check = dict(self._jobs)
@@ -528,7 +537,10 @@ class HadoopExecutor(Executor):
                         if not future.done():
                             future.set_exception(exc)
 
-                time.sleep(self._poll_interval)
+                with self._lock:
+                    self._jobs_changed.wait_for(
+                        lambda: self._shutdown, timeout=self._poll_interval
+                    )
 
             except Exception as e:
                 logger.error(f"Error in job polling thread: {str(e)}")
@@ -568,6 +580,7 @@ class HadoopExecutor(Executor):
 
                 # Track the job
                 self._jobs[future] = job_id
+                self._jobs_changed.notify()
 
                 # The polling thread will handle status updates
                 logger.debug(
@@ -643,6 +656,8 @@ class HadoopExecutor(Executor):
                 except Exception as exc:
                     future.set_exception(exc)
 
+            self._jobs_changed.notify()
+
         return futures
 
     def cancel(self, future: Future) -> bool:
@@ -672,6 +687,7 @@ class HadoopExecutor(Executor):
         with self._lock:
             logger.info("Shutting down HadoopExecutor")
             self._shutdown = True
+            self._jobs_changed.notify_all()
 
             if wait:
                 # Wait for all jobs to complete
@@ -1,6 +1,8 @@
 import sys
+import queue
 import logging
 import typing
+import contextlib
 import xmlrpc.client
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
@@ -40,7 +42,8 @@ class XMLRPCExecutor(Executor):
 
         self._shutdown = False
         self._lock = Lock()
-        self._thread_pool = ThreadPoolExecutor(max_workers=max_workers or 4)
+        self._max_workers = max_workers or 4
+        self._thread_pool = ThreadPoolExecutor(max_workers=self._max_workers)
 
         self._use_encryption = use_encryption
         self._client_cert_path = client_cert_path
@@ -59,15 +62,38 @@ class XMLRPCExecutor(Executor):
                 ca_certs_path=self._ca_cert_path,
             )
 
-        # Create XML-RPC client
+        # Create XML-RPC client. A ServerProxy owns a single keep-alive HTTP
+        # connection and is not thread-safe, so each worker checks one out.
         self._server_url = f"{self.protocol}://{self._host}:{self._port}"
-        self._proxy = xmlrpc.client.ServerProxy(
+        self._proxies: "queue.LifoQueue[xmlrpc.client.ServerProxy]" = (
+            queue.LifoQueue(maxsize=self._max_workers)
+        )
+        self._proxy = self._create_proxy()
+        self._proxies.put_nowait(self._proxy)
+
+    def _create_proxy(self) -> xmlrpc.client.ServerProxy:
+        return xmlrpc.client.ServerProxy(
             self._server_url,
             allow_none=True,
             use_builtin_types=True,
             context=self.context,
         )
 
+    @contextlib.contextmanager
+    def _checkout_proxy(self) -> typing.Iterator[xmlrpc.client.ServerProxy]:
+        """Borrow a proxy from the pool, creating one if all are in use"""
+        try:
+            proxy = self._proxies.get_nowait()
+        except queue.Empty:
+            proxy = self._create_proxy()
+        try:
+            yield proxy
+        finally:
+            try:
+                self._proxies.put_nowait(proxy)
+            except queue.Full:
+                proxy("close")()
+
     def submit(self, fn: typing.Callable, /, *args, **kwargs) -> Future:
         """Submit a task for execution on the remote server"""
         if self._shutdown:
@@ -100,9 +126,10 @@ class XMLRPCExecutor(Executor):
 
             # Make RPC call
             try:
-                response = self._proxy.execute(
-                    get_event_name(fn), task_message.serialize()
-                )
+                with self._checkout_proxy() as proxy:
+                    response = proxy.execute(
+                        get_event_name(fn), task_message.serialize()
+                    )
 
                 result, _ = TaskMessage.deserialize(response)
 
@@ -134,3 +161,10 @@ class XMLRPCExecutor(Executor):
                 self._thread_pool.shutdown(wait=wait)
             else:
                 self._thread_pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+            while True:
+                try:
+                    proxy = self._proxies.get_nowait()
+                except queue.Empty:
+                    break
+                proxy("close")()
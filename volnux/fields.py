@@ -1,5 +1,7 @@
 import os
+import stat
 import typing
+import weakref
 from types import TracebackType
 
 from pydantic_mini.typing import is_type
@@ -12,6 +14,9 @@ from .utils import validate_batch_processor
 
 T = typing.TypeVar("T")
 
+# Data types that get the list batch processor by default
+_BATCH_TYPE_NAMES: typing.Final[typing.FrozenSet[str]] = frozenset({"list", "tuple"})
+
 if typing.TYPE_CHECKING:
     from volnux.pipeline import Pipeline
 
@@ -61,11 +66,21 @@ class FileProxy:
         self._file: typing.Optional[typing.Any] = None
         self._closed = False
 
+        # Closes the file if the proxy is collected while it is still open
+        self._finalizer: typing.Optional[weakref.finalize] = None
+
     def __repr__(self) -> str:
         """Return string representation of the FileProxy."""
         status = "closed" if self.closed else "open" if self._file else "unopened"
         return f"<FileProxy {self.file_path} ({status})>"
 
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # Open handles cannot be pickled, the copy reopens the file lazily
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_finalizer"] = None
+        return state
+
     def _ensure_open(self) -> typing.Any:
         """
         Ensure the file is open, opening it if necessary.
@@ -82,26 +97,43 @@ class FileProxy:
         if self._file is None:
             kwargs = {
                 "mode": self.mode,
-                "buffering": self.buffering,
+                "buffering": self._get_buffer_size(),
                 "closefd": self.closefd,
                 "opener": self.opener,
             }
 
-            if "b" not in self.mode:
+            if not self._is_binary:
                 # Only add the text-specific arguments if they are supported by the mode
                 kwargs["encoding"] = self.encoding
                 kwargs["errors"] = self.errors
                 kwargs["newline"] = self.newline
 
             self._file = open(self.file_path, **kwargs)  # type: ignore
+            self._finalizer = weakref.finalize(self, self._file.close)
 
         return self._file
 
+    def _get_buffer_size(self) -> int:
+        """
+        Resolve the buffering policy. The default policy (-1) uses a buffer of at least
+        DEFAULT_FILE_BUFFER_SIZE, aligned to the file's block size when it is larger.
+        """
+        if self.buffering != -1:
+            return self.buffering
+        try:
+            block_size = os.stat(self.file_path).st_blksize
+        except (OSError, ValueError):
+            block_size = 0
+        return max(batch_defaults.DEFAULT_FILE_BUFFER_SIZE, block_size)
+
     @property
     def closed(self) -> bool:
         return self._closed or (self._file is not None and self._file.closed)
 
     def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
         if self._file is not None and not self._file.closed:
             self._file.close()
         self._closed = True
@@ -120,10 +152,6 @@ class FileProxy:
         """Context manager exit - ensures file is closed."""
         self.close()
 
-    def __del__(self) -> None:
-        """Destructor - ensures file is closed when object is garbage collected."""
-        self.close()
-
     # File object methods
     def read(self, size: typing.Optional[int] = None) -> typing.Union[str, bytes]:
         """
@@ -135,9 +163,10 @@ class FileProxy:
         Returns:
             The read content
         """
-        if size is not None and isinstance(size, int) and size > 0:
-            self._ensure_open().read(size)
-        return self._ensure_open().read()  # type: ignore
+        file = self._ensure_open()
+        if size is not None and size > 0:
+            return file.read(size)  # type: ignore
+        return file.read()  # type: ignore
 
     def readline(self, size: int = -1) -> typing.Union[str, bytes]:
         return self._ensure_open().readline(size)  # type: ignore
@@ -177,7 +206,20 @@ class FileProxy:
     def fileno(self) -> int:
         return self._ensure_open().fileno()  # type: ignore
 
+    def _stat_mode(self) -> typing.Optional[int]:
+        """Return the st_mode of the unopened file, or None if it can't be stat'ed."""
+        if self._file is not None:
+            return None
+        try:
+            return os.stat(self.file_path).st_mode
+        except (OSError, ValueError):
+            return None
+
     def isatty(self) -> bool:
+        mode = self._stat_mode()
+        if mode is not None and not stat.S_ISCHR(mode):
+            # Only character devices can be terminals
+            return False
         return self._ensure_open().isatty()  # type: ignore
 
     @property
@@ -191,23 +233,30 @@ class FileProxy:
     @mode.setter
     def mode(self, value: str) -> None:
         self._mode = value
+        # The mode flags are derived once here rather than on every I/O call
+        self._is_binary = "b" in value
+        self._readable = "r" in value or "+" in value
+        self._writable = "w" in value or "a" in value or "+" in value
 
     def readable(self) -> bool:
-        return "r" in self.mode or "+" in self.mode
+        return self._readable
 
     def writable(self) -> bool:
-        return "w" in self.mode or "a" in self.mode or "+" in self.mode
+        return self._writable
 
     def seekable(self) -> bool:
         if self._file is not None:
             return self._file.seekable()  # type: ignore
+        mode = self._stat_mode()
+        if mode is not None:
+            return stat.S_ISREG(mode) or stat.S_ISBLK(mode)
         # Most files are seekable, but we can't know for sure until opened
         return True
 
     # Iterator protocol
     def __iter__(self) -> typing.Iterator[typing.AnyStr]:
         """Return self as an iterator."""
-        return typing.cast(typing.Iterator[typing.AnyStr], self)
+        return self  # type: ignore
 
     def __next__(self) -> typing.AnyStr:  # type: ignore
         """Return the next line or raise StopIteration."""
@@ -240,6 +289,11 @@ class CacheInstanceFieldMixin(object):
         raise NotImplementedError
 
     def set_field_cache_value(self, instance: "Pipeline", value: typing.Any) -> None:
+        pending_writes = instance.__dict__.get("_pending_field_writes")
+        if pending_writes is not None:
+            # The pipeline is initialising and will flush these in one batch
+            pending_writes[self.get_cache_key()] = value
+            return
         instance.get_pipeline_state().set_cache_for_pipeline_field(
             instance, self.get_cache_key(), value
         )
@@ -280,10 +334,8 @@ class InputDataField(CacheInstanceFieldMixin):
         # Auto-set batch processor for list/tuple types if none provided
         if batch_processor is None:
             if any(
-                [
-                    getattr(dtype, "__name__", None) in ["list", "tuple"]
-                    for dtype in self.data_type
-                ]
+                getattr(dtype, "__name__", None) in _BATCH_TYPE_NAMES
+                for dtype in self.data_type
             ):
                 batch_processor = batch_defaults.list_batch_processor
 
@@ -373,7 +425,7 @@ class InputDataField(CacheInstanceFieldMixin):
         instance.__dict__[self.name] = value  # type: ignore
 
     def get_cache_key(self) -> str:
-        return typing.cast(str, self.name)
+        return self.name  # type: ignore
 
     @property
     def has_batch_operation(self) -> bool:
@@ -401,6 +453,10 @@ class FileInputDataField(InputDataField):
             batch_processor=batch_defaults.file_stream_batch_processor,
         )
 
+    @property
+    def _proxy_cache_key(self) -> str:
+        return f"__fileproxy__{self.name}"
+
     def __set__(self, instance: object, value: typing.Any) -> None:
         """
         Set the file path, validating that it exists and is a file.
@@ -415,6 +471,10 @@ class FileInputDataField(InputDataField):
         if value is not None and not os.path.isfile(value):
             raise ValueError(f"Path '{value}' is not a file or does not exist")
 
+        proxy = instance.__dict__.pop(self._proxy_cache_key, None)  # type: ignore
+        if proxy is not None and proxy.file_path != value:
+            proxy.close()
+
         super().__set__(instance, value)
 
     def __get__(
@@ -431,7 +491,8 @@ class FileInputDataField(InputDataField):
             An open file object or None if no path is set
 
         Note:
-            The caller is responsible for closing the file when done
+            The caller is responsible for closing the file when done. The proxy is
+            cached on the instance and reused until it is closed or the path changes.
         """
         if instance is None:
             return self  # type: ignore
@@ -439,10 +500,16 @@ class FileInputDataField(InputDataField):
         value: typing.Union[str, os.PathLike] = super().__get__(instance, owner)
 
         if value:
+            proxy = instance.__dict__.get(self._proxy_cache_key)
+            if proxy is not None and proxy.file_path == value and not proxy.closed:
+                return proxy
+
             kwargs: typing.Dict[str, typing.Any] = {}
             if "b" not in self.mode and self.encoding is not None:
                 kwargs["encoding"] = self.encoding
 
-            return FileProxy(file_path=value, mode=self.mode, **kwargs)
+            proxy = FileProxy(file_path=value, mode=self.mode, **kwargs)
+            instance.__dict__[self._proxy_cache_key] = proxy
+            return proxy
 
         return None
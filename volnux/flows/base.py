@@ -1,13 +1,18 @@
 import asyncio
+import atexit
+import contextlib
 import logging
+import threading
 import typing
 from abc import abstractmethod
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 from pydantic_mini import BaseModel
 
 from volnux.base import ExecutorInitializerConfig
 from volnux.constants import EMPTY
+from volnux.exceptions import StopProcessingError
 from volnux.execution.context import ExecutionContext
 from volnux.executors import BaseExecutor
 from volnux.import_utils import import_string
@@ -24,6 +29,69 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Process pools are reused across dispatches so workers are forked/spawned once
+_EXECUTOR_CACHE: typing.Dict[typing.Tuple[typing.Any, ...], ProcessPoolExecutor] = {}
+_EXECUTOR_CACHE_LOCK = threading.Lock()
+
+
+def _shutdown_cached_executors() -> None:
+    with _EXECUTOR_CACHE_LOCK:
+        executors = list(_EXECUTOR_CACHE.values())
+        _EXECUTOR_CACHE.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+atexit.register(_shutdown_cached_executors)
+
+
+def _get_executor_cache_key(
+    executor_class: typing.Type[ProcessPoolExecutor],
+    config: typing.Dict[str, typing.Any],
+) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+    """
+    Build the pool cache key, sharded by start method so fork and spawn pools never mix.
+    Returns:
+        The cache key, or None if the configuration cannot be keyed.
+    """
+    mp_context = config.get("mp_context")
+    start_method = mp_context.get_start_method() if mp_context else None
+    options = tuple(sorted((k, v) for k, v in config.items() if k != "mp_context"))
+    key = (executor_class, start_method, options)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_pooled_executor(
+    executor_class: typing.Type[BaseExecutor], config: typing.Dict[str, typing.Any]
+) -> typing.ContextManager[BaseExecutor]:
+    """
+    Get an executor for a dispatch. Process pools are cached and left running
+    when the dispatch ends; every other executor is created for the dispatch
+    and shut down when it leaves the context.
+    Args:
+        executor_class: The executor class.
+        config: The executor initialization configuration.
+    Returns:
+        A context manager yielding the executor.
+    """
+    if not issubclass(executor_class, ProcessPoolExecutor):
+        return executor_class(**config)
+
+    key = _get_executor_cache_key(executor_class, config)
+    if key is None:
+        return executor_class(**config)
+
+    with _EXECUTOR_CACHE_LOCK:
+        executor = _EXECUTOR_CACHE.get(key)
+        if executor is None or executor._broken or executor._shutdown_thread:
+            executor = executor_class(**config)
+            _EXECUTOR_CACHE[key] = executor
+    return contextlib.nullcontext(executor)
+
 
 def attach_signal_emitter(
     signal: SoftSignal, **signal_kwargs: typing.Dict[str, typing.Any]
@@ -233,18 +301,32 @@ class BaseFlow(BaseModel, ObjectIdentityMixin):
         Returns:
             Future
         """
-        logger.info(
-            f"Submitting event {event} to executor {executor.__class__.__name__}"
-        )
+        await self._emit_event_execution_start(event)
+
+        if loop is None:
+            loop = asyncio.get_event_loop()
 
+        return self._run_event_in_executor(executor, event, event_call_kwargs, loop)
+
+    async def _emit_event_execution_start(self, event: "Event") -> None:
+        """Emit the event_execution_start signal for an event about to be submitted."""
         await event_execution_start.emit_async(
             sender=self.context.__class__,
             event=event,
             execution_context=self.context,
         )
 
-        if loop is None:
-            loop = asyncio.get_event_loop()
+    def _run_event_in_executor(
+        self,
+        executor: BaseExecutor,
+        event: "Event",
+        event_call_kwargs: typing.Dict[str, typing.Any],
+        loop: asyncio.AbstractEventLoop,
+    ) -> asyncio.Future:
+        """Schedule the event on the executor and attach the execution-end signal."""
+        logger.info(
+            f"Submitting event {event} to executor {executor.__class__.__name__}"
+        )
 
         event_args = (event_call_kwargs,)
 
@@ -276,14 +358,69 @@ class BaseFlow(BaseModel, ObjectIdentityMixin):
             Future
         """
         loop = asyncio.get_event_loop()
-        futures = []
-        for event, event_call_kwargs in event_execution_config.items():
-            future = await self._submit_event_to_executor(
-                executor, event, event_call_kwargs, loop=loop
+
+        # Emit the start signals for the whole batch concurrently, then hand
+        # every event to the executor back-to-back instead of waiting on a
+        # signal round-trip between submissions.
+        await asyncio.gather(
+            *(
+                self._emit_event_execution_start(event)
+                for event in event_execution_config
             )
-            futures.append(future)
+        )
+
+        futures = [
+            self._run_event_in_executor(executor, event, event_call_kwargs, loop)
+            for event, event_call_kwargs in event_execution_config.items()
+        ]
 
-        return asyncio.gather(*futures, return_exceptions=True)
+        return asyncio.ensure_future(self._gather_until_stop_requested(futures))
+
+    @staticmethod
+    async def _gather_until_stop_requested(
+        futures: typing.List[asyncio.Future],
+    ) -> typing.List[typing.Any]:
+        """
+        Gather the futures of parallel events, cancelling the pending siblings as soon
+        as one event raises StopProcessingError, since the whole execution stops then.
+        Args:
+            futures: The futures of the parallel events.
+        Returns:
+            The results in submission order, with exceptions in place of results
+            like asyncio.gather(..., return_exceptions=True).
+        """
+        results: typing.List[typing.Any] = [None] * len(futures)
+        # Futures are released as soon as their outcome is recorded in its slot
+        positions = {fut: index for index, fut in enumerate(futures)}
+        del futures
+
+        def _outcome(fut: asyncio.Future) -> typing.Any:
+            if fut.cancelled():
+                return asyncio.CancelledError()
+            return fut.exception() or fut.result()
+
+        pending = set(positions)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            stop_requested = False
+            for fut in done:
+                outcome = _outcome(fut)
+                results[positions.pop(fut)] = outcome
+                stop_requested |= isinstance(outcome, StopProcessingError)
+            del done
+
+            if stop_requested:
+                for fut in pending:
+                    fut.cancel()
+                if pending:
+                    await asyncio.wait(pending)
+                for fut in pending:
+                    results[positions.pop(fut)] = _outcome(fut)
+                break
+
+        return results
 
     @staticmethod
     def validate_executor_class_and_config(
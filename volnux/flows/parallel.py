@@ -7,7 +7,7 @@ from volnux.base import ExecutorInitializerConfig
 from volnux.executors import BaseExecutor, ProcessPoolExecutor
 from volnux.utils import is_multiprocessing_executor
 
-from .base import BaseFlow
+from .base import BaseFlow, get_pooled_executor
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +98,7 @@ class ParallelFlow(BaseFlow):
                 executor_class, executor_config
             )
 
-            with executor_class(**config) as executor:
+            with get_pooled_executor(executor_class, config) as executor:
                 future = await self._map_events_to_executor(
                     executor, event_execution_config=event_config
                 )
@@ -5,7 +5,7 @@ import typing
 from volnux.base import ExecutorInitializerConfig
 from volnux.executors import BaseExecutor
 
-from .base import BaseFlow
+from .base import BaseFlow, get_pooled_executor
 
 if typing.TYPE_CHECKING:
     from volnux.parser.protocols import TaskProtocol
@@ -69,7 +69,7 @@ class SingleFlow(BaseFlow):
                 executor_class, executor_config
             )
 
-            with executor_class(**config) as executor:
+            with get_pooled_executor(executor_class, config) as executor:
                 future = await self._submit_event_to_executor(
                     executor, event, event_call_kwargs
                 )
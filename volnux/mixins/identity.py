@@ -11,11 +11,21 @@ class ObjectIdentityMixin:
 
     @property
     def id(self) -> str:
-        return generate_unique_id(self)
+        pk = getattr(self, "_id", None)
+        if pk is None:
+            # Instances restored without running __init__ get their id on first access
+            pk = generate_unique_id(self)
+        return pk
 
     @property
-    def __object_import_str__(self) -> typing.Type[typing.Any]:
-        return get_obj_klass_import_str(self)  # type: ignore
+    def __object_import_str__(self) -> str:
+        # The import string depends only on the class, so it is computed once per class
+        klass = self.__class__
+        import_str = klass.__dict__.get("_object_import_str")
+        if import_str is None:
+            import_str = get_obj_klass_import_str(self)
+            klass._object_import_str = import_str
+        return import_str
 
     def get_state(self) -> typing.Dict[str, typing.Any]:
         raise NotImplementedError()
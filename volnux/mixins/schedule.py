@@ -68,7 +68,7 @@ class ScheduleMixin:
     ):
         klass = trigger.tigger_klass()
         params = get_function_call_args(klass.__init__, trigger_args)
-        if not params or not any([params[key] for key in params]):
+        if not params or not any(params.values()):
             expected_args = list(get_expected_args(klass.__init__).keys())
             raise ValidationError(
                 message=f"Invalid trigger arguments. Expected argument(s) {expected_args}",
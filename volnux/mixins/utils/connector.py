@@ -75,14 +75,14 @@ class ConnectorManagerFactory:
             # Class names often associated with backends that benefit from pooling
             any(
                 name in connector_class.__name__.lower()
-                for name in [
+                for name in (
                     "redis",
                     "mysql",
                     "postgres",
                     "sql",
                     "mongo",
                     "elasticsearch",
-                ]
+                )
             ),
             # Check for connection pool related attributes/methods
             hasattr(connector_class, "connection_pool"),
@@ -87,6 +87,9 @@ class ConditionalNode:
     def get_descriptors(self) -> typing.List[DescriptorConfig]:
         return list(self._descriptors.values())
 
+    def descriptor_count(self) -> int:
+        return len(self._descriptors)
+
     # Create properties using the factory method
     on_success_event = _create_descriptor_property(
         StandardDescriptor.SUCCESS, "task", TaskProtocol
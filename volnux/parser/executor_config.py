@@ -1,8 +1,17 @@
+import os
 import typing
 from dataclasses import dataclass, fields
 
 from volnux.typing import ConfigState, ConfigurableValue
 
+# Upper bound on default worker count, to avoid oversubscribing large hosts
+MAX_DEFAULT_WORKERS = 32
+
+
+def default_max_workers() -> int:
+    """Default worker count: one per CPU, capped at MAX_DEFAULT_WORKERS."""
+    return min(MAX_DEFAULT_WORKERS, os.cpu_count() or 1)
+
 
 @dataclass
 class ExecutorInitializerConfig:
@@ -26,8 +35,12 @@ class ExecutorInitializerConfig:
     client_key_path: typing.Optional[str] = None
     ca_cert_path: typing.Optional[str] = None
 
-    def resolve_max_workers(self, system_default: int = 4) -> typing.Optional[int]:
+    def resolve_max_workers(
+        self, system_default: typing.Optional[int] = None
+    ) -> typing.Optional[int]:
         if self.max_workers is ConfigState.UNSET:
+            if system_default is None:
+                return default_max_workers()
             return system_default
         return self.max_workers
 
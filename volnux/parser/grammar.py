@@ -1,5 +1,8 @@
 __all__ = ["pointy_parser"]
 
+import os
+import re
+
 from ply.yacc import YaccError, yacc
 
 from . import lexer
@@ -253,10 +256,42 @@ def get_error_context(input_data, error_pos, context_size=50):
     return " ".join(line.strip() for line in context_lines if line.strip())
 
 
-parser = yacc()
+# Load the LALR tables from the packaged parsetab module rather than rebuilding
+# them per process; outside of -O runs the grammar signature is still checked so
+# stale tables get regenerated.
+parser = yacc(
+    debug=False,
+    optimize=not __debug__,
+    write_tables=True,
+    tabmodule="parsetab",
+    outputdir=os.path.dirname(__file__),
+)
+
+
+# Plain chains of tasks such as "A -> B |-> C || D" make up most pointy
+# definitions. They are recognised with a single regex and folded into the same
+# left-associative AST the grammar produces, without going through the LR parser.
+# Identifiers starting with true/false are left to the lexer, which reads that
+# prefix as a BOOLEAN.
+_CHAIN_IDENTIFIER = r"(?!true|false)[a-zA-Z_][a-zA-Z0-9_]*"
+_CHAIN_OPERATOR = r"[ \t\n]*(\|->|->|\|\|)[ \t\n]*"
+_LINEAR_CHAIN_RE = re.compile(
+    rf"[ \t\n]*{_CHAIN_IDENTIFIER}(?:{_CHAIN_OPERATOR}{_CHAIN_IDENTIFIER})*[ \t\n]*"
+)
+_CHAIN_OPERATOR_RE = re.compile(_CHAIN_OPERATOR)
+
+
+def _parse_linear_chain(code: str) -> ProgramNode:
+    parts = _CHAIN_OPERATOR_RE.split(code.strip(" \t\n"))
+    node = TaskNode(parts[0])
+    for index in range(1, len(parts), 2):
+        node = BinOpNode(left=node, op=parts[index], right=TaskNode(parts[index + 1]))
+    return ProgramNode(node)
 
 
 def pointy_parser(code: str):
+    if _LINEAR_CHAIN_RE.fullmatch(code):
+        return _parse_linear_chain(code)
     try:
         return parser.parse(code, lexer=pointy_lexer.lexer)
     except YaccError as e:
@@ -30,6 +30,14 @@ class StopCondition(Enum):
     ON_ANY = "on_any"
 
 
+# Stop conditions that trigger for each condition name in Options.should_stop_on
+_STOP_ON_CONDITIONS: typing.Dict[str, typing.FrozenSet[StopCondition]] = {
+    "error": frozenset({StopCondition.ON_ERROR, StopCondition.ON_ANY}),
+    "success": frozenset({StopCondition.ON_SUCCESS, StopCondition.ON_ANY}),
+    "exception": frozenset({StopCondition.ON_EXCEPTION, StopCondition.ON_ANY}),
+}
+
+
 class ResultEvaluationStrategy(StrEnum):
     """Defines strategies used to evaluate task results."""
 
@@ -141,17 +149,11 @@ class Options(BaseModel):
         if self.stop_condition is None:
             return False
 
-        condition_map = {
-            "error": StopCondition.ON_ERROR,
-            "success": StopCondition.ON_SUCCESS,
-            "exception": StopCondition.ON_EXCEPTION,
-        }
-
-        target_condition = condition_map.get(condition.lower())
-        if target_condition is None:
+        target_conditions = _STOP_ON_CONDITIONS.get(condition.lower())
+        if target_conditions is None:
             return False
 
-        return self.stop_condition in [target_condition, StopCondition.ON_ANY]
+        return self.stop_condition in target_conditions
 
     def merge_with(self, other: typing.Union["Options", dict]) -> "Options":
         """
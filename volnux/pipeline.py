@@ -1,9 +1,12 @@
 import copy
 import inspect
+import io
 import logging
 import multiprocessing as mp
 import os
+import pickle
 import re
+import sys
 import threading
 import time
 import typing
@@ -13,6 +16,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from functools import lru_cache, partial
 from inspect import Parameter, Signature
+from multiprocessing import shared_memory
+from multiprocessing.reduction import ForkingPickler
 
 from treelib.tree import Tree
 
@@ -170,18 +175,36 @@ class PipelineState(object):
         """
         if value is None:
             return
+        self._get_instance_cache(instance, instance_cache_field)[field_name] = value
+
+    def set_cache_many(
+        self,
+        instance: "Pipeline",
+        instance_cache_field: str,
+        values: typing.Mapping[str, typing.Any],
+    ) -> None:
+        """
+        Set several cache entries for specific pipeline instance in one update
+        Args:
+            instance (typing.Union["Pipeline", str]): Pipeline instance or its cache key
+            instance_cache_field (str): Cache field name
+            values (typing.Mapping[str, typing.Any]): Field names mapped to the values to cache
+        """
+        values = {name: value for name, value in values.items() if value is not None}
+        if values:
+            self._get_instance_cache(instance, instance_cache_field).update(values)
+
+    def _get_instance_cache(
+        self, instance: typing.Union["Pipeline", str], instance_cache_field: str
+    ) -> OrderedDict:
         instance_key = self.get_cache_key(instance)
         cache = self.__dict__.get(instance_cache_field)
-        if cache and instance_key in cache:
-            collection = cache[instance_key]
-            if instance_key not in collection:
-                self.__dict__[instance_cache_field][instance_key] = OrderedDict()
-        else:
-            self.__dict__[instance_cache_field] = OrderedDict(
-                [(instance_key, OrderedDict())]
-            )
-
-        self.__dict__[instance_cache_field][instance_key][field_name] = value
+        if cache is None:
+            cache = self.__dict__[instance_cache_field] = OrderedDict()
+        collection = cache.get(instance_key)
+        if collection is None:
+            collection = cache[instance_key] = OrderedDict()
+        return collection
 
     def set_cache_for_pipeline_field(
         self, instance: "Pipeline", field_name: str, value: typing.Any
@@ -200,6 +223,17 @@ class PipelineState(object):
             value=value,
         )
 
+    def set_cache_for_pipeline_fields(
+        self, instance: "Pipeline", values: typing.Mapping[str, typing.Any]
+    ) -> None:
+        """
+        Set cache for several pipeline fields at once
+        Args:
+            instance (typing.Union["Pipeline", str]): Pipeline instance or its cache key
+            values (typing.Mapping[str, typing.Any]): Field names mapped to the values to cache
+        """
+        self.set_cache_many(instance, "pipeline_cache", values)
+
 
 class PipelineMeta(type):
     def __new__(cls, name, bases, namespace, **kwargs):
@@ -310,8 +344,16 @@ class Pipeline(ObjectIdentityMixin, ScheduleMixin, metaclass=PipelineMeta):
 
         if self.__signature__:
             bounded_args = self.__signature__.bind(*args, **kwargs)
-            for name, value in bounded_args.arguments.items():
-                setattr(self, name, value)
+            # Fields queue their cache writes here; they are flushed in one batch
+            self._pending_field_writes: typing.Dict[str, typing.Any] = {}
+            try:
+                for name, value in bounded_args.arguments.items():
+                    setattr(self, name, value)
+            finally:
+                pending_writes = self.__dict__.pop("_pending_field_writes")
+            self.get_pipeline_state().set_cache_for_pipeline_fields(
+                self, pending_writes
+            )
 
         self.execution_context: typing.Optional[ExecutionContext] = None
 
@@ -651,6 +693,76 @@ class _BatchResult(typing.NamedTuple):
     exception: Exception
 
 
+def _load_shared_buffer_chunk(
+    data: bytes,
+    shm_name: typing.Optional[str],
+    spans: typing.List[typing.Tuple[int, int]],
+    buffers: typing.List[bytes],
+) -> typing.List[Pipeline]:
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            buffers = []
+            for offset, size in spans:
+                with shm.buf[offset : offset + size] as view:
+                    buffers.append(bytearray(view))
+        finally:
+            shm.close()
+    return ForkingPickler.loads(data, buffers=buffers)
+
+
+class _SharedBufferChunk:
+    """
+    Chunk of pipelines shipped to a batch worker. It pickles with protocol 5 so
+    large out-of-band buffers (NumPy arrays and other objects that pickle via
+    PickleBuffer) are copied once into shared memory instead of being streamed
+    through the worker pipe.
+    The block is owned by the parent and freed with release() once the chunk
+    has settled.
+    """
+
+    def __init__(self, pipelines: typing.List[Pipeline]):
+        self._pipelines = pipelines
+        self._shm: typing.Optional[shared_memory.SharedMemory] = None
+
+    def __len__(self) -> int:
+        return len(self._pipelines)
+
+    def __iter__(self) -> typing.Iterator[Pipeline]:
+        return iter(self._pipelines)
+
+    def __reduce__(self):
+        out_of_band: typing.List[pickle.PickleBuffer] = []
+        stream = io.BytesIO()
+        pickler = pickle.Pickler(stream, 5, buffer_callback=out_of_band.append)
+        # Keep the reducers multiprocessing registers for its own objects
+        pickler.dispatch_table = ForkingPickler(stream, 5).dispatch_table
+        pickler.dump(self._pipelines)
+        data = stream.getvalue()
+
+        views = [buffer.raw() for buffer in out_of_band]
+        total = sum(view.nbytes for view in views)
+        if total < conf.BATCH_PIPELINE_SHARED_MEMORY_THRESHOLD:
+            inline = [bytes(view) for view in views]
+            return _load_shared_buffer_chunk, (data, None, [], inline)
+
+        self.release()
+        self._shm = shared_memory.SharedMemory(create=True, size=total)
+        spans = []
+        offset = 0
+        for view in views:
+            self._shm.buf[offset : offset + view.nbytes] = view
+            spans.append((offset, view.nbytes))
+            offset += view.nbytes
+        return _load_shared_buffer_chunk, (data, self._shm.name, spans, [])
+
+    def release(self) -> None:
+        if self._shm is not None:
+            shm, self._shm = self._shm, None
+            shm.close()
+            shm.unlink()
+
+
 class BatchPipelineStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -1097,6 +1209,13 @@ class BatchPipeline(ObjectIdentityMixin, ScheduleMixin):
 
     max_workers: int = None
 
+    # Pipelines sent to a worker per submission; falls back to BATCH_PIPELINE_CHUNK_SIZE
+    chunksize: int = None
+
+    # Submissions a worker handles before it is recycled; falls back to
+    # BATCH_PIPELINE_MAX_TASKS_PER_CHILD
+    max_tasks_per_child: int = None
+
     memory_limit: int = None
 
     max_memory_percent: float = 90.00
@@ -1294,11 +1413,12 @@ class BatchPipeline(ObjectIdentityMixin, ScheduleMixin):
             pipeline.start(force_rerun=True)
         else:
 
-            def _process_futures(fut: Future, batch: "BatchPipeline" = self):
-                event = exception = None
+            def _process_futures(
+                fut: Future, batch: "BatchPipeline" = self, chunk_length: int = 1
+            ):
+                events = None
                 try:
-                    data = fut.result()
-                    event = _BatchResult(*data)
+                    events = [_BatchResult(*data) for data in fut.result()]
                 except TimeoutError:
                     return
                 except CancelledError as exc:
@@ -1308,11 +1428,14 @@ class BatchPipeline(ObjectIdentityMixin, ScheduleMixin):
                     exception = exc
                     print(f"Error in processing future: {exc}")
 
-                if event is None:
-                    event = _BatchResult(None, exception=exception)
+                if events is None:
+                    events = [
+                        _BatchResult(None, exception=exception)
+                        for _ in range(chunk_length)
+                    ]
 
                 with batch.lock:
-                    batch.results.append(event)
+                    batch.results.extend(events)
 
             manager = mp.Manager()
             mp_context = mp.get_context("spawn")
@@ -1321,37 +1444,72 @@ class BatchPipeline(ObjectIdentityMixin, ScheduleMixin):
 
             self._monitor_thread = _BatchProcessingMonitor(self)
 
+            # The worker pool outlives this call, so count chunks until recorded
+            chunks_settled = threading.Semaphore(0)
+            submitted_chunks = 0
+            # Back-pressure: cap the chunks queued in the pool so pipelines are
+            # built only as fast as the workers drain them
+            in_flight = threading.BoundedSemaphore(
+                2 * (self.max_workers or conf.MAX_BATCH_PROCESSING_WORKERS)
+            )
+
+            def _settle_chunk(fut: Future, chunk: _SharedBufferChunk) -> None:
+                try:
+                    _process_futures(fut, batch=self, chunk_length=len(chunk))
+                finally:
+                    chunk.release()
+                    in_flight.release()
+                    chunks_settled.release()
+
             try:
                 # let's start monitoring the execution
                 self._monitor_thread.start()
 
-                with ProcessPoolExecutor(
-                    max_workers=self.max_workers or conf.MAX_BATCH_PROCESSING_WORKERS,
-                    mp_context=mp_context,
-                ) as executor:
+                chunksize = max(1, self.chunksize or conf.BATCH_PIPELINE_CHUNK_SIZE)
+
+                with self._get_batch_executor(mp_context) as executor:
+
+                    def _submit_chunk(pipelines: typing.List[Pipeline]) -> None:
+                        nonlocal submitted_chunks
+                        shared_chunk = _SharedBufferChunk(pipelines)
+                        in_flight.acquire()
+                        try:
+                            future = executor.submit(
+                                self._pipeline_chunk_executor,
+                                pipelines=shared_chunk,
+                                focus_on_signals=self.listen_to_signals,
+                                signals_queue=self._signals_queue,
+                            )
+                        except BaseException:
+                            in_flight.release()
+                            raise
+                        submitted_chunks += 1
+                        self._configured_pipelines_count += len(pipelines)
+                        future.add_done_callback(
+                            partial(_settle_chunk, chunk=shared_chunk)
+                        )
+
+                    chunk: typing.List[Pipeline] = []
                     # call memory check method to do resizing when memory percent limit is been reached
                     for kwargs in self._execute_field_batch_processors(
                         self._field_batch_op_map
                     ):
-                        if any([value for value in kwargs.values()]):
+                        if any(kwargs.values()):
                             kwargs.update(non_batch_kwargs)
-                            pipeline = template(**kwargs)
+                            chunk.append(template(**kwargs))
+                            if len(chunk) >= chunksize:
+                                _submit_chunk(chunk)
+                                chunk = []
 
-                            future = executor.submit(
-                                self._pipeline_executor,
-                                pipeline=pipeline,
-                                focus_on_signals=self.listen_to_signals,
-                                signals_queue=self._signals_queue,
-                            )
-                            self._configured_pipelines_count += 1
-                            future.add_done_callback(
-                                partial(_process_futures, batch=self)
-                            )
+                    if chunk:
+                        _submit_chunk(chunk)
             except Exception as e:
                 logger.error(
                     f"❗️error occurred while initialising and executing pipelines {e}"
                 )
             finally:
+                for _ in range(submitted_chunks):
+                    chunks_settled.acquire()
                 self._signals_queue.put(None)
                 self._monitor_thread.join()
 
@@ -1377,6 +1535,45 @@ class BatchPipeline(ObjectIdentityMixin, ScheduleMixin):
         )
         return wrapper.run()
 
+    def _get_batch_executor(
+        self, mp_context: mp.context.BaseContext
+    ) -> typing.ContextManager[ProcessPoolExecutor]:
+        """
+        Get the worker pool for this batch. Workers are long-lived and are
+        recycled after max_tasks_per_child submissions to bound memory growth
+        from user pipeline code.
+        """
+        from .flows.base import get_pooled_executor
+
+        executor_config: typing.Dict[str, typing.Any] = {
+            "max_workers": self.max_workers or conf.MAX_BATCH_PROCESSING_WORKERS,
+            "mp_context": mp_context,
+        }
+        max_tasks_per_child = (
+            self.max_tasks_per_child or conf.BATCH_PIPELINE_MAX_TASKS_PER_CHILD
+        )
+        if max_tasks_per_child:
+            if sys.version_info < (3, 11):
+                # Recycling is unsupported; use workers that exit with the batch
+                return ProcessPoolExecutor(**executor_config)
+            executor_config["max_tasks_per_child"] = max_tasks_per_child
+        return get_pooled_executor(ProcessPoolExecutor, executor_config)
+
+    @staticmethod
+    def _pipeline_chunk_executor(
+        pipelines: typing.Iterable[Pipeline],
+        focus_on_signals: typing.List[str],
+        signals_queue: mp.Queue,
+    ) -> typing.List[typing.Tuple[Pipeline, typing.Optional[Exception]]]:
+        return [
+            BatchPipeline._pipeline_executor(
+                pipeline=pipeline,
+                focus_on_signals=focus_on_signals,
+                signals_queue=signals_queue,
+            )
+            for pipeline in pipelines
+        ]
+
     def close(self, timeout=2):
         """Clean up resources"""
         try:
@@ -31,6 +31,11 @@ class Registry:
         # Direct name-to-class mapping {'UserLoginEvent': UserLoginEvent}
         self._name_registry: typing.Dict[str, typing.Type[typing.Any]] = {}
 
+        # Snapshot of all registered classes, rebuilt after each (re)registration
+        self._all_classes_cache: typing.Optional[
+            typing.FrozenSet[typing.Type[typing.Any]]
+        ] = None
+
         # Thread lock for thread-safe operations
         self._lock = threading.RLock()
 
@@ -87,6 +92,8 @@ class Registry:
             else:
                 self._name_registry[name] = klass
 
+            self._all_classes_cache = None
+
             if not self.ready:
                 self.set_ready()
 
@@ -143,7 +150,12 @@ class Registry:
 
     def list_all_classes(self) -> typing.FrozenSet[typing.Type[typing.Any]]:
         """List all classes with the registry"""
-        return frozenset(list(self._name_registry.values()))
+        classes = self._all_classes_cache
+        if classes is None:
+            with self._lock:
+                classes = frozenset(self._name_registry.values())
+                self._all_classes_cache = classes
+        return classes
 
     def list_modules(self) -> typing.List[str]:
         """List all modules that have registered classes."""
@@ -171,4 +183,5 @@ class Registry:
         with self._lock:
             self.all_classes.clear()
             self._name_registry.clear()
+            self._all_classes_cache = None
             self.ready = False
@@ -1,8 +1,11 @@
+import copy
 import json
+import math
 import os
 import typing
-from dataclasses import asdict
+from dataclasses import asdict, fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from pydantic_mini import Attrib, BaseModel, MiniAnnotated
 from pydantic_mini.typing import is_builtin_type
@@ -18,12 +21,96 @@ try:
 except ImportError:
     from typing_extensions import TypeAlias
 
+orjson = None
+
+try:
+    import orjson
+except ImportError:
+    pass
+
 __all__ = ["EventResult", "ResultSet"]
 
 T = typing.TypeVar("T", bound="ResultSet")
 
 Result: TypeAlias = typing.Hashable  # Placeholder for a Result type
 
+_MISSING = object()
+
+# Values of these types are immutable and are serialized as-is
+_ATOMIC_TYPES: typing.Final[typing.FrozenSet[type]] = frozenset(
+    {str, int, float, bool, bytes, type(None)}
+)
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(klass: type) -> typing.Tuple[str, ...]:
+    return tuple(field.name for field in fields(klass))
+
+
+def _serialize_value(value: typing.Any) -> typing.Any:
+    """
+    Copy a field value the way dataclasses.asdict does, returning immutable
+    values directly instead of recursing into them.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # namedtuples take their fields positionally
+        return value_type(*[_serialize_value(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        # Plain containers of scalars only need a shallow copy
+        if (value_type is list or value_type is tuple) and all(
+            type(item) in _ATOMIC_TYPES for item in value
+        ):
+            return value if value_type is tuple else value.copy()
+        return value_type(_serialize_value(item) for item in value)
+    if isinstance(value, dict):
+        if value_type is dict and all(
+            type(key) in _ATOMIC_TYPES and type(item) in _ATOMIC_TYPES
+            for key, item in value.items()
+        ):
+            return value.copy()
+        items = (
+            (_serialize_value(key), _serialize_value(item))
+            for key, item in value.items()
+        )
+        if hasattr(value, "default_factory"):
+            # defaultdict takes the factory as its first argument
+            return value_type(value.default_factory, items)
+        return value_type(items)
+    return copy.deepcopy(value)
+
+
+def _json_default(value: typing.Any) -> typing.Any:
+    """Encode values the JSON encoders do not support natively."""
+    if hasattr(value, "as_dict"):
+        return value.as_dict()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return str(value)
+
+
+def _non_finite_to_none(value: typing.Any) -> typing.Any:
+    """Replace NaN and infinities with None, as orjson encodes them as null."""
+    if type(value) is float:
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _non_finite_to_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_non_finite_to_none(item) for item in value]
+    return value
+
+
+# json.dumps builds a fresh encoder whenever ``default`` is given; share one.
+# Its output matches orjson: compact separators and null for non-finite floats.
+_json_encode = json.JSONEncoder(
+    separators=(",", ":"),
+    default=lambda value: _non_finite_to_none(_json_default(value)),
+).encode
+
 
 class EventResult(BackendIntegrationMixin, BaseModel):
     error: bool
@@ -62,7 +149,8 @@ class EventResult(BackendIntegrationMixin, BaseModel):
         if init_params:
             execution_context = init_params.get("execution_context")
             if execution_context and not isinstance(execution_context, str):
-                init_params["execution_context"] = execution_context.id
+                # Copy only when rewriting, the live init_params must keep the context
+                init_params = {**init_params, "execution_context": execution_context.id}
         else:
             init_params = {"execution_context": {}}
 
@@ -103,23 +191,38 @@ class EventResult(BackendIntegrationMixin, BaseModel):
 
     def as_dict(self) -> typing.Dict[str, typing.Any]:
         """Serialize event result"""
-        content = None
-        if isinstance(self.content, Exception):
-            content = self.content
-            self.content = None
-        result_dict = asdict(self)
-        if content is not None:
-            if hasattr(content, "as_dict"):
-                content = content.as_dict()
-            elif hasattr(content, "to_dict"):
-                content = content.to_dict()
-            result_dict["content"] = content
+        result_dict = {}
+        for name in _get_field_names(self.__class__):
+            value = getattr(self, name)
+            if name == "content" and isinstance(value, Exception):
+                if hasattr(value, "as_dict"):
+                    value = value.as_dict()
+                elif hasattr(value, "to_dict"):
+                    value = value.to_dict()
+                result_dict[name] = value
+            else:
+                result_dict[name] = _serialize_value(value)
         return result_dict
 
+    def as_json(self) -> str:
+        """Serialize event result to JSON, using orjson when it is installed"""
+        data = self.as_dict()
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits; the stdlib encoder handles them
+                pass
+        return _json_encode(_non_finite_to_none(data))
+
 
 class EntityContentType:
     """Represents the content type information for an entity."""
 
+    __slots__ = ("backend_import_str", "entity_content_type")
+
     def __init__(
         self,
         backend_import_str: typing.Optional[str] = None,
@@ -177,6 +280,8 @@ class EntityContentType:
 class ResultSet(typing.MutableSet[Result]):
     """A collection of Result objects with filtering and query capabilities."""
 
+    __slots__ = ("_content", "_context_types", "_view", "_indexes")
+
     # Dictionary of filter operators and their implementation
     _FILTER_OPERATORS: typing.Final[typing.Set[str]] = {
         "contains",
@@ -192,9 +297,17 @@ class ResultSet(typing.MutableSet[Result]):
         "isnull",
     }
 
+    # Fields answered from a lookup index when they are the only filter
+    _INDEXED_FIELDS: typing.Final[typing.FrozenSet[str]] = frozenset(
+        {"event_name", "task_id"}
+    )
+
     def __init__(self, results: typing.Optional[typing.List[Result]] = None) -> None:
         self._content: typing.Dict[str, Result] = {}
         self._context_types: typing.Set[EntityContentType] = set()
+        # Positional view and field indexes of the results, rebuilt lazily after a mutation
+        self._view: typing.Optional[typing.Tuple[Result, ...]] = None
+        self._indexes: typing.Dict[str, typing.Dict[typing.Any, typing.List[Result]]] = {}
 
         if results is None:
             results = []
@@ -225,7 +338,31 @@ class ResultSet(typing.MutableSet[Result]):
 
     def __getitem__(self, index: int) -> Result:
         """Access a result by index."""
-        return list(self._content.values())[index]
+        view = self._view
+        if view is None:
+            view = self._view = tuple(self._content.values())
+        return view[index]
+
+    def _invalidate_views(self) -> None:
+        self._view = None
+        if self._indexes:
+            self._indexes = {}
+
+    def _get_field_index(
+        self, field: str
+    ) -> typing.Dict[typing.Any, typing.List[Result]]:
+        """
+        Get the results grouped by the value of a field.
+        Raises:
+            TypeError: If a value of the field is not hashable.
+        """
+        index = self._indexes.get(field)
+        if index is None:
+            index = {}
+            for result in self._content.values():
+                index.setdefault(getattr(result, field, None), []).append(result)
+            self._indexes[field] = index
+        return index
 
     def _insert_entity(self, record: Result) -> None:
         """
@@ -234,9 +371,10 @@ class ResultSet(typing.MutableSet[Result]):
         Args:
             record: The Result object to insert.
         """
-        self._content[self.get_hash(record)] = typing.cast(Result, record)
+        self._content[self.get_hash(record)] = record
+        self._invalidate_views()
         content_type = EntityContentType.add_entity_content_type(record)
-        if content_type and content_type not in self._context_types:
+        if content_type:
             self._context_types.add(content_type)
 
     def add(self, value: typing.Union[Result, "ResultSet"]) -> None:
@@ -248,6 +386,7 @@ class ResultSet(typing.MutableSet[Result]):
         if isinstance(value, ResultSet):
             self._content.update(value._content)
             self._context_types.update(value._context_types)
+            self._invalidate_views()
         else:
             self._content[self.get_hash(value)] = value
             self._insert_entity(value)
@@ -265,6 +404,7 @@ class ResultSet(typing.MutableSet[Result]):
         """Remove all results."""
         self._content.clear()
         self._context_types.clear()
+        self._invalidate_views()
 
     def discard(self, value: typing.Union[Result, "ResultSet"]) -> None:
         """Remove a result or results from another ResultSet."""
@@ -273,6 +413,7 @@ class ResultSet(typing.MutableSet[Result]):
                 self._content.pop(self.get_hash(res), None)
         else:
             self._content.pop(self.get_hash(value), None)
+        self._invalidate_views()
 
     def copy(self) -> "ResultSet":
         """Create a shallow copy of this ResultSet."""
@@ -319,50 +460,60 @@ class ResultSet(typing.MutableSet[Result]):
         - rs.filter(tags__contains="urgent") - Check if list contains value
         - rs.filter(name__startswith="A") - String prefix matching
         """
-        filtered_results = []
+        if len(filter_params) == 1:
+            ((key, value),) = filter_params.items()
+            if key in self._INDEXED_FIELDS:
+                try:
+                    return ResultSet(self._get_field_index(key).get(value, []))
+                except TypeError:
+                    # Unhashable values cannot be indexed, scan instead
+                    pass
 
-        for result in self._content.values():
-            if self._matches_filters(result, filter_params):
-                filtered_results.append(result)
+        matchers = [
+            self._compile_filter(key, value) for key, value in filter_params.items()
+        ]
 
-        return ResultSet(filtered_results)
+        return ResultSet(
+            [
+                result
+                for result in self._content.values()
+                if all(match(result) for match in matchers)
+            ]
+        )
 
-    def _matches_filters(
-        self, result: Result, filters: typing.Dict[str, typing.Any]
-    ) -> bool:
+    def _compile_filter(
+        self, key: str, value: typing.Any
+    ) -> typing.Callable[[Result], bool]:
         """
-        Check if a result matches all filters, supporting nested lookups and operators.
+        Resolve a filter parameter once into a predicate, supporting nested lookups
+        and operators.
 
         Args:
-            result: The result object to check
-            filters: Dictionary of filter parameters
+            key: The filter key e.g. name, profile__name or tags__contains
+            value: The value to compare against
 
         Returns:
-            True if the result matches all filters, False otherwise
+            A predicate returning True if a result matches the filter
         """
-        for key, value in filters.items():
-            # Check if this is a special lookup with operator
-            if "__" in key:
-                parts = key.split("__")
-                if parts[-1] in self._FILTER_OPERATORS:
-                    field_path_list, operator = parts[:-1], parts[-1]
-                    field_path: str = "__".join(field_path_list)
-                    if not self._check_operator(result, field_path, operator, value):
-                        return False
-                else:
-                    # This is a nested lookup without operator
-                    if not self._check_nested_field(result, key.split("__"), value):
-                        return False
-            else:
-                # Simple field comparison
-                try:
-                    field_value = getattr(result, key, None)
-                    if field_value != value:
-                        return False
-                except (TypeError, ValueError):
-                    return False
+        # Check if this is a special lookup with operator
+        if "__" in key:
+            parts = key.split("__")
+            if parts[-1] in self._FILTER_OPERATORS:
+                field_path, operator = "__".join(parts[:-1]), parts[-1]
+                return lambda result: self._check_operator(
+                    result, field_path, operator, value
+                )
+            # This is a nested lookup without operator
+            return lambda result: self._check_nested_field(result, parts, value)
+
+        # Simple field comparison
+        def match(result: Result) -> bool:
+            try:
+                return getattr(result, key, None) == value
+            except (TypeError, ValueError):
+                return False
 
-        return True
+        return match
 
     def _get_field_value(
         self, obj: typing.Any, field_path: typing.List[str]
@@ -381,7 +532,7 @@ class ResultSet(typing.MutableSet[Result]):
 
         for field in field_path:
             # Handle dictionary access
-            if hasattr(current, "__getitem__") and isinstance(current, dict):
+            if isinstance(current, dict):
                 try:
                     current = current[field]
                     continue
@@ -389,12 +540,10 @@ class ResultSet(typing.MutableSet[Result]):
                     pass
 
             # Handle object attribute access
-            if hasattr(current, field):
-                current = getattr(current, field)
-                continue
-
-            # Nothing found
-            return None
+            current = getattr(current, field, _MISSING)
+            if current is _MISSING:
+                # Nothing found
+                return None
 
         return current
 
@@ -66,6 +66,24 @@ class ExecutionResultEvaluationStrategyBase(ABC):
         """Return a human-readable name for this strategy."""
         pass
 
+    def evaluate_counts(
+        self, successful_tasks: int, total_tasks: int
+    ) -> typing.Optional[bool]:
+        """
+        Evaluate the event from the success/total tally alone.
+
+        Strategies whose decision depends only on how many tasks succeeded can
+        implement this so the evaluator does not have to scan the results again.
+
+        Args:
+            successful_tasks: Number of tasks that succeeded
+            total_tasks: Total number of tasks
+
+        Returns:
+            bool: The evaluation outcome, or None if the full results are required
+        """
+        return None
+
 
 class AllTasksMustSucceedStrategy(ExecutionResultEvaluationStrategyBase):
     """Event succeeds only if ALL tasks succeed."""
@@ -75,6 +93,9 @@ class AllTasksMustSucceedStrategy(ExecutionResultEvaluationStrategyBase):
             return False
         return all(result.success for result in task_results)
 
+    def evaluate_counts(self, successful_tasks: int, total_tasks: int) -> bool:
+        return 0 < total_tasks == successful_tasks
+
     def get_strategy_name(self) -> str:
         return "All Tasks Must Succeed"
 
@@ -87,6 +108,9 @@ class AnyTaskMustSucceedStrategy(ExecutionResultEvaluationStrategyBase):
             return False
         return any(result.success for result in task_results)
 
+    def evaluate_counts(self, successful_tasks: int, total_tasks: int) -> bool:
+        return successful_tasks > 0
+
     def get_strategy_name(self) -> str:
         return "Any Task Must Succeed"
 
@@ -106,11 +130,15 @@ class MajorityTasksMustSucceedStrategy(ExecutionResultEvaluationStrategyBase):
             return False
 
         successful_count = sum(1 for result in task_results if result.success)
-        total_count = len(task_results)
+        return self.evaluate_counts(successful_count, len(task_results))
+
+    def evaluate_counts(self, successful_tasks: int, total_tasks: int) -> bool:
+        if not total_tasks:
+            return False
 
-        if successful_count > total_count / 2:
+        if successful_tasks > total_tasks / 2:
             return True
-        elif successful_count < total_count / 2:
+        elif successful_tasks < total_tasks / 2:
             return False
         else:
             # Exactly 50% - use tie breaker
@@ -135,6 +163,9 @@ class MinimumSuccessThresholdStrategy(ExecutionResultEvaluationStrategyBase):
         successful_count = sum(1 for result in task_results if result.success)
         return successful_count >= self.minimum_successes
 
+    def evaluate_counts(self, successful_tasks: int, total_tasks: int) -> bool:
+        return successful_tasks >= self.minimum_successes
+
     def get_strategy_name(self) -> str:
         return f"At Least {self.minimum_successes} Tasks Must Succeed"
 
@@ -152,7 +183,13 @@ class PercentageSuccessThresholdStrategy(ExecutionResultEvaluationStrategyBase):
             return self.success_percentage == 0
 
         successful_count = sum(1 for result in task_results if result.success)
-        actual_percentage = (successful_count / len(task_results)) * 100
+        return self.evaluate_counts(successful_count, len(task_results))
+
+    def evaluate_counts(self, successful_tasks: int, total_tasks: int) -> bool:
+        if not total_tasks:
+            return self.success_percentage == 0
+
+        actual_percentage = (successful_tasks / total_tasks) * 100
         return actual_percentage >= self.success_percentage
 
     def get_strategy_name(self) -> str:
@@ -166,6 +203,9 @@ class NoFailuresAllowedStrategy(ExecutionResultEvaluationStrategyBase):
         # Empty list is considered success (no failures)
         return all(result.success for result in task_results)
 
+    def evaluate_counts(self, successful_tasks: int, total_tasks: int) -> bool:
+        return successful_tasks == total_tasks
+
     def get_strategy_name(self) -> str:
         return "No Failures Allowed"
 
@@ -263,14 +303,18 @@ class EventEvaluator:
         Returns:
             EventEvaluationResult: Detailed evaluation result
         """
+        total_tasks = len(task_results)
         successful_tasks = sum(1 for result in task_results if result.success)
-        failed_tasks = len(task_results) - successful_tasks
+        failed_tasks = total_tasks - successful_tasks
 
-        success = self.strategy.evaluate(task_results)
+        # Count-based strategies decide from the tally; others need the results
+        success = self.strategy.evaluate_counts(successful_tasks, total_tasks)
+        if success is None:
+            success = self.strategy.evaluate(task_results)
 
         return EventEvaluationResult(
             success=success,
-            total_tasks=len(task_results),
+            total_tasks=total_tasks,
             successful_tasks=successful_tasks,
             failed_tasks=failed_tasks,
             strategy_used=self.strategy.get_strategy_name(),
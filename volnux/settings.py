@@ -7,6 +7,13 @@ MAX_EVENT_BACKOFF_FACTOR = 0.05
 MAX_EVENT_BACKOFF = 100
 
 MAX_BATCH_PROCESSING_WORKERS = 4
+# Number of pipelines shipped to a batch worker per submission
+BATCH_PIPELINE_CHUNK_SIZE = 1
+# Submissions a batch worker process handles before it is replaced
+BATCH_PIPELINE_MAX_TASKS_PER_CHILD = 64
+# Out-of-band pipeline buffers of at least this many bytes reach batch
+# workers through shared memory instead of the worker pipe
+BATCH_PIPELINE_SHARED_MEMORY_THRESHOLD = 1024 * 1024
 
 RESULT_BACKEND_CONFIG = {
     "ENGINE": "volnux.backends.stores.inmemory_store.InMemoryKeyValueStoreBackend",
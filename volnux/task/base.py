@@ -64,7 +64,7 @@ class TaskBase(ObjectIdentityMixin):
 
     @property
     def is_conditional(self) -> bool:
-        return len(self.condition_node.get_descriptors()) > 1
+        return self.condition_node.descriptor_count() > 1
 
     @property
     def is_descriptor_task(self) -> bool:
@@ -111,10 +111,9 @@ class TaskBase(ObjectIdentityMixin):
         is applicable; otherwise, it returns False.
         """
 
-        pointer_to_node = self.get_pointer_to_task()
         return (
             self.condition_node.on_success_pipe == PipeType.PARALLELISM
-            or pointer_to_node == PipeType.PARALLELISM
+            or self.get_pointer_to_task() == PipeType.PARALLELISM
         )
 
     def get_pointer_to_task(self) -> typing.Optional["PipeType"]:
@@ -160,9 +159,7 @@ class TaskBase(ObjectIdentityMixin):
 
     def get_root(self) -> TaskType:
         if self.parent_node is None:
-            node = self
-            node = typing.cast(TaskType, node)
-            return node
+            return self  # type: ignore
         return self.parent_node.get_root()
 
     def get_dot_node_data(self) -> str:
@@ -199,8 +196,7 @@ class TaskBase(ObjectIdentityMixin):
         self,
     ) -> typing.Deque[TaskType]:
         parallel_tasks: typing.Deque[TaskType] = deque()
-        task = self
-        task = typing.cast(TaskType, task)
+        task: typing.Optional[TaskType] = self  # type: ignore
         while task and task.condition_node.on_success_pipe == PipeType.PARALLELISM:
             parallel_tasks.append(task)
             task = task.condition_node.on_success_event
@@ -6,6 +6,11 @@ from .base import TaskBase
 
 
 class PipelineTaskGrouping(TaskBase):
+    # Resolved on first render; volnux.translator.dot imports this module
+    _draw_subgraph: typing.ClassVar[
+        typing.Optional[typing.Callable[["PipelineTaskGrouping"], str]]
+    ] = None
+
     def __init__(self, chains: typing.List[TaskType]) -> None:
         super().__init__()
 
@@ -21,6 +26,10 @@ class PipelineTaskGrouping(TaskBase):
         return "TaskGrouping"
 
     def get_dot_node_data(self) -> str:
-        from volnux.translator.dot import draw_subgraph_from_task_state
+        draw_subgraph = PipelineTaskGrouping._draw_subgraph
+        if draw_subgraph is None:
+            from volnux.translator.dot import draw_subgraph_from_task_state
 
-        return draw_subgraph_from_task_state(self)
+            draw_subgraph = draw_subgraph_from_task_state
+            PipelineTaskGrouping._draw_subgraph = staticmethod(draw_subgraph)
+        return draw_subgraph(self)
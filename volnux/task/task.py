@@ -6,8 +6,30 @@ from volnux.exceptions import EventDoesNotExist
 
 from .base import TaskBase
 
+# DOT node templates, formatted with the node id and label
+_SINK_NODE_TMPL = (
+    '\t"{id}" [label="{label}", shape=box, style="filled,rounded", fillcolor=yellow]\n'
+).format
+_CONDITIONAL_NODE_TMPL = (
+    '\t"{id}" [label="{label}", shape=diamond, style="filled,rounded", fillcolor=yellow]\n'
+).format
+_PARALLEL_NODE_TMPL = (
+    '\t"{id}" [label="{label}", shape=record, style="filled,rounded", fillcolor=lightblue]\n'
+).format
+_DEFAULT_NODE_TMPL = (
+    '\t"{id}" [label="{label}", shape=circle, style="filled,rounded", fillcolor=yellow]\n'
+).format
+
 
 class PipelineTask(TaskBase):
+    # Lowercased event names of the registered classes the index was built from
+    _event_name_index: typing.ClassVar[
+        typing.Tuple[
+            typing.Optional[typing.FrozenSet[typing.Type[EventBase]]],
+            typing.Dict[str, typing.Type[EventBase]],
+        ]
+    ] = (None, {})
+
     def __init__(self, event: typing.Union[typing.Type[EventBase], str]) -> None:
         super().__init__()
 
@@ -33,11 +55,25 @@ class PipelineTask(TaskBase):
         if not isinstance(event_name, str):
             return event_name
 
-        for event in cls.get_event_klasses():
-            klass_name = event.__name__.lower()
-            if klass_name == event_name.lower():
-                return event
-        raise EventDoesNotExist(f"'{event_name}' was not found.")
+        event = cls.get_event_name_index().get(event_name.lower())
+        if event is None:
+            raise EventDoesNotExist(f"'{event_name}' was not found.")
+        return event
+
+    @classmethod
+    def get_event_name_index(cls) -> typing.Dict[str, typing.Type[EventBase]]:
+        """
+        Map lowercased event names to event classes. The index is rebuilt
+        whenever the set of registered event classes changes.
+        """
+        registered = EventBase.get_all_event_classes()
+        indexed, index = PipelineTask._event_name_index
+        if registered is not indexed:
+            index = {}
+            for event in cls.get_event_klasses():
+                index.setdefault(event.__name__.lower(), event)
+            PipelineTask._event_name_index = (registered, index)
+        return index
 
     @staticmethod
     def get_event_klasses() -> (
@@ -47,13 +83,13 @@ class PipelineTask(TaskBase):
 
     def get_dot_node_data(self) -> str:
         if self.is_sink:
-            return f'\t"{self.id}" [label="{self.get_event_name()}", shape=box, style="filled,rounded", fillcolor=yellow]\n'
+            template = _SINK_NODE_TMPL
         elif self.is_conditional:
-            return f'\t"{self.id}" [label="{self.get_event_name()}", shape=diamond, style="filled,rounded", fillcolor=yellow]\n'
+            template = _CONDITIONAL_NODE_TMPL
         elif self.is_parallel_execution_node:
             nodes = self.get_parallel_nodes()
-            node_id = nodes[0].get_id()
-            node_label = "{" + "|".join([n.get_event_name() for n in nodes]) + "}"
-            return f'\t"{node_id}" [label="{node_label}", shape=record, style="filled,rounded", fillcolor=lightblue]\n'
-
-        return f'\t"{self.id}" [label="{self.get_event_name()}", shape=circle, style="filled,rounded", fillcolor=yellow]\n'
+            node_label = "{%s}" % "|".join([n.get_event_name() for n in nodes])
+            return _PARALLEL_NODE_TMPL(id=nodes[0].get_id(), label=node_label)
+        else:
+            template = _DEFAULT_NODE_TMPL
+        return template(id=self.id, label=self.get_event_name())
@@ -6,7 +6,7 @@ import time
 import typing
 import uuid
 import warnings
-from io import BytesIO
+from functools import lru_cache
 
 try:
     import resource
@@ -141,6 +141,18 @@ def build_event_arguments_from_pipeline(
     ), get_function_call_args(event_klass.process, pipeline)
 
 
+@lru_cache(maxsize=1024)
+def _get_call_parameters(
+    func: typing.Callable[[typing.Any], typing.Any],
+) -> typing.Tuple[typing.Tuple[str, typing.Any], ...]:
+    """Return the (name, default) pairs of a callable's parameters, excluding 'self'."""
+    return tuple(
+        (param.name, param.default)
+        for param in signature(func).parameters.values()
+        if param.name != "self"
+    )
+
+
 def get_function_call_args(
     func: typing.Callable[[typing.Any], typing.Any],
     params: typing.Union[typing.Dict[str, typing.Any], "Pipeline", object],
@@ -159,18 +171,23 @@ def get_function_call_args(
     """
     params_dict = {}
     try:
-        sig = signature(func)
-        for param in sig.parameters.values():
-            if param.name != "self":
-                value = (
-                    params.get(param.name, param.default)
-                    if isinstance(params, dict)
-                    else getattr(params, param.name, param.default)
-                )
-                if value is not EMPTY and value is not Parameter.empty:
-                    params_dict[param.name] = value
-                else:
-                    params_dict[param.name] = None
+        try:
+            parameters = _get_call_parameters(func)
+        except TypeError:
+            # unhashable callables cannot be cached
+            parameters = _get_call_parameters.__wrapped__(func)
+
+        is_dict = isinstance(params, dict)
+        for name, default in parameters:
+            value = (
+                params.get(name, default)  # type: ignore
+                if is_dict
+                else getattr(params, name, default)
+            )
+            if value is not EMPTY and value is not Parameter.empty:
+                params_dict[name] = value
+            else:
+                params_dict[name] = None
     except (ValueError, KeyError) as e:
         logger.warning(f"Parsing {func} for call parameters failed {str(e)}")
 
@@ -284,26 +301,22 @@ def send_data_over_socket(
                    is non-positive.
     """
     now = time.time()
-    # data = ForkingPickler.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
-    # compressed_data = zlib.compress(data)
     data_size = len(data)
-    sock.sendall(data_size.to_bytes(8, "big"))
-
-    stream_fd = BytesIO(data)
-    sent = 0
+    header = data_size.to_bytes(8, "big")
+    view = memoryview(data)
 
     if chunk_size is None:
-        chunk = stream_fd.getvalue()
-        sent = data_size
+        chunk_size = data_size
+    chunk_size = abs(chunk_size) or data_size
+
+    # Coalesce the length header with the first chunk so a small request goes
+    # out in a single segment instead of stalling on Nagle/delayed-ACK
+    sent = min(chunk_size, data_size)
+    sock.sendall(header + view[:sent])
+    while sent < data_size:
+        chunk = view[sent : sent + chunk_size]
         sock.sendall(chunk)
-    else:
-        chunk_size = abs(chunk_size)
-        while sent < data_size:
-            chunk = stream_fd.read(chunk_size)
-            if not chunk:
-                break
-            sock.sendall(chunk)
-            sent += len(chunk)
+        sent += len(chunk)
 
     logger.debug(
         f"Successfully sent {data_size} bytes to {sock.getpeername()[0]} at {now} "
@@ -331,14 +344,26 @@ def receive_data_from_socket(sock: socket.socket, chunk_size: int) -> bytes:
         ValueError: If the received data is incomplete or the chunk size is
                     non-positive.
     """
-    result_size = int.from_bytes(sock.recv(8), "big")
-    result_data = b""
-    while len(result_data) < result_size:
-        chunk = sock.recv(min(chunk_size, result_size - len(result_data)))
-        if not chunk:
+    header = bytearray(8)
+    received = 0
+    while received < 8:
+        count = sock.recv_into(memoryview(header)[received:], 8 - received)
+        if not count:
+            return b""
+        received += count
+
+    result_size = int.from_bytes(header, "big")
+    result_data = bytearray(result_size)
+    view = memoryview(result_data)
+    received = 0
+    while received < result_size:
+        count = sock.recv_into(
+            view[received:], min(chunk_size, result_size - received)
+        )
+        if not count:
             break
-        result_data += chunk
-    return result_data
+        received += count
+    return bytes(view[:received])
 
 
 def create_server_ssl_context(